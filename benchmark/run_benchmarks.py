@@ -0,0 +1,213 @@
+"""Benchmark suite for the geometry classes and the vector_math module.
+
+For each benchmark the throughput (points or calls per second) and the peak number
+of bytes allocated during a single run are reported. The results can be saved
+as a baseline and later runs can be compared against it.
+
+Run from the repository root:
+
+    python benchmark/run_benchmarks.py --save baseline.json
+    python benchmark/run_benchmarks.py --compare baseline.json
+"""
+
+import sys
+import os
+import argparse
+import json
+import timeit
+import tracemalloc
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+import numpy as np
+import random_geometry_points.vector_math as vector_math
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.circle3d import Circle3D
+from random_geometry_points.cylinder import Cylinder
+from random_geometry_points.cone import Cone
+from random_geometry_points.ellipse2d import Ellipse2D
+from random_geometry_points.ellipsoid import Ellipsoid
+from random_geometry_points.sphere import Sphere
+from random_geometry_points.plane import Plane
+
+SIZES = (1000, 100000, 1000000)
+QUICK_SIZES = (1000, 10000)
+VECTOR_CALLS = 10000
+ARRAY_ROWS = 100000
+
+def _get_geometries():
+    """Create the benchmarked geometry objects.
+
+    Returns:
+        list (tuple (str, Geometry)): The names and the geometry objects
+    """
+    return [
+        ("Circle2D", Circle2D(1.0, -2.0, 3.0, seed=42)),
+        ("Circle3D", Circle3D((1.0, -2.0, 3.0), (1.0, 2.0, 3.0), 4.0, seed=42)),
+        ("Sphere", Sphere(1.0, -2.0, 3.0, 4.0, seed=42)),
+        ("Plane", Plane.from_normal_form((1.0, 2.0, 3.0), (1.0, -2.0, 3.0), 4.0, seed=42)),
+        ("Cylinder", Cylinder((1.0, -2.0, 3.0), (1.0, 2.0, 3.0), 4.0, 5.0, caps=True, seed=42)),
+        ("Cone", Cone((1.0, -2.0, 3.0), (1.0, 2.0, 3.0), 4.0, 5.0, cap=True, seed=42)),
+        ("Ellipse2D", Ellipse2D(1.0, -2.0, 3.0, 1.0, seed=42)),
+        ("Ellipsoid", Ellipsoid(1.0, -2.0, 3.0, 1.0, 2.0, 5.0, seed=42))
+    ]
+
+def _get_geometry_benchmarks(sizes):
+    """Create the benchmarks for the point creation methods of the geometries.
+
+    Args:
+        sizes (tuple (int, ...)): The numbers of points to be created
+
+    Returns:
+        list (tuple (str, callable, int)): The benchmark names, the benchmarked calls
+          and the number of points created by each call
+    """
+    benchmarks = []
+    for name, geometry in _get_geometries():
+        for size in sizes:
+            benchmarks += [
+                ("{}.list[{}]".format(name, size),
+                 lambda g=geometry, n=size: g.create_random_points(n), size),
+                ("{}.generator[{}]".format(name, size),
+                 lambda g=geometry, n=size: sum(1 for _ in g.create_random_point_generator(n)),
+                 size),
+                ("{}.array[{}]".format(name, size),
+                 lambda g=geometry, n=size: g.create_random_points_array(n), size)
+            ]
+    return benchmarks
+
+def _get_vector_math_benchmarks():
+    """Create the benchmarks for the tuple and array functions of the vector_math module.
+
+    Each tuple function is also benchmarked as its unchecked kernel (".kernel"),
+    so the cost of the parameter validation shows up in the throughput difference.
+
+    Returns:
+        list (tuple (str, callable, int)): The benchmark names, the benchmarked calls
+          and the number of vectors processed by each call
+    """
+    vec1 = (1.5, -2.0, 3.25)
+    vec2 = (0.0, 0.6, 0.8)
+    quat = (0.5, 0.5, -0.5, 0.5)
+    tuple_calls = [
+        ("calc_magnitude", lambda: vector_math.calc_magnitude(vec1)),
+        ("calc_dot_product", lambda: vector_math.calc_dot_product(vec1, vec2)),
+        ("calc_cross_product", lambda: vector_math.calc_cross_product(vec1, vec2)),
+        ("normalize_vector", lambda: vector_math.normalize_vector(vec1)),
+        ("calc_perpendicular_vector", lambda: vector_math.calc_perpendicular_vector(vec1)),
+        ("get_as_rotation_quaternion", lambda: vector_math.get_as_rotation_quaternion(vec2, 0.7)),
+        ("rotate_vector", lambda: vector_math.rotate_vector(vec1, vec2, 0.7)),
+        ("scale_vector", lambda: vector_math.scale_vector(vec1, 2.5)),
+        ("sum_vectors", lambda: vector_math.sum_vectors(vec1, vec2)),
+        ("multiply_quaternions", lambda: vector_math.multiply_quaternions(quat, quat))
+    ]
+    kernel_calls = [
+        ("calc_magnitude", lambda: vector_math._magnitude(vec1)),
+        ("calc_dot_product", lambda: vector_math._dot(vec1, vec2)),
+        ("calc_cross_product", lambda: vector_math._cross(vec1, vec2)),
+        ("normalize_vector", lambda: vector_math._normalize(vec1)),
+        ("calc_perpendicular_vector", lambda: vector_math._perpendicular(vec1)),
+        ("get_as_rotation_quaternion", lambda: vector_math._rotation_quaternion(vec2, 0.7)),
+        ("rotate_vector", lambda: vector_math._rotate(vec1, vec2, 0.7)),
+        ("scale_vector", lambda: vector_math._scale(vec1, 2.5)),
+        ("sum_vectors", lambda: vector_math._sum(vec1, vec2)),
+        ("multiply_quaternions", lambda: vector_math._multiply_quaternions(quat, quat))
+    ]
+    rows1 = np.random.default_rng(1).uniform(-1.0, 1.0, (ARRAY_ROWS, 3))
+    rows2 = np.random.default_rng(2).uniform(1.0, 2.0, (ARRAY_ROWS, 3))
+    scales = np.random.default_rng(3).uniform(-1.0, 1.0, ARRAY_ROWS)
+    array_calls = [
+        ("calc_magnitude_array", lambda: vector_math.calc_magnitude_array(rows1)),
+        ("calc_dot_product_array", lambda: vector_math.calc_dot_product_array(rows1, rows2)),
+        ("calc_cross_product_array", lambda: vector_math.calc_cross_product_array(rows1, rows2)),
+        ("normalize_vector_array", lambda: vector_math.normalize_vector_array(rows2)),
+        ("scale_vector_array", lambda: vector_math.scale_vector_array(rows1, scales)),
+        ("sum_vectors_array", lambda: vector_math.sum_vectors_array(rows1, rows2)),
+        ("rotate_vector_array", lambda: vector_math.rotate_vector_array(rows1, rows2, scales))
+    ]
+    benchmarks = []
+    for name, call in tuple_calls:
+        benchmarks.append(("vector_math.{}".format(name),
+                           lambda c=call: [c() for _ in range(VECTOR_CALLS)], VECTOR_CALLS))
+    for name, call in kernel_calls:
+        benchmarks.append(("vector_math.{}.kernel".format(name),
+                           lambda c=call: [c() for _ in range(VECTOR_CALLS)], VECTOR_CALLS))
+    for name, call in array_calls:
+        benchmarks.append(("vector_math.{}[{}]".format(name, ARRAY_ROWS), call, ARRAY_ROWS))
+    return benchmarks
+
+def _run_benchmark(call, num_items, repeat):
+    """Measure the throughput and the peak allocation of a benchmarked call.
+
+    Args:
+        call (callable): The benchmarked call
+        num_items (int): The number of points or vectors processed by a single call
+        repeat (int): The number of timed runs. The fastest run is reported.
+
+    Returns:
+        dict: The items per second ("rate") and the peak allocated bytes ("peak_bytes")
+    """
+    tracemalloc.start()
+    call()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    best_time = min(timeit.repeat(call, number=1, repeat=repeat))
+    return {"rate": num_items / best_time, "peak_bytes": peak_bytes}
+
+def _print_result(name, result, baseline_result=None):
+    """Print the result of a single benchmark, optionally compared to its baseline.
+
+    Args:
+        name (str): The name of the benchmark
+        result (dict): The result of the benchmark
+        baseline_result (dict): The result of the benchmark in the baseline
+    """
+    line = "{:<45} {:>14.0f} /s {:>14d} B".format(name, result["rate"], result["peak_bytes"])
+    if baseline_result is not None:
+        line += "  {:>+7.1%}".format(result["rate"] / baseline_result["rate"] - 1.0)
+    print(line)
+
+def main():
+    """Run the benchmarks, optionally saving or comparing a baseline.
+
+    Returns:
+        int: The exit code. 1 if a benchmark is slower than its baseline
+          by more than the allowed regression, else 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--quick", action="store_true", help="only run small point counts")
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs")
+    parser.add_argument("--save", metavar="FILE", help="save the results as baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare the results to a baseline")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="allowed relative throughput loss compared to the baseline")
+    args = parser.parse_args()
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+    benchmarks = _get_geometry_benchmarks(QUICK_SIZES if args.quick else SIZES)
+    benchmarks += _get_vector_math_benchmarks()
+    results = {}
+    regressions = []
+    print("{:<45} {:>17} {:>16}".format("benchmark", "throughput", "peak allocation"))
+    for name, call, num_items in benchmarks:
+        if args.filter not in name:
+            continue
+        results[name] = _run_benchmark(call, num_items, args.repeat)
+        _print_result(name, results[name], baseline.get(name))
+        if name in baseline and \
+          results[name]["rate"] < (1.0 - args.max_regression) * baseline[name]["rate"]:
+            regressions.append(name)
+    if args.save:
+        with open(args.save, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+    if regressions:
+        print("Regressions: " + ", ".join(regressions))
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Alias tables for drawing random indices with given weights.
+
+An alias table is built once in O(n) and then draws each index in O(1),
+independent of the number of weights. It consists of one probability and one alias
+index per weight: index k is drawn uniformly and kept with its probability,
+otherwise its alias is used (Walker's alias method).
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/alias_table_test.py
+"""
+
+import numpy as np
+from random_geometry_points.validation import check_weight_array, check_number_of_random_points
+
+class AliasTable:
+    """Class to draw random indices with probabilities proportional to given weights.
+    """
+
+    def __init__(self, weights):
+        """AliasTable constructor
+
+        Args:
+            weights (numpy.ndarray): The non-negative weights as array of shape (n,)
+        """
+        checked_weights = check_weight_array(weights)
+        self.probabilities, self.aliases = _build_alias_table(checked_weights)
+
+    def __len__(self):
+        """Get the number of weights.
+
+        Returns:
+            int: The number of weights
+        """
+        return len(self.probabilities)
+
+    def draw(self, rng, num_samples):
+        """Draw random indices.
+
+        Args:
+            rng (numpy.random.Generator): The random generator
+            num_samples (int): The number of indices to be drawn
+
+        Returns:
+            numpy.ndarray: The random indices as int64 array of shape (num_samples,)
+        """
+        check_number_of_random_points(num_samples)
+        indices = rng.integers(0, len(self.probabilities), num_samples)
+        use_alias = rng.random(num_samples) >= self.probabilities[indices]
+        indices[use_alias] = self.aliases[indices[use_alias]]
+        return indices
+
+def _build_alias_table(weights):
+    """Build the probability and alias arrays of an alias table.
+
+    Vose's algorithm pairs each underfull column with an overfull one. Here all
+    underfull columns are paired in one vectorized step: their deficits are laid out
+    one after another and each of them is assigned to the overfull column whose excess
+    covers the start of its deficit. An overfull column never gives away more than
+    its excess plus one deficit, so it cannot become negative. Overfull columns that
+    became underfull are paired in the next step.
+
+    Args:
+        weights (numpy.ndarray): The checked weights as array of shape (n,)
+
+    Returns:
+        tuple (numpy.ndarray, numpy.ndarray): The probabilities and the alias indices
+    """
+    num_weights = len(weights)
+    scaled_weights = weights * (num_weights / np.sum(weights))
+    probabilities = np.ones(num_weights)
+    aliases = np.arange(num_weights)
+    small = np.flatnonzero(scaled_weights < 1.0)
+    large = np.flatnonzero(scaled_weights >= 1.0)
+    while len(small) > 0 and len(large) > 0:
+        deficits = 1.0 - scaled_weights[small]
+        deficit_starts = np.cumsum(deficits) - deficits
+        excess_ends = np.cumsum(scaled_weights[large] - 1.0)
+        donors = np.minimum(np.searchsorted(excess_ends, deficit_starts, side="right"),
+                            len(large) - 1)
+        probabilities[small] = scaled_weights[small]
+        aliases[small] = large[donors]
+        scaled_weights[large] -= np.bincount(donors, deficits, len(large))
+        still_large = scaled_weights[large] >= 1.0
+        small = large[~still_large]
+        large = large[still_large]
+    # the remaining columns are full up to rounding errors
+    probabilities[small] = 1.0
+    return (probabilities, aliases)
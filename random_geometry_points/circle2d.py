@@ -8,7 +8,7 @@ Examples:
 """
 
 import math
-import random
+import numpy as np
 from random_geometry_points.geometry import Geometry
 from random_geometry_points.validation import check_geometry_parameter, check_radius
 
@@ -23,66 +23,68 @@ class Circle2D(Geometry):
 
     In the above equation "x" and "y" represent the coordinates
     of an arbitrary point on the 2D circle.
+
+    Each created point is represented by its x and y coordinate, in this order.
     """
 
-    def __init__(self, center_x, center_y, radius):
+    dimension = 2
+
+    def __init__(self, center_x, center_y, radius, seed=None):
         """Circle2D constructor
 
         Args:
             center_x (float): The x coordinate of the circle center point
             center_y (float): The y coordinate of the circle center point
             radius (float): The radius of the circle
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
         """
+        super().__init__(seed)
         self.center_x = check_geometry_parameter(center_x)
         self.center_y = check_geometry_parameter(center_y)
         self.radius = check_radius(radius)
 
-    def create_random_points(self, num_points):
-        """Create a list of num_points random points that lie on the 2D circle.
-
-        Args:
-            num_points (int): The number of random points to be created.
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
 
         Returns:
-            list (tuple (float, float)): A list of randomly generated points.
+            float: The perimeter of the 2D circle
+        """
+        return 2.0 * math.pi * self.radius
 
-            The returned list contains num_points tuples.
+    def offset_along_normals(self, points, offsets):
+        """Shift the points along the circle normals in place by scaling their distance
+        from the center.
 
-            Each tuple represents a point lying on the 2D circle.
-            The first tuple-value is the x coordinate.
-            The second tuple-value is the y coordinate.
+        Args:
+            points (numpy.ndarray): A float64 array of shape (n, 2) of points on the circle
+            offsets (numpy.ndarray): The offsets as array of shape (n,)
         """
-        super().create_random_points(num_points)
-        angles = [random.uniform(0.0, 2.0 * math.pi) for n in range(0, num_points)]
-        return [self._create_circle_point(angle) for angle in angles]
+        center = (self.center_x, self.center_y)
+        points -= center
+        points *= (1.0 + offsets / self.radius)[:, np.newaxis]
+        points += center
 
-    def create_random_point_generator(self, num_points):
-        """Create a generator to generate num_points random points that lie on the 2D circle.
+    def _draw_random_numbers(self, num_points):
+        """Draw the random angles (radiant) of num_points points on the 2D circle.
 
         Args:
-            num_points (int): The number of random points to be created. Maximum value is 99999.
-
-        Yields:
-            tuple (float, float): The next random point.
+            num_points (int): The number of points
 
-            Each tuple represents a point lying on the 2D circle.
-            The first tuple-value is the x coordinate.
-            The second tuple-value is the y coordinate.
+        Returns:
+            numpy.ndarray: The random angles
         """
-        _ = [_ for _ in super().create_random_point_generator(num_points)]
-        angles = [random.uniform(0.0, 2.0 * math.pi) for n in range(0, num_points)]
-        return (self._create_circle_point(angle) for angle in angles)
+        return self.rng.uniform(0.0, 2.0 * math.pi, num_points)
 
-    def _create_circle_point(self, angle):
-        """Create a 2D cartesian point using the circle parameters and the given angle.
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the 2D circle.
 
         Args:
-            angle (float): The angle (radiant) for which the cartesian coordinates
-              shall be calculated
-
-        Returns:
-            tuple (float, float): The cartesian coordinates corresponding to the input angle
+            random_numbers (numpy.ndarray): The random angles (radiant) of the points
+            points (numpy.ndarray): A float64 array of shape (n, 2) that is overwritten
         """
-        x_from_angle = lambda angle: self.radius * math.cos(angle) + self.center_x
-        y_from_angle = lambda angle: self.radius * math.sin(angle) + self.center_y
-        return (x_from_angle(angle), y_from_angle(angle))
+        np.cos(random_numbers, out=points[:, 0])
+        np.sin(random_numbers, out=points[:, 1])
+        points *= self.radius
+        points += (self.center_x, self.center_y)
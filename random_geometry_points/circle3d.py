@@ -0,0 +1,79 @@
+"""Random points on a 3D circle.
+
+This module provides methods to generate an arbitrary number of points lying on a circle
+with an arbitrary orientation in 3D space.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/circle3d_test.py
+"""
+
+import math
+import numpy as np
+from random_geometry_points.geometry import Geometry
+from random_geometry_points.validation import check_vector, check_direction_vector, check_radius
+from random_geometry_points.vector_math import _normalize, _orthonormal_basis
+
+class Circle3D(Geometry):
+    """Class to generate random points lying on a circle in 3D space.
+
+    The circle is defined by its center point, the normal vector of the plane
+    the circle lies in and its radius.
+
+    Each created point is represented by its x, y and z coordinate, in this order.
+
+    The points are created from an orthonormal basis (u, v) of the circle plane
+    which is calculated once, so that each point is
+
+        center + radius * (cos(angle) * u + sin(angle) * v)
+    """
+
+    def __init__(self, center, normal_vec, radius, seed=None):
+        """Circle3D constructor
+
+        Args:
+            center (tuple (float, float, float)): The center point of the circle
+            normal_vec (tuple (float, float, float)): The normal vector of the circle plane
+            radius (float): The radius of the circle
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
+        """
+        super().__init__(seed)
+        self.center = check_vector(center)
+        self.normal_vec = _normalize(check_direction_vector(normal_vec))
+        self.radius = check_radius(radius)
+        self.basis = _orthonormal_basis(self.normal_vec)
+
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
+
+        Returns:
+            float: The perimeter of the circle
+        """
+        return 2.0 * math.pi * self.radius
+
+    def _draw_random_numbers(self, num_points):
+        """Draw the random angles (radiant) of num_points points on the circle.
+
+        Args:
+            num_points (int): The number of points
+
+        Returns:
+            numpy.ndarray: The random angles
+        """
+        return self.rng.uniform(0.0, 2.0 * math.pi, num_points)
+
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the circle.
+
+        Args:
+            random_numbers (numpy.ndarray): The random angles (radiant) of the points
+            points (numpy.ndarray): A float64 array of shape (n, 3) that is overwritten
+        """
+        circle_coords = np.empty((len(random_numbers), 2))
+        np.cos(random_numbers, out=circle_coords[:, 0])
+        np.sin(random_numbers, out=circle_coords[:, 1])
+        circle_coords *= self.radius
+        np.matmul(circle_coords, self.basis, out=points)
+        points += self.center
@@ -0,0 +1,109 @@
+"""Random points on a cone.
+
+This module provides methods to generate an arbitrary number of points lying on the surface
+of a right circular cone.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/cone_test.py
+"""
+
+import math
+import numpy as np
+from random_geometry_points.geometry import Geometry
+from random_geometry_points.validation import check_vector, check_direction_vector, \
+  check_radius, check_height, check_flag
+from random_geometry_points.vector_math import _normalize, _orthonormal_basis
+
+LATERAL = 0
+BASE_CAP = 1
+
+class Cone(Geometry):
+    """Class to generate random points lying on the surface of a right circular cone.
+
+    The cone is defined by the center point of its base, the direction of its axis,
+    the radius of its base and its height. The apex of the cone is
+
+        base_center + height * axis_vec
+
+    Each created point is represented by its x, y and z coordinate, in this order.
+
+    The random points are uniformly distributed over the lateral surface and,
+    if cap is True, over the base. Each point is assigned to a surface
+    with a probability proportional to the area of that surface.
+    """
+
+    def __init__(self, base_center, axis_vec, radius, height, cap=False, seed=None):
+        """Cone constructor
+
+        Args:
+            base_center (tuple (float, float, float)): The center point of the base
+            axis_vec (tuple (float, float, float)): The direction from the base to the apex
+            radius (float): The radius of the base
+            height (float): The height of the cone
+            cap (bool): Whether the points are also created on the base
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
+        """
+        super().__init__(seed)
+        self.base_center = check_vector(base_center)
+        self.axis_vec = _normalize(check_direction_vector(axis_vec))
+        self.radius = check_radius(radius)
+        self.height = check_height(height)
+        self.cap = check_flag(cap)
+        self.basis = _orthonormal_basis(self.axis_vec)
+        lateral_area = math.pi * self.radius * math.hypot(self.radius, self.height)
+        cap_area = math.pi * self.radius**2 if self.cap else 0.0
+        self.area = lateral_area + cap_area
+        self.surface_probabilities = (lateral_area / self.area, cap_area / self.area)
+
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
+
+        Returns:
+            float: The area of the lateral surface and, if enabled, of the base
+        """
+        return self.area
+
+    def _draw_random_numbers(self, num_points):
+        """Draw the random surfaces, angles and surface parameters of num_points points.
+
+        The surface parameter is uniform in [0, 1]. Its square root is the relative distance
+        of a point from the axis, which yields points that are uniformly distributed by area
+        on the lateral surface as well as on the base.
+
+        Args:
+            num_points (int): The number of points
+
+        Returns:
+            tuple (numpy.ndarray, numpy.ndarray, numpy.ndarray): The random surfaces
+              (None without cap), angles (radiant) and surface parameters
+        """
+        surfaces = None
+        if self.cap:
+            surfaces = self.rng.choice(2, num_points, p=self.surface_probabilities)
+        angles = self.rng.uniform(0.0, 2.0 * math.pi, num_points)
+        params = self.rng.uniform(0.0, 1.0, num_points)
+        return (surfaces, angles, params)
+
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the cone.
+
+        Args:
+            random_numbers (tuple (numpy.ndarray, numpy.ndarray, numpy.ndarray)):
+              The random numbers drawn by _draw_random_numbers
+            points (numpy.ndarray): A float64 array of shape (n, 3) that is overwritten
+        """
+        (surfaces, angles, params) = random_numbers
+        relative_distances = np.sqrt(params)
+        heights = self.height * (1.0 - relative_distances)
+        if surfaces is not None:
+            heights[surfaces == BASE_CAP] = 0.0
+        disc_coords = np.empty((len(angles), 2))
+        np.cos(angles, out=disc_coords[:, 0])
+        np.sin(angles, out=disc_coords[:, 1])
+        disc_coords *= self.radius * relative_distances[:, np.newaxis]
+        np.matmul(disc_coords, self.basis, out=points)
+        points += heights[:, np.newaxis] * self.axis_vec
+        points += self.base_center
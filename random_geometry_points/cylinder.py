@@ -0,0 +1,115 @@
+"""Random points on a cylinder.
+
+This module provides methods to generate an arbitrary number of points lying on the surface
+of a circular cylinder.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/cylinder_test.py
+"""
+
+import math
+import numpy as np
+from random_geometry_points.geometry import Geometry
+from random_geometry_points.validation import check_vector, check_direction_vector, \
+  check_radius, check_height, check_flag
+from random_geometry_points.vector_math import _normalize, _orthonormal_basis
+
+LATERAL = 0
+BOTTOM_CAP = 1
+TOP_CAP = 2
+
+class Cylinder(Geometry):
+    """Class to generate random points lying on the surface of a circular cylinder.
+
+    The cylinder is defined by the center point of its bottom cap, the direction
+    of its axis, its radius and its height. The center point of the top cap is
+
+        base_center + height * axis_vec
+
+    Each created point is represented by its x, y and z coordinate, in this order.
+
+    The random points are uniformly distributed over the lateral surface and,
+    if caps is True, over both caps. Each point is assigned to a surface
+    with a probability proportional to the area of that surface.
+    """
+
+    def __init__(self, base_center, axis_vec, radius, height, caps=False, seed=None):
+        """Cylinder constructor
+
+        Args:
+            base_center (tuple (float, float, float)): The center point of the bottom cap
+            axis_vec (tuple (float, float, float)): The direction of the cylinder axis
+            radius (float): The radius of the cylinder
+            height (float): The height of the cylinder
+            caps (bool): Whether the points are also created on both caps
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
+        """
+        super().__init__(seed)
+        self.base_center = check_vector(base_center)
+        self.axis_vec = _normalize(check_direction_vector(axis_vec))
+        self.radius = check_radius(radius)
+        self.height = check_height(height)
+        self.caps = check_flag(caps)
+        self.basis = _orthonormal_basis(self.axis_vec)
+        lateral_area = 2.0 * math.pi * self.radius * self.height
+        cap_area = math.pi * self.radius**2 if self.caps else 0.0
+        self.area = lateral_area + 2.0 * cap_area
+        self.surface_probabilities = (lateral_area / self.area,
+                                      cap_area / self.area, cap_area / self.area)
+
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
+
+        Returns:
+            float: The area of the lateral surface and, if enabled, of the caps
+        """
+        return self.area
+
+    def _draw_random_numbers(self, num_points):
+        """Draw the random surfaces, angles and surface parameters of num_points points.
+
+        The surface parameter is uniform in [0, 1]. It is the relative height of a point
+        on the lateral surface and the squared relative distance from the center of a point
+        on a cap, which yields points that are uniformly distributed by area.
+
+        Args:
+            num_points (int): The number of points
+
+        Returns:
+            tuple (numpy.ndarray, numpy.ndarray, numpy.ndarray): The random surfaces
+              (None without caps), angles (radiant) and surface parameters
+        """
+        surfaces = None
+        if self.caps:
+            surfaces = self.rng.choice(3, num_points, p=self.surface_probabilities)
+        angles = self.rng.uniform(0.0, 2.0 * math.pi, num_points)
+        params = self.rng.uniform(0.0, 1.0, num_points)
+        return (surfaces, angles, params)
+
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the cylinder.
+
+        Args:
+            random_numbers (tuple (numpy.ndarray, numpy.ndarray, numpy.ndarray)):
+              The random numbers drawn by _draw_random_numbers
+            points (numpy.ndarray): A float64 array of shape (n, 3) that is overwritten
+        """
+        (surfaces, angles, params) = random_numbers
+        if surfaces is None:
+            distances = np.full(len(angles), self.radius)
+            heights = self.height * params
+        else:
+            on_caps = surfaces != LATERAL
+            distances = np.where(on_caps, self.radius * np.sqrt(params), self.radius)
+            heights = np.where(on_caps, np.where(surfaces == TOP_CAP, self.height, 0.0),
+                               self.height * params)
+        disc_coords = np.empty((len(angles), 2))
+        np.cos(angles, out=disc_coords[:, 0])
+        np.sin(angles, out=disc_coords[:, 1])
+        disc_coords *= distances[:, np.newaxis]
+        np.matmul(disc_coords, self.basis, out=points)
+        points += heights[:, np.newaxis] * self.axis_vec
+        points += self.base_center
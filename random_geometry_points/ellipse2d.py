@@ -0,0 +1,111 @@
+"""Random points on a 2D ellipse.
+
+This module provides methods to generate an arbitrary number of points lying on a 2D ellipse.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/ellipse2d_test.py
+"""
+
+import math
+import numpy as np
+from random_geometry_points.geometry import Geometry
+from random_geometry_points.validation import check_geometry_parameter, check_radius
+from random_geometry_points.rejection import draw_with_rejection
+
+NUM_PERIMETER_NODES = 1024
+
+class Ellipse2D(Geometry):
+    """Class to generate random points lying on an axis-aligned 2D ellipse.
+
+    The 2D ellipse is represented by the following equation:
+
+        1 = ((x - center_x) / semi_axis_x)**2 + ((y - center_y) / semi_axis_y)**2
+
+    In the above equation "center_x", "center_y", "semi_axis_x" and "semi_axis_y"
+    are the parameters of the 2D ellipse. A 2D circle is an ellipse with equal semi-axes.
+
+    Each created point is represented by its x and y coordinate, in this order.
+
+    The random points are uniformly distributed by arc length. A uniform parameter angle t
+    is accepted with a probability proportional to the arc length element
+
+        sqrt((semi_axis_x * sin(t))**2 + (semi_axis_y * cos(t))**2)
+
+    in vectorized batches (see the rejection module).
+    """
+
+    dimension = 2
+
+    def __init__(self, center_x, center_y, semi_axis_x, semi_axis_y, seed=None):
+        """Ellipse2D constructor
+
+        Args:
+            center_x (float): The x coordinate of the ellipse center point
+            center_y (float): The y coordinate of the ellipse center point
+            semi_axis_x (float): The semi-axis of the ellipse in x direction
+            semi_axis_y (float): The semi-axis of the ellipse in y direction
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
+        """
+        super().__init__(seed)
+        self.center_x = check_geometry_parameter(center_x)
+        self.center_y = check_geometry_parameter(center_y)
+        self.semi_axis_x = check_radius(semi_axis_x)
+        self.semi_axis_y = check_radius(semi_axis_y)
+        # the trapezoidal rule converges exponentially for the periodic arc length element
+        nodes = np.linspace(0.0, 2.0 * math.pi, NUM_PERIMETER_NODES, endpoint=False)
+        self.acceptance_rate = float(np.mean(self._calc_acceptance_probabilities(nodes)))
+        self.perimeter = 2.0 * math.pi * max(self.semi_axis_x, self.semi_axis_y) \
+          * self.acceptance_rate
+
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
+
+        Returns:
+            float: The perimeter of the 2D ellipse
+        """
+        return self.perimeter
+
+    def _draw_random_numbers(self, num_points):
+        """Draw the random parameter angles (radiant) of num_points points on the 2D ellipse.
+
+        Args:
+            num_points (int): The number of points
+
+        Returns:
+            numpy.ndarray: The random parameter angles
+        """
+        return draw_with_rejection(self.rng, num_points, _propose_angles,
+                                   self._calc_acceptance_probabilities, self.acceptance_rate)
+
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the 2D ellipse.
+
+        Args:
+            random_numbers (numpy.ndarray): The random parameter angles (radiant) of the points
+            points (numpy.ndarray): A float64 array of shape (n, 2) that is overwritten
+        """
+        np.cos(random_numbers, out=points[:, 0])
+        np.sin(random_numbers, out=points[:, 1])
+        points *= (self.semi_axis_x, self.semi_axis_y)
+        points += (self.center_x, self.center_y)
+
+    def _calc_acceptance_probabilities(self, angles):
+        """Calculate the arc length element relative to its maximum for parameter angles.
+
+        Args:
+            angles (numpy.ndarray): The parameter angles (radiant)
+
+        Returns:
+            numpy.ndarray: The acceptance probabilities in [0, 1]
+        """
+        arc_length_elements = np.hypot(self.semi_axis_x * np.sin(angles),
+                                       self.semi_axis_y * np.cos(angles))
+        return arc_length_elements / max(self.semi_axis_x, self.semi_axis_y)
+
+def _propose_angles(rng, num_angles):
+    """Draw uniform parameter angles (radiant).
+    """
+    return rng.uniform(0.0, 2.0 * math.pi, num_angles)
@@ -0,0 +1,131 @@
+"""Random points on an ellipsoid.
+
+This module provides methods to generate an arbitrary number of points lying on an ellipsoid.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/ellipsoid_test.py
+"""
+
+import math
+import numpy as np
+from random_geometry_points.geometry import Geometry
+from random_geometry_points.validation import check_geometry_parameter, check_radius
+from random_geometry_points.rejection import draw_with_rejection
+
+NUM_AREA_NODES = (64, 128)
+
+class Ellipsoid(Geometry):
+    """Class to generate random points lying on an axis-aligned ellipsoid.
+
+    The ellipsoid is represented by the following equation:
+
+        1 = ((x - center_x) / semi_axis_x)**2 + ((y - center_y) / semi_axis_y)**2
+            + ((z - center_z) / semi_axis_z)**2
+
+    In the above equation "center_x", "center_y", "center_z" and the three semi-axes
+    are the parameters of the ellipsoid. A sphere is an ellipsoid with equal semi-axes.
+
+    Each created point is represented by its x, y and z coordinate, in this order.
+
+    The random points are uniformly distributed by area. A uniform point u on the unit sphere
+    is mapped onto the ellipsoid by scaling its coordinates with the semi-axes (a, b, c).
+    It is accepted with a probability proportional to the area element of that mapping
+
+        sqrt((b * c * u_x)**2 + (a * c * u_y)**2 + (a * b * u_z)**2)
+
+    in vectorized batches (see the rejection module).
+    """
+
+    def __init__(self, center_x, center_y, center_z, semi_axis_x, semi_axis_y, semi_axis_z,
+                 seed=None):
+        """Ellipsoid constructor
+
+        Args:
+            center_x (float): The x coordinate of the ellipsoid center point
+            center_y (float): The y coordinate of the ellipsoid center point
+            center_z (float): The z coordinate of the ellipsoid center point
+            semi_axis_x (float): The semi-axis of the ellipsoid in x direction
+            semi_axis_y (float): The semi-axis of the ellipsoid in y direction
+            semi_axis_z (float): The semi-axis of the ellipsoid in z direction
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
+        """
+        super().__init__(seed)
+        self.center_x = check_geometry_parameter(center_x)
+        self.center_y = check_geometry_parameter(center_y)
+        self.center_z = check_geometry_parameter(center_z)
+        self.semi_axes = (check_radius(semi_axis_x), check_radius(semi_axis_y),
+                          check_radius(semi_axis_z))
+        (semi_x, semi_y, semi_z) = self.semi_axes
+        self._area_element_factors = (semi_y * semi_z, semi_x * semi_z, semi_x * semi_y)
+        self.acceptance_rate = self._calc_mean_acceptance_probability()
+        self.area = 4.0 * math.pi * max(self._area_element_factors) * self.acceptance_rate
+
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
+
+        Returns:
+            float: The surface area of the ellipsoid
+        """
+        return self.area
+
+    def _draw_random_numbers(self, num_points):
+        """Draw uniformly distributed unit vectors of num_points points on the ellipsoid.
+
+        Args:
+            num_points (int): The number of points
+
+        Returns:
+            numpy.ndarray: The accepted unit vectors as array of shape (n, 3)
+        """
+        return draw_with_rejection(self.rng, num_points, _propose_unit_vectors,
+                                   self._calc_acceptance_probabilities, self.acceptance_rate)
+
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the ellipsoid.
+
+        Args:
+            random_numbers (numpy.ndarray): The unit vectors of the points
+            points (numpy.ndarray): A float64 array of shape (n, 3) that is overwritten
+        """
+        np.multiply(random_numbers, self.semi_axes, out=points)
+        points += (self.center_x, self.center_y, self.center_z)
+
+    def _calc_acceptance_probabilities(self, unit_vecs):
+        """Calculate the area element relative to its maximum for unit vectors.
+
+        Args:
+            unit_vecs (numpy.ndarray): The unit vectors as array of shape (n, 3)
+
+        Returns:
+            numpy.ndarray: The acceptance probabilities in [0, 1]
+        """
+        area_elements = np.linalg.norm(unit_vecs * self._area_element_factors, axis=-1)
+        return area_elements / max(self._area_element_factors)
+
+    def _calc_mean_acceptance_probability(self):
+        """Calculate the mean acceptance probability over the unit sphere.
+
+        The mean is integrated with a Gauss-Legendre rule for the cosine of the zenith angle
+        and the trapezoidal rule for the periodic azimuth angle.
+
+        Returns:
+            float: The expected fraction of accepted unit vectors
+        """
+        (cos_zenith, weights) = np.polynomial.legendre.leggauss(NUM_AREA_NODES[0])
+        azimuth = np.linspace(0.0, 2.0 * math.pi, NUM_AREA_NODES[1], endpoint=False)
+        sin_zenith = np.sqrt(1.0 - cos_zenith**2)[:, np.newaxis]
+        unit_vecs = np.stack(np.broadcast_arrays(sin_zenith * np.cos(azimuth),
+                                                 sin_zenith * np.sin(azimuth),
+                                                 cos_zenith[:, np.newaxis]), axis=-1)
+        probabilities = self._calc_acceptance_probabilities(unit_vecs)
+        return float(0.5 * np.sum(weights * np.mean(probabilities, axis=1)))
+
+def _propose_unit_vectors(rng, num_vecs):
+    """Draw uniformly distributed unit vectors by normalizing standard normal vectors.
+    """
+    vecs = rng.standard_normal((num_vecs, 3))
+    vecs /= np.linalg.norm(vecs, axis=1)[:, np.newaxis]
+    return vecs
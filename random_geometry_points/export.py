@@ -0,0 +1,44 @@
+"""Export of random points into files.
+
+The random points are created chunk by chunk directly into a memory-mapped file,
+so even point clouds that are much larger than the available memory can be exported.
+
+Examples:
+    For examples of the usage of this module see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/export_test.py
+"""
+
+import numpy as np
+from random_geometry_points.validation import check_number_of_random_points, check_option
+
+NPY = "npy"
+RAW = "raw"
+
+def generate_to_file(geometry, path, num_points, file_format=NPY):
+    """Create num_points random points on the geometry surface and write them into a file.
+
+    The file is memory-mapped and the geometry writes its points into it chunk by chunk,
+    so the whole point cloud is never held in memory.
+
+    Args:
+        geometry (Geometry): The geometry whose random points shall be created
+        path (str): The path of the file to be written. An existing file is overwritten.
+        num_points (int): The number of random points to be created
+        file_format (str): Either "npy" (default) to write a numpy .npy file
+          that can be loaded with numpy.load, or "raw" to write the plain float64 values
+          in native byte order, point by point
+
+    Returns:
+        str: The path of the written file
+    """
+    check_number_of_random_points(num_points, geometry.max_points)
+    check_option(file_format, (NPY, RAW))
+    shape = (num_points, geometry.dimension)
+    if file_format == NPY:
+        points = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+    else:
+        points = np.memmap(path, mode="w+", dtype=np.float64, shape=shape)
+    geometry.create_random_points_array(num_points, out=points)
+    points.flush()
+    del points
+    return path
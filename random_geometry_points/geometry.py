@@ -1,23 +1,370 @@
 """Random points on geometry surfaces.
 """
 
+import copy
 from abc import ABCMeta, abstractmethod
-from random_geometry_points.validation import check_number_of_random_points
+from time import perf_counter
+import numpy as np
+from random_geometry_points.validation import check_number_of_random_points, check_chunk_size, \
+  check_count, check_output_buffer
+from random_geometry_points.rng import create_random_generator, spawn_random_generators
+from random_geometry_points.point_cloud import PointCloud
+from random_geometry_points.streaming import stream_chunks
+from random_geometry_points.poisson_disk import create_poisson_disk_points, DEFAULT_MAX_ATTEMPTS
+
+DEFAULT_CHUNK_SIZE = 65536
 
 class Geometry(metaclass=ABCMeta):
     """Base class for all geometry types.
+
+    The random points are created in chunks of at most chunk_size points,
+    so the memory needed for intermediate results does not grow with the number of points.
+    Both chunk_size and the optional upper limit max_points for the number of points
+    per call can be configured per geometry object.
+
+    Each geometry object draws its random numbers from its own numpy random generator rng.
+    Passing a seed makes the created points reproducible per object.
+
+    Assigning an Instrumentation object to the instrumentation attribute enables
+    counters and timers for the point creation (see the instrumentation module).
+    Assigning a list of noise stages to the noise attribute adds measurement noise
+    to the created points (see the noise module). Geometries with surface normals
+    implement offset_along_normals for noise along the normals.
+
+    Subclasses set the dimension of their points, provide their measure (length or area)
+    and implement the two stages of the point creation, _draw_random_numbers and _transform.
     """
 
-    @abstractmethod
+    dimension = 3
+    _chunk_size = DEFAULT_CHUNK_SIZE
+    _max_points = None
+    instrumentation = None
+    noise = None
+
+    def __init__(self, seed=None):
+        """Geometry constructor
+
+        Args:
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator of the geometry object
+        """
+        self.rng = create_random_generator(seed)
+
+    @property
+    def chunk_size(self):
+        """Get the maximum number of points created at once.
+
+        Returns:
+            int: The chunk size
+        """
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size):
+        """Set the maximum number of points created at once.
+
+        Args:
+            chunk_size (int): The chunk size, greater than zero
+        """
+        self._chunk_size = check_chunk_size(chunk_size)
+
+    @property
+    def max_points(self):
+        """Get the upper limit for the number of points per call.
+
+        Returns:
+            int: The upper limit or None if the number of points is not limited
+        """
+        return self._max_points
+
+    @max_points.setter
+    def max_points(self, max_points):
+        """Set the upper limit for the number of points per call.
+
+        Args:
+            max_points (int): The upper limit greater than zero or None to remove the limit
+        """
+        if max_points is not None:
+            max_points = check_count(max_points, "maximum points")
+        self._max_points = max_points
+
+    def spawn(self, num_children):
+        """Create copies of the geometry object with independent random generators.
+
+        The random generators of the copies are spawned from the random generator
+        of this object. So they are reproducible if this object was created with a seed,
+        e.g. to create the points of sharded jobs in parallel.
+
+        Args:
+            num_children (int): The number of copies to be created
+
+        Returns:
+            list (Geometry): The copies of the geometry object
+        """
+        return [self.with_random_generator(generator)
+                for generator in spawn_random_generators(self.rng, num_children)]
+
+    def with_random_generator(self, generator):
+        """Create a copy of the geometry object that uses the given random generator.
+
+        The geometry parameters and precomputed arrays are shared with this object.
+
+        Args:
+            generator (numpy.random.Generator): The random generator of the copy
+
+        Returns:
+            Geometry: The copy of the geometry object
+        """
+        child = copy.copy(self)
+        child.rng = generator
+        return child
+
     def create_random_points(self, num_points):
         """Create a list of num_points random points that lie on the geometry surface.
+
+        Args:
+            num_points (int): The number of random points to be created.
+
+        Returns:
+            list (tuple (float, ...)): A list of num_points randomly generated points.
+              Each tuple contains the dimension coordinates of one point.
+        """
+        check_number_of_random_points(num_points, self.max_points)
+        if self.instrumentation is not None:
+            self.instrumentation.record_call(num_points)
+        points = []
+        chunk = np.empty((min(num_points, self.chunk_size), self.dimension))
+        for start in range(0, num_points, self.chunk_size):
+            chunk_points = chunk[:num_points - start]
+            self._fill_random_points(chunk_points)
+            points.extend(self._to_tuples(chunk_points))
+        return points
+
+    def create_random_point_generator(self, num_points, chunk_size=None):
+        """Create a generator to generate num_points random points that lie on the geometry surface.
+
+        The random points are created lazily in chunks of chunk_size points.
+        So the memory usage and the time until the first point is available
+        do not depend on num_points.
+
+        Args:
+            num_points (int): The number of random points to be created.
+            chunk_size (int): The number of points created at once.
+              Defaults to the chunk_size of the geometry object.
+
+        Yields:
+            tuple (float, ...): The next random point.
+        """
+        chunks = self.create_random_chunk_generator(num_points, chunk_size)
+        return (point for chunk in chunks for point in self._to_tuples(chunk))
+
+    def create_random_chunk_generator(self, num_points, chunk_size=None):
+        """Create a generator to generate num_points random points in chunks.
+
+        Args:
+            num_points (int): The number of random points to be created.
+            chunk_size (int): The maximum number of points per chunk.
+              Defaults to the chunk_size of the geometry object.
+
+        Yields:
+            numpy.ndarray: The next chunk of random points as float64 array
+              of shape (n, dimension) with n being at most chunk_size.
+        """
+        check_number_of_random_points(num_points, self.max_points)
+        chunk_size = self.chunk_size if chunk_size is None else check_chunk_size(chunk_size)
+        if self.instrumentation is not None:
+            self.instrumentation.record_call(num_points)
+        return self._generate_chunks(num_points, chunk_size)
+
+    def astream(self, num_points, chunk_size=None, max_queued_chunks=2):
+        """Create an asynchronous generator to generate num_points random points in chunks.
+
+        The chunks are created in a worker thread, so the event loop is not blocked.
+        At most max_queued_chunks chunks are created in advance. The worker thread waits
+        while the consumer is slower, and it stops when the consumer stops iterating.
+
+        Args:
+            num_points (int): The number of random points to be created.
+            chunk_size (int): The maximum number of points per chunk.
+              Defaults to the chunk_size of the geometry object.
+            max_queued_chunks (int): The maximum number of chunks created in advance.
+
+        Yields:
+            numpy.ndarray: The next chunk of random points as float64 array
+              of shape (n, dimension) with n being at most chunk_size.
+        """
+        check_count(max_queued_chunks, "queued chunks")
+        chunks = self.create_random_chunk_generator(num_points, chunk_size)
+        return stream_chunks(chunks, max_queued_chunks)
+
+    def create_random_points_array(self, num_points, out=None):
+        """Create an array of num_points random points that lie on the geometry surface.
+
+        Args:
+            num_points (int): The number of random points to be created.
+            out (any): An optional preallocated buffer the points are written into.
+              Either a float64 numpy array of shape (num_points, dimension) or any writable
+              buffer protocol object (e.g. array.array("d")) with space for exactly
+              num_points * dimension float64 values.
+
+        Returns:
+            numpy.ndarray: A float64 array of shape (num_points, dimension).
+              Each row contains the coordinates of one point.
+              If out is given, out itself is returned after being filled.
+        """
+        check_number_of_random_points(num_points, self.max_points)
+        if out is None:
+            points = np.empty((num_points, self.dimension))
+        else:
+            points = check_output_buffer(out, num_points, self.dimension)
+        if self.instrumentation is not None:
+            self.instrumentation.record_call(num_points)
+        for start in range(0, num_points, self.chunk_size):
+            self._fill_random_points(points[start:start + self.chunk_size])
+        return points if out is None else out
+
+    def create_point_cloud(self, num_points):
+        """Create a point cloud of num_points random points that lie on the geometry surface.
+
+        Args:
+            num_points (int): The number of random points to be created.
+
+        Returns:
+            PointCloud: The random points stored as contiguous coordinate columns.
+        """
+        check_number_of_random_points(num_points, self.max_points)
+        if self.instrumentation is not None:
+            self.instrumentation.record_call(num_points)
+        cloud = PointCloud.empty(num_points, self.dimension)
+        points = cloud.points
+        for start in range(0, num_points, self.chunk_size):
+            self._fill_random_points(points[start:start + self.chunk_size])
+        return cloud
+
+    def create_poisson_disk_points(self, num_points, min_distance,
+                                   max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """Create an array of num_points random points with a minimum distance between them.
+
+        The points are created by dart throwing with a spatial hash grid
+        (see the poisson_disk module).
+
+        Args:
+            num_points (int): The number of random points to be created.
+            min_distance (float): The minimum distance between any two of the points.
+            max_attempts (int): The maximum number of candidates rejected in a row
+              before the surface is considered to be full.
+
+        Raises:
+            ValueError: Signals that the num_points points do not fit on the geometry surface
+              with the minimum distance
+
+        Returns:
+            numpy.ndarray: A float64 array of shape (num_points, dimension).
+              Each row contains the coordinates of one point.
+        """
+        return create_poisson_disk_points(self, num_points, min_distance, max_attempts)
+
+    def offset_along_normals(self, points, offsets):
+        """Shift the points along the surface normals of the geometry in place.
+
+        This is the hook noise stages like NormalNoise use to move points off the surface.
+        Geometries with surface normals override this method. The points are not validated,
+        they must be points created for this geometry.
+
+        Args:
+            points (numpy.ndarray): A float64 array of shape (n, dimension)
+            offsets (numpy.ndarray): The offsets as array of shape (n,)
+
+        Raises:
+            TypeError: Signals that the geometry does not provide surface normals
+        """
+        raise TypeError("Inproper noise for " + type(self).__name__ +
+                        ". Expected a geometry with surface normals.")
+
+    def _generate_chunks(self, num_points, chunk_size):
+        """Lazily create num_points random points in chunks of at most chunk_size points.
+
+        Args:
+            num_points (int): The number of random points to be created.
+            chunk_size (int): The maximum number of points per chunk.
+
+        Yields:
+            numpy.ndarray: The next chunk of random points.
+        """
+        for start in range(0, num_points, chunk_size):
+            chunk = np.empty((min(chunk_size, num_points - start), self.dimension))
+            self._fill_random_points(chunk)
+            yield chunk
+
+    def _fill_random_points(self, points):
+        """Fill the given array with random points that lie on the geometry surface.
+
+        Args:
+            points (numpy.ndarray): A float64 array of shape (n, dimension) that is overwritten
+        """
+        if self.instrumentation is None:
+            self._transform(self._draw_random_numbers(len(points)), points)
+            self._apply_noise(points)
+            return
+        start = perf_counter()
+        random_numbers = self._draw_random_numbers(len(points))
+        drawn = perf_counter()
+        self._transform(random_numbers, points)
+        self._apply_noise(points)
+        self.instrumentation.record_chunk(len(points), drawn - start, perf_counter() - drawn)
+
+    def _apply_noise(self, points):
+        """Apply the noise stages of the geometry to the points in place.
+
+        Args:
+            points (numpy.ndarray): A float64 array of shape (n, dimension)
+        """
+        if self.noise is not None:
+            for stage in self.noise:
+                stage.apply(self, points)
+
+    def _to_tuples(self, points):
+        """Convert an array of points into a list of tuples.
+
+        Args:
+            points (numpy.ndarray): A float64 array of shape (n, dimension)
+
+        Returns:
+            list (tuple (float, ...)): The points as tuples
+        """
+        if self.instrumentation is None:
+            return list(map(tuple, points.tolist()))
+        start = perf_counter()
+        point_tuples = list(map(tuple, points.tolist()))
+        self.instrumentation.record_output(len(point_tuples), perf_counter() - start)
+        return point_tuples
+
+    @property
+    @abstractmethod
+    def measure(self):
+        """Get the size of the set the points are created on, i.e. the length of a curve
+        or the area of a surface. It is used to weight geometries by their size.
+
+        Returns:
+            float: The length or area
         """
-        check_number_of_random_points(num_points)
-        return []
 
     @abstractmethod
-    def create_random_point_generator(self, num_points):
-        """Create a generator to generate num_points random points that lie on the geometry surface
+    def _draw_random_numbers(self, num_points):
+        """Draw the random numbers needed to create num_points points.
+
+        Args:
+            num_points (int): The number of points
+
+        Returns:
+            any: The random numbers in a form understood by _transform
+        """
+
+    @abstractmethod
+    def _transform(self, random_numbers, points):
+        """Calculate the point coordinates from the random numbers.
+
+        Args:
+            random_numbers (any): The random numbers drawn by _draw_random_numbers
+            points (numpy.ndarray): A float64 array of shape (n, dimension) that is overwritten
         """
-        check_number_of_random_points(num_points)
-        yield from ()
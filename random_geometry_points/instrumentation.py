@@ -0,0 +1,114 @@
+"""Opt-in instrumentation of the random point creation.
+
+An Instrumentation object can be assigned to the instrumentation attribute of a geometry.
+It then counts the calls of the point creation methods and the created points,
+and it accumulates the time spent in the three stages of the point creation:
+
+    rng: drawing the random numbers
+    transform: calculating the point coordinates from the random numbers
+    output: converting the points into tuples for the list and generator methods
+
+Each recorded event is also passed to the registered callbacks,
+e.g. to feed the numbers into a metrics system.
+Without an instrumentation (the default) the geometries do not measure anything.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/instrumentation_test.py
+"""
+
+CALL = "call"
+RNG = "rng"
+TRANSFORM = "transform"
+OUTPUT = "output"
+
+class Instrumentation:
+    """Counters and timers of the random point creation of one or more geometries.
+
+    The callbacks are called as callback(stage, num_points, seconds) with stage being
+    one of "call", "rng", "transform" and "output". For "call" events num_points is the
+    number of requested points and seconds is 0.0.
+
+    The counters are not synchronized, so an Instrumentation object should not be
+    shared by geometries used in different threads.
+    """
+
+    def __init__(self, callbacks=()):
+        """Instrumentation constructor
+
+        Args:
+            callbacks (iterable (callable)): The callbacks to be notified about each event
+        """
+        self.callbacks = list(callbacks)
+        self.calls = 0
+        self.points = 0
+        self.rng_time = 0.0
+        self.transform_time = 0.0
+        self.output_time = 0.0
+
+    def reset(self):
+        """Reset all counters and timers to zero.
+        """
+        self.calls = 0
+        self.points = 0
+        self.rng_time = 0.0
+        self.transform_time = 0.0
+        self.output_time = 0.0
+
+    def as_dict(self):
+        """Get the current values of all counters and timers.
+
+        Returns:
+            dict: The values of calls, points, rng_time, transform_time and output_time
+        """
+        return {
+            "calls": self.calls,
+            "points": self.points,
+            "rng_time": self.rng_time,
+            "transform_time": self.transform_time,
+            "output_time": self.output_time
+        }
+
+    def record_call(self, num_points):
+        """Record a call of a point creation method.
+
+        Args:
+            num_points (int): The number of requested points
+        """
+        self.calls += 1
+        self._notify(CALL, num_points, 0.0)
+
+    def record_chunk(self, num_points, rng_time, transform_time):
+        """Record the creation of a chunk of points.
+
+        Args:
+            num_points (int): The number of created points
+            rng_time (float): The seconds spent drawing the random numbers
+            transform_time (float): The seconds spent calculating the point coordinates
+        """
+        self.points += num_points
+        self.rng_time += rng_time
+        self.transform_time += transform_time
+        self._notify(RNG, num_points, rng_time)
+        self._notify(TRANSFORM, num_points, transform_time)
+
+    def record_output(self, num_points, output_time):
+        """Record the conversion of a chunk of points into the output format.
+
+        Args:
+            num_points (int): The number of converted points
+            output_time (float): The seconds spent converting the points
+        """
+        self.output_time += output_time
+        self._notify(OUTPUT, num_points, output_time)
+
+    def _notify(self, stage, num_points, seconds):
+        """Pass an event to all callbacks.
+
+        Args:
+            stage (str): The stage of the event
+            num_points (int): The number of points of the event
+            seconds (float): The duration of the event
+        """
+        for callback in self.callbacks:
+            callback(stage, num_points, seconds)
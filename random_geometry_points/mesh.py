@@ -0,0 +1,76 @@
+"""Random points on a triangle mesh.
+
+This module provides methods to generate an arbitrary number of points lying on the surface
+of a triangle mesh, e.g. a mesh derived from a CAD model.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/mesh_test.py
+"""
+
+from random_geometry_points.geometry import Geometry
+from random_geometry_points.validation import check_point_array, check_face_array
+from random_geometry_points.triangles import Triangles
+
+class Mesh(Geometry):
+    """Class to generate random points lying on the surface of a triangle mesh.
+
+    The mesh is defined by an array of vertices and an array of triangles (faces),
+    each given by the indices of its three vertices.
+
+    Each created point is represented by its x, y and z coordinate, in this order.
+
+    The random points are uniformly distributed over the mesh surface. Each point is
+    assigned to a triangle with a probability proportional to the triangle area
+    by an alias table, which is built once per mesh, and placed within the triangle
+    by barycentric parameters (see the triangles module).
+    """
+
+    def __init__(self, vertices, faces, seed=None):
+        """Mesh constructor
+
+        Args:
+            vertices (numpy.ndarray): The vertices of the mesh as array of shape (n, 3)
+            faces (numpy.ndarray): The triangles of the mesh as int array of shape (m, 3)
+              containing the indices of the vertices of each triangle
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
+        """
+        super().__init__(seed)
+        self.vertices = check_point_array(vertices, 3)
+        self.faces = check_face_array(faces, len(self.vertices))
+        self.triangles = Triangles(self.vertices[self.faces[:, 0]],
+                                   self.vertices[self.faces[:, 1]],
+                                   self.vertices[self.faces[:, 2]])
+        self.area = self.triangles.area
+
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
+
+        Returns:
+            float: The surface area of the mesh
+        """
+        return self.area
+
+    def _draw_random_numbers(self, num_points):
+        """Draw the random triangles and barycentric parameters of num_points points.
+
+        Args:
+            num_points (int): The number of points
+
+        Returns:
+            tuple (numpy.ndarray, numpy.ndarray): The random triangle indices
+              and the barycentric parameters (u, v) as array of shape (2, n)
+        """
+        return self.triangles.draw_random_numbers(self.rng, num_points)
+
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the mesh.
+
+        Args:
+            random_numbers (tuple (numpy.ndarray, numpy.ndarray)):
+              The random numbers drawn by _draw_random_numbers
+            points (numpy.ndarray): A float64 array of shape (n, 3) that is overwritten
+        """
+        self.triangles.fill_points(random_numbers, points)
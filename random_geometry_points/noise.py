@@ -0,0 +1,88 @@
+"""Measurement noise models.
+
+A list of noise stages can be assigned to the noise attribute of a geometry.
+The stages are applied in order to each chunk of points right after the chunk is created,
+so the noise is added in place without copying the points. The random numbers of the noise
+are drawn from the random generator of the geometry, so seeded geometries create
+reproducible noisy points.
+
+Examples:
+    For examples of the usage of these classes see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/noise_test.py
+"""
+
+from random_geometry_points.validation import check_positive, check_fraction
+
+class GaussianNoise:
+    """Isotropic Gaussian noise: each coordinate of each point is shifted by
+    a normally distributed offset with the standard deviation sigma.
+    """
+
+    def __init__(self, sigma):
+        """GaussianNoise constructor
+
+        Args:
+            sigma (float): The standard deviation of the offsets
+        """
+        self.sigma = check_positive(sigma, "standard deviation")
+
+    def apply(self, geometry, points):
+        """Add the noise to the points in place.
+
+        Args:
+            geometry (Geometry): The geometry the points were created for
+            points (numpy.ndarray): A float64 array of shape (n, dimension)
+        """
+        points += geometry.rng.normal(0.0, self.sigma, points.shape)
+
+class NormalNoise:
+    """Gaussian noise along the surface normal: each point is shifted along the normal
+    of the geometry surface by a normally distributed offset with the standard deviation sigma.
+
+    This models the distance error of a measurement device. It is supported by
+    geometries with surface normals, i.e. spheres, planes and 2D circles.
+    """
+
+    def __init__(self, sigma):
+        """NormalNoise constructor
+
+        Args:
+            sigma (float): The standard deviation of the offsets
+        """
+        self.sigma = check_positive(sigma, "standard deviation")
+
+    def apply(self, geometry, points):
+        """Add the noise to the points in place.
+
+        Args:
+            geometry (Geometry): The geometry the points were created for
+            points (numpy.ndarray): A float64 array of shape (n, dimension)
+        """
+        geometry.offset_along_normals(points, geometry.rng.normal(0.0, self.sigma, len(points)))
+
+class Outliers:
+    """Outlier injection: each point becomes an outlier with the probability fraction.
+    Outliers are shifted by an isotropic Gaussian offset with the standard deviation sigma,
+    which is usually much larger than the standard deviation of the regular noise.
+    """
+
+    def __init__(self, fraction, sigma):
+        """Outliers constructor
+
+        Args:
+            fraction (float): The probability of each point to become an outlier
+            sigma (float): The standard deviation of the outlier offsets
+        """
+        self.fraction = check_fraction(fraction)
+        self.sigma = check_positive(sigma, "standard deviation")
+
+    def apply(self, geometry, points):
+        """Turn a random subset of the points into outliers in place.
+
+        Args:
+            geometry (Geometry): The geometry the points were created for
+            points (numpy.ndarray): A float64 array of shape (n, dimension)
+        """
+        outliers = geometry.rng.random(len(points)) < self.fraction
+        points[outliers] += geometry.rng.normal(0.0, self.sigma, (int(outliers.sum()),
+                                                                  points.shape[1]))
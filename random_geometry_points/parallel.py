@@ -0,0 +1,129 @@
+"""Parallel creation of random points using a pool of processes.
+
+A large number of points is split into shards of shard_size points.
+Each shard is created by a copy of the geometry object with its own child random generator
+(see Geometry.spawn). So for a seeded geometry the result only depends on the seed
+and the shard size, but not on the number of worker processes.
+
+The geometry is sent to each worker process once when the pool starts. A task only carries
+the seed sequence of its child random generator and the number of points, so large
+geometries like meshes are not pickled again for every shard.
+
+Examples:
+    For examples of the usage of this module see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/parallel_test.py
+"""
+
+import os
+from collections import deque
+from multiprocessing import Pool
+import numpy as np
+from random_geometry_points.validation import check_number_of_random_points, check_count
+from random_geometry_points.rng import create_seed_sequence, create_child_generator
+
+DEFAULT_SHARD_SIZE = 1000000
+
+# the geometry of a worker process, stored once by _init_worker
+_WORKER_STATE = {}
+
+def generate_parallel(geometry, num_points, workers=None, shard_size=DEFAULT_SHARD_SIZE,
+                      stream=False):
+    """Create num_points random points on the geometry surface using a pool of processes.
+
+    Args:
+        geometry (Geometry): The geometry whose random points shall be created.
+          It must be picklable to be sent to the worker processes.
+        num_points (int): The number of random points to be created.
+        workers (int): The number of worker processes. Defaults to the number of CPUs.
+        shard_size (int): The number of points created by a single task.
+        stream (bool): If True, a generator yielding the shards in order is returned
+          instead of a single array.
+
+    Returns:
+        numpy.ndarray: A float64 array of shape (num_points, dimension) if stream is False.
+
+        generator (numpy.ndarray): A generator yielding the shards as float64 arrays
+          of shape (n, dimension) in order if stream is True.
+    """
+    check_number_of_random_points(num_points, geometry.max_points)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = check_count(workers, "workers")
+    shard_size = check_count(shard_size, "points per shard")
+    shard_lengths = [min(shard_size, num_points - start)
+                     for start in range(0, num_points, shard_size)]
+    seed_sequence = create_seed_sequence(geometry.rng)
+    chunks = _generate_shard_points(geometry, seed_sequence, shard_lengths, workers)
+    if stream:
+        return chunks
+    points = np.empty((num_points, geometry.dimension))
+    start = 0
+    for chunk in chunks:
+        points[start:start + len(chunk)] = chunk
+        start += len(chunk)
+    return points
+
+def _generate_shard_points(geometry, seed_sequence, shard_lengths, workers):
+    """Create the points of all shards and yield them in order.
+
+    The seed sequences of the shards are spawned lazily when their tasks are submitted.
+    At most two tasks per worker are pending at a time,
+    so a slow consumer does not make the results pile up in memory.
+
+    Args:
+        geometry (Geometry): The geometry whose random points shall be created
+        seed_sequence (numpy.random.SeedSequence): The seed sequence the seed sequences
+          of the shards are spawned from
+        shard_lengths (list (int)): The number of points of each shard
+        workers (int): The number of worker processes
+
+    Yields:
+        numpy.ndarray: The points of the next shard
+    """
+    if workers == 1 or len(shard_lengths) == 1:
+        for shard_length in shard_lengths:
+            yield _create_shard_points(geometry, seed_sequence.spawn(1)[0], shard_length)
+        return
+    with Pool(min(workers, len(shard_lengths)), _init_worker, (geometry,)) as pool:
+        pending = deque()
+        for shard_length in shard_lengths:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+            pending.append(pool.apply_async(_create_worker_shard_points,
+                                            (seed_sequence.spawn(1)[0], shard_length)))
+        while pending:
+            yield pending.popleft().get()
+
+def _init_worker(geometry):
+    """Store the geometry in a worker process. Executed once when the worker process starts.
+
+    Args:
+        geometry (Geometry): The geometry whose random points shall be created
+    """
+    _WORKER_STATE["geometry"] = geometry
+
+def _create_worker_shard_points(seed_sequence, num_points):
+    """Create the points of a single shard. Executed in a worker process.
+
+    Args:
+        seed_sequence (numpy.random.SeedSequence): The seed sequence of the shard
+        num_points (int): The number of points of the shard
+
+    Returns:
+        numpy.ndarray: The points of the shard
+    """
+    return _create_shard_points(_WORKER_STATE["geometry"], seed_sequence, num_points)
+
+def _create_shard_points(geometry, seed_sequence, num_points):
+    """Create the points of a single shard.
+
+    Args:
+        geometry (Geometry): The geometry whose random points shall be created
+        seed_sequence (numpy.random.SeedSequence): The seed sequence of the shard
+        num_points (int): The number of points of the shard
+
+    Returns:
+        numpy.ndarray: The points of the shard
+    """
+    shard = geometry.with_random_generator(create_child_generator(geometry.rng, seed_sequence))
+    return shard.create_random_points_array(num_points)
@@ -8,12 +8,17 @@ Examples:
 """
 
 import math
-import random
+import numpy as np
 from random_geometry_points.geometry import Geometry
 from random_geometry_points.validation import check_geometry_parameter, \
-  check_vector, check_direction_vector, check_radius
-from random_geometry_points.vector_math import normalize_vector, \
-  calc_dot_product, calc_perpendicular_vector, rotate_vector, scale_vector, sum_vectors
+  check_vector, check_direction_vector, check_radius, check_extents, check_point_array
+from random_geometry_points.vector_math import _normalize, _dot, _cross, _scale, \
+  _orthonormal_basis
+from random_geometry_points.triangles import Triangles, triangulate_polygon
+
+DISC = "disc"
+RECTANGLE = "rectangle"
+POLYGON = "polygon"
 
 class Plane(Geometry):
     """Class to generate random points lying on a plane.
@@ -28,9 +33,23 @@ class Plane(Geometry):
 
     In the above equation "x", "y" and "z" represent the coordinates
     of an arbitrary point on the plane.
+
+    Each created point is represented by its x, y and z coordinate, in this order.
+
+    The random points are uniformly distributed over the disc with the given radius
+    around the reference point. They are created from an orthonormal basis (u, v) of the
+    plane which is calculated once, so that each point is
+
+        ref_point + r * (cos(angle) * u + sin(angle) * v)
+
+    Planes created by from_rectangle or from_polygon distribute the points uniformly over
+    a rectangle or a simple polygon instead. The polygon is triangulated once and each point
+    is assigned to a triangle with a probability proportional to the triangle area
+    by an alias table. The radius of these planes is the largest distance
+    of the region from the reference point.
     """
 
-    def __init__(self, normal_vec, d_origin, ref_point, radius):
+    def __init__(self, normal_vec, d_origin, ref_point, radius, seed=None):
         """Plane constructor
 
         Args:
@@ -39,19 +58,28 @@ class Plane(Geometry):
             ref_point (tuple (float, float, float)): The center point
               for the plane point creation radius
             radius (float): The plane point creation radius
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
         """
+        super().__init__(seed)
         n_vec = check_direction_vector(normal_vec)
-        self.normal_vec = normalize_vector(n_vec)
+        self.normal_vec = _normalize(n_vec)
         self.d_origin = check_geometry_parameter(d_origin)
         self.radius = check_radius(radius)
         self.ref_point = check_vector(ref_point)
-        if not math.isclose(calc_dot_product(self.normal_vec, self.ref_point) - self.d_origin,
+        if not math.isclose(_dot(self.normal_vec, self.ref_point) - self.d_origin,
                             0.0, abs_tol=0.000001):
             raise ValueError("""Invalid reference point. Expected the reference point
               to lie on the plane""")
+        self.basis = _orthonormal_basis(self.normal_vec)
+        self.region = DISC
+        # set up by _init_rectangle and _init_polygon for the other regions
+        self.extents = None
+        self.vertices = None
+        self.triangles = None
 
     @classmethod
-    def from_normal_form(cls, normal_vec, position_vec, radius):
+    def from_normal_form(cls, normal_vec, position_vec, radius, seed=None):
         """Factory method to create a plane when having the plane
         parameters in the plane's normal form.
 
@@ -60,18 +88,20 @@ class Plane(Geometry):
             position_vec (tuple (float, float, float)): An arbitrary point on the plane.
               That point is also used as the center point for the plane point creation radius
             radius (float): The plane point creation radius
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
 
         Returns:
             Plane: The plane object
         """
         n_vec = check_direction_vector(normal_vec)
-        n0_vec = normalize_vector(n_vec)
+        n0_vec = _normalize(n_vec)
         ref_point = check_vector(position_vec)
-        d_origin = calc_dot_product(n0_vec, ref_point)
-        return cls(normal_vec, d_origin, ref_point, radius)
+        d_origin = _dot(n0_vec, ref_point)
+        return cls(normal_vec, d_origin, ref_point, radius, seed)
 
     @classmethod
-    def from_hessian_normal_form(cls, normal_vec, d_origin, radius):
+    def from_hessian_normal_form(cls, normal_vec, d_origin, radius, seed=None):
         """Factory method to create a plane when having the plane
         parameters in the plane's hessian normal form.
 
@@ -79,64 +109,174 @@ class Plane(Geometry):
             normal_vec (tuple (float, float, float)): The normal vector of the plane
             d_origin (float): The smallest distance of the plane from the origin
             radius (float): The plane point creation radius
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
 
         Returns:
             Plane: The plane object
         """
         n_vec = check_direction_vector(normal_vec)
-        n0_vec = normalize_vector(n_vec)
-        ref_point = scale_vector(n0_vec, d_origin)
-        return cls(normal_vec, d_origin, ref_point, radius)
+        n0_vec = _normalize(n_vec)
+        ref_point = _scale(n0_vec, check_geometry_parameter(d_origin))
+        return cls(normal_vec, d_origin, ref_point, radius, seed)
 
-    def create_random_points(self, num_points):
-        """Create a list of num_points random points that lie on the plane.
+    @classmethod
+    def from_rectangle(cls, center, axis_u, axis_v, extents, seed=None):
+        """Factory method to create a plane whose points lie within a rectangle.
 
         Args:
-            num_points (int): The number of random points to be created. Maximum value is 99999.
+            center (tuple (float, float, float)): The center point of the rectangle
+            axis_u (tuple (float, float, float)): The direction of the first pair of sides
+            axis_v (tuple (float, float, float)): The direction of the second pair of sides,
+              perpendicular to axis_u
+            extents (tuple (float, float)): The side lengths along axis_u and axis_v
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
 
         Returns:
-            list (tuple (float, float, float)): A list of randomly generated points.
+            Plane: The plane object
+        """
+        basis_u = _normalize(check_direction_vector(axis_u))
+        basis_v = _normalize(check_direction_vector(axis_v))
+        if not math.isclose(_dot(basis_u, basis_v), 0.0, abs_tol=0.000001):
+            raise ValueError("Inproper rectangle axes. Expected perpendicular axes.")
+        (width, height) = check_extents(extents)
+        plane = cls.from_normal_form(_cross(basis_u, basis_v), center,
+                                     0.5 * math.hypot(width, height), seed)
+        plane._init_rectangle((basis_u, basis_v), (width, height))
+        return plane
 
-            The returned list contains num_points tuples.
+    @classmethod
+    def from_polygon(cls, vertices, seed=None):
+        """Factory method to create a plane whose points lie within a polygon.
+
+        The polygon must be simple, i.e. its sides must not intersect, but it may be concave.
+        The normal vector of the plane points to the side from which the vertices
+        appear in counterclockwise order.
+
+        Args:
+            vertices (numpy.ndarray): The vertices of the polygon in order
+              as array of shape (n, 3), all lying on one plane
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
 
-            Each tuple represents a point lying on the plane.
-            The first tuple-value is the x coordinate.
-            The second tuple-value is the y coordinate.
-            The third tuple-value is the z coordinate.
+        Returns:
+            Plane: The plane object
         """
-        super().create_random_points(num_points)
-        start_vec = calc_perpendicular_vector(self.normal_vec)
-        return [self._create_plane_point(start_vec) for n in range(0, num_points)]
+        polygon = check_point_array(vertices, 3)
+        if len(polygon) < 3:
+            raise ValueError("Inproper polygon. Expected at least 3 vertices.")
+        centroid = np.mean(polygon, axis=0)
+        offsets = polygon - centroid
+        area_vec = 0.5 * np.sum(np.cross(offsets, np.roll(offsets, -1, axis=0)), axis=0)
+        scale = np.max(np.linalg.norm(offsets, axis=1))
+        if not np.linalg.norm(area_vec) > 0.000001 * scale**2:
+            raise ValueError("Inproper polygon. Expected an area greater than zero.")
+        normal_vec = area_vec / np.linalg.norm(area_vec)
+        if np.any(np.abs(offsets @ normal_vec) > 0.000001 * scale):
+            raise ValueError("Inproper polygon. Expected all vertices to lie on one plane.")
+        plane = cls.from_normal_form(tuple(normal_vec.tolist()), tuple(centroid.tolist()),
+                                     scale, seed)
+        plane._init_polygon(polygon)
+        return plane
 
-    def create_random_point_generator(self, num_points):
-        """Create a generator to generate num_points random points that lie on the plane.
+    def _init_rectangle(self, basis, extents):
+        """Restrict the points to a rectangle around the reference point.
 
         Args:
-            num_points (int): The number of random points to be created. Maximum value is 99999.
+            basis (tuple (tuple (float, float, float), tuple (float, float, float))):
+              The normalized directions of the rectangle sides, perpendicular to the normal
+            extents (tuple (float, float)): The side lengths along both directions
+        """
+        self.region = RECTANGLE
+        self.basis = basis
+        self.extents = extents
 
-        Yields:
-            tuple (float, float, float): The next random point.
+    def _init_polygon(self, vertices):
+        """Restrict the points to a polygon by triangulating it.
 
-            Each tuple represents a point lying on the plane.
-            The first tuple-value is the x coordinate.
-            The second tuple-value is the y coordinate.
-            The third tuple-value is the z coordinate.
+        Args:
+            vertices (numpy.ndarray): The checked vertices of the polygon in order
+              as array of shape (n, 3), lying on the plane
+        """
+        basis = np.array(self.basis)
+        coords = (vertices - self.ref_point) @ basis.T
+        # the vertices are projected onto the plane to remove rounding errors
+        corners = self.ref_point + coords @ basis
+        indices = triangulate_polygon(coords)
+        self.region = POLYGON
+        self.vertices = vertices
+        self.triangles = Triangles(corners[indices[:, 0]], corners[indices[:, 1]],
+                                   corners[indices[:, 2]])
+
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
+
+        Returns:
+            float: The area of the disc, rectangle or polygon the points are created in
+        """
+        if self.region == RECTANGLE:
+            return self.extents[0] * self.extents[1]
+        elif self.region == POLYGON:
+            return self.triangles.area
+        return math.pi * self.radius**2
+
+    def offset_along_normals(self, points, offsets):
+        """Shift the points along the plane normal in place.
+
+        Args:
+            points (numpy.ndarray): A float64 array of shape (n, 3)
+            offsets (numpy.ndarray): The offsets as array of shape (n,)
         """
-        _ = [_ for _ in super().create_random_point_generator(num_points)]
-        start_vec = calc_perpendicular_vector(self.normal_vec)
-        return (self._create_plane_point(start_vec) for n in range(0, num_points))
+        for axis, normal_component in enumerate(self.normal_vec):
+            points[:, axis] += offsets * normal_component
 
-    def _create_plane_point(self, start_vec):
-        """Create a 3D cartesian point using the plane parameters.
+    def _draw_random_numbers(self, num_points):
+        """Draw the random polar coordinates of num_points points within the disc.
+
+        The distance from the reference point is drawn as radius * sqrt(u) with u
+        being uniform in [0, 1], which yields points that are uniformly distributed by area.
+        For a rectangle the coordinates along both axes are drawn uniformly instead,
+        for a polygon the triangles and the barycentric parameters.
 
         Args:
-            start_vec (tuple (float, float, float)): A vector perpendicular to the
-              plane's normal vector
+            num_points (int): The number of points
 
         Returns:
-            tuple (float, float, float): An arbitrary point on the plane
+            tuple (numpy.ndarray, numpy.ndarray): The random angles (radiant)
+              and distances from the reference point, the random relative coordinates
+              along both rectangle axes or the random triangles and barycentric parameters
+        """
+        if self.region == RECTANGLE:
+            return tuple(self.rng.uniform(-0.5, 0.5, (2, num_points)))
+        elif self.region == POLYGON:
+            return self.triangles.draw_random_numbers(self.rng, num_points)
+        angles = self.rng.uniform(0.0, 2.0 * math.pi, num_points)
+        distances = self.radius * np.sqrt(self.rng.uniform(0.0, 1.0, num_points))
+        return (angles, distances)
+
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the plane.
+
+        Args:
+            random_numbers (tuple (numpy.ndarray, numpy.ndarray)): The random angles
+              and distances drawn by _draw_random_numbers
+            points (numpy.ndarray): A float64 array of shape (n, 3) that is overwritten
         """
-        angle = random.uniform(0.0, 2.0*math.pi)
-        distance = random.uniform(0.0, self.radius)
-        random_direction = normalize_vector(rotate_vector(start_vec, self.normal_vec, angle))
-        return sum_vectors(self.ref_point, scale_vector(random_direction, distance))
+        if self.region == RECTANGLE:
+            plane_coords = np.stack(random_numbers, axis=-1)
+            plane_coords *= self.extents
+            np.matmul(plane_coords, self.basis, out=points)
+            points += self.ref_point
+            return
+        elif self.region == POLYGON:
+            self.triangles.fill_points(random_numbers, points)
+            return
+        (angles, distances) = random_numbers
+        plane_coords = np.empty((len(angles), 2))
+        np.cos(angles, out=plane_coords[:, 0])
+        np.sin(angles, out=plane_coords[:, 1])
+        plane_coords *= distances[:, np.newaxis]
+        np.matmul(plane_coords, self.basis, out=points)
+        points += self.ref_point
@@ -0,0 +1,152 @@
+"""A compact container for random points.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/point_cloud_test.py
+"""
+
+import numpy as np
+from random_geometry_points.validation import check_point_array
+
+ITER_CHUNK_SIZE = 65536
+
+class PointCloud:
+    """Class to store points as a struct of arrays.
+
+    The coordinates are stored in a single contiguous float64 array of shape (dimension, n),
+    i.e. each coordinate is a contiguous column. So a 3D point needs 24 bytes instead
+    of the object overhead of a tuple of floats.
+
+    For backwards compatibility a point cloud behaves like the list of tuples returned
+    by Geometry.create_random_points: it supports len, indexing and iteration.
+    numpy.asarray(cloud) returns a zero-copy (n, dimension) view via __array_interface__.
+    The zero-copy export via the buffer protocol, e.g. memoryview(cloud), needs Python 3.12
+    or newer.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns):
+        """PointCloud constructor
+
+        Args:
+            columns (numpy.ndarray): A float64 array of shape (dimension, n)
+              containing one row per coordinate. It is used without copying.
+        """
+        if not isinstance(columns, np.ndarray) or columns.dtype != np.float64:
+            raise TypeError("Inproper type for point cloud columns. Expected a float64 array.")
+        elif columns.ndim != 2:
+            raise ValueError("Inproper shape for point cloud columns. Expected (dimension, n).")
+        self._columns = columns
+
+    @classmethod
+    def empty(cls, num_points, dimension):
+        """Factory method to create an uninitialized point cloud.
+
+        Args:
+            num_points (int): The number of points
+            dimension (int): The number of coordinates per point
+
+        Returns:
+            PointCloud: The point cloud
+        """
+        return cls(np.empty((dimension, num_points)))
+
+    @classmethod
+    def from_points(cls, points):
+        """Factory method to create a point cloud from a sequence of 2D or 3D points.
+
+        Args:
+            points (any): The points as array-like of shape (n, dimension)
+
+        Returns:
+            PointCloud: The point cloud containing a copy of the points
+        """
+        return cls(np.ascontiguousarray(check_point_array(points).T))
+
+    @property
+    def dimension(self):
+        """int: The number of coordinates per point.
+        """
+        return self._columns.shape[0]
+
+    @property
+    def columns(self):
+        """numpy.ndarray: The coordinates as (dimension, n) array, one row per coordinate.
+        """
+        return self._columns
+
+    @property
+    def points(self):
+        """numpy.ndarray: A (n, dimension) view of the coordinates.
+        """
+        return self._columns.T
+
+    @property
+    def x(self):
+        """numpy.ndarray: A zero-copy view of the x coordinates.
+        """
+        return self._columns[0]
+
+    @property
+    def y(self):
+        """numpy.ndarray: A zero-copy view of the y coordinates.
+        """
+        return self._columns[1]
+
+    @property
+    def z(self):
+        """numpy.ndarray: A zero-copy view of the z coordinates.
+        """
+        if self.dimension < 3:
+            raise ValueError("Inproper coordinate. The points have no z coordinate.")
+        return self._columns[2]
+
+    @property
+    def nbytes(self):
+        """int: The number of bytes used by the coordinates.
+        """
+        return self._columns.nbytes
+
+    @property
+    def __array_interface__(self):
+        """dict: The numpy array interface of the (n, dimension) view of the coordinates.
+        """
+        return self._columns.T.__array_interface__
+
+    def __buffer__(self, _flags):
+        """Export the (n, dimension) view of the coordinates via the buffer protocol.
+        Only used by Python 3.12 and newer.
+        """
+        return memoryview(self._columns.T)
+
+    def __len__(self):
+        return self._columns.shape[1]
+
+    def __getitem__(self, index):
+        """Get a single point as tuple or a slice of the points as point cloud view.
+
+        Args:
+            index (int or slice): The index of the point or a slice of points
+
+        Returns:
+            tuple (float, ...) or PointCloud: The point or the sliced point cloud
+        """
+        if isinstance(index, slice):
+            return PointCloud(self._columns[:, index])
+        return tuple(self._columns[:, index].tolist())
+
+    def __iter__(self):
+        for start in range(0, len(self), ITER_CHUNK_SIZE):
+            yield from zip(*self._columns[:, start:start + ITER_CHUNK_SIZE].tolist())
+
+    def __repr__(self):
+        return "PointCloud(num_points={}, dimension={})".format(len(self), self.dimension)
+
+    def tolist(self):
+        """Convert the point cloud into a list of tuples.
+
+        Returns:
+            list (tuple (float, ...)): The points as tuples
+        """
+        return list(zip(*self._columns.tolist()))
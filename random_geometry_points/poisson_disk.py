@@ -0,0 +1,122 @@
+"""Random points with a minimum distance (Poisson-disk sampling).
+
+Candidate points are created in chunks by the geometry and accepted one after the other
+if no accepted point lies closer than the minimum distance (dart throwing).
+The accepted points are stored in a uniform grid with cells of the size of the minimum
+distance, hashed by their integer cell coordinates. So a candidate is only compared to the
+points of the 3 x 3 (x 3) neighbouring cells and the cost grows nearly linear with the
+number of points instead of quadratic.
+
+Since the distance is measured in the space the points lie in, the points of every geometry
+(e.g. circles, spheres and planes) can be created this way, either by this module's function
+or by the create_poisson_disk_points method of the geometry.
+
+Examples:
+    For examples of the usage of this module see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/poisson_disk_test.py
+"""
+
+import itertools
+import numpy as np
+from random_geometry_points.validation import check_number_of_random_points, check_positive, \
+  check_count
+
+DEFAULT_MAX_ATTEMPTS = 1000
+MIN_CANDIDATE_CHUNK_SIZE = 256
+
+def create_poisson_disk_points(geometry, num_points, min_distance,
+                               max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """Create num_points random points on the geometry surface with a minimum distance.
+
+    No two of the created points are closer than min_distance. Dart throwing cannot fill
+    the surface as densely as possible, e.g. on a plane region it places at most about
+    0.7 / min_distance**2 points per area. If the surface is full, too many candidates are
+    rejected in a row and a ValueError is raised.
+
+    The candidates are created by the create_random_points_array method of the geometry.
+    So with an instrumentation each chunk of candidates counts as a call, and the counted
+    points and times include the rejected candidates.
+
+    Args:
+        geometry (Geometry): The geometry whose random points shall be created.
+        num_points (int): The number of random points to be created.
+        min_distance (float): The minimum distance between any two of the points.
+        max_attempts (int): The maximum number of candidates rejected in a row
+          before the surface is considered to be full.
+
+    Raises:
+        ValueError: Signals that the num_points points do not fit on the geometry surface
+          with the minimum distance
+
+    Returns:
+        numpy.ndarray: A float64 array of shape (num_points, dimension).
+          Each row contains the coordinates of one point.
+    """
+    check_number_of_random_points(num_points, geometry.max_points)
+    min_distance = check_positive(min_distance, "minimum distance")
+    max_attempts = check_count(max_attempts, "attempts")
+    points = np.empty((num_points, geometry.dimension))
+    grid = _PointGrid(min_distance, geometry.dimension)
+    buffer_size = min(geometry.chunk_size, max(num_points, MIN_CANDIDATE_CHUNK_SIZE))
+    if geometry.max_points is not None:
+        buffer_size = min(buffer_size, geometry.max_points)
+    buffer = np.empty((buffer_size, geometry.dimension))
+    num_accepted = 0
+    num_rejected = 0
+    while num_accepted < num_points:
+        chunk_size = min(len(buffer), max(num_points - num_accepted, MIN_CANDIDATE_CHUNK_SIZE))
+        candidates = geometry.create_random_points_array(chunk_size, out=buffer[:chunk_size])
+        cells = np.floor(candidates / min_distance).astype(np.int64).tolist()
+        for candidate, cell in zip(candidates.tolist(), cells):
+            if grid.add(candidate, tuple(cell)):
+                points[num_accepted] = candidate
+                num_accepted += 1
+                num_rejected = 0
+                if num_accepted == num_points:
+                    break
+            else:
+                num_rejected += 1
+                if num_rejected >= max_attempts:
+                    raise ValueError("Inproper value for minimum distance. Only " +
+                                     str(num_accepted) + " of " + str(num_points) +
+                                     " points fit on the geometry surface.")
+    return points
+
+class _PointGrid:
+    """Uniform grid of points with cells of the size of the minimum distance.
+
+    Only the cells that contain points are stored, hashed by their integer cell coordinates.
+    """
+
+    def __init__(self, min_distance, dimension):
+        """_PointGrid constructor
+
+        Args:
+            min_distance (float): The minimum distance between any two points of the grid
+            dimension (int): The dimension of the points
+        """
+        self.cells = {}
+        self.squared_min_distance = min_distance * min_distance
+        self.neighbour_offsets = list(itertools.product((-1, 0, 1), repeat=dimension))
+
+    def add(self, point, cell):
+        """Add the point to the grid if no point of the grid is closer than the minimum distance.
+
+        Args:
+            point (list (float)): The coordinates of the point
+            cell (tuple (int)): The coordinates of the cell containing the point
+
+        Returns:
+            bool: True if the point was added, False if it was rejected
+        """
+        for offset in self.neighbour_offsets:
+            neighbours = self.cells.get(tuple(map(sum, zip(cell, offset))))
+            if neighbours is None:
+                continue
+            for neighbour in neighbours:
+                squared_distance = sum((coord - neighbour_coord) * (coord - neighbour_coord)
+                                       for coord, neighbour_coord in zip(point, neighbour))
+                if squared_distance < self.squared_min_distance:
+                    return False
+        self.cells.setdefault(cell, []).append(point)
+        return True
@@ -0,0 +1,183 @@
+"""Batched quaternion functions.
+
+Like in the vector_math module, quaternions are defined as q = (w, qx, qy, qz).
+The functions operate on numpy arrays of shape (n, 4) in a single vectorized call.
+Wherever two operands are combined, a single quaternion of shape (4,) is broadcast
+against the other operand.
+
+Vectors are rotated via rotation matrices. The matrix of a quaternion is calculated once,
+so rotating many vectors by the same quaternion costs a single matrix product
+instead of two quaternion products per vector.
+"""
+
+import numpy as np
+from random_geometry_points.validation import check_quaternion_array, check_vector_array, \
+  check_direction_vector_array, check_parameter_array, check_number_of_random_points
+from random_geometry_points.rng import create_random_generator
+
+def get_as_rotation_quaternion_array(axes, angles):
+    """Convert axes and angles into rotation quaternions.
+
+    Args:
+        axes (numpy.ndarray): Either a single rotation axis or an array of shape (n, 3)
+        angles (numpy.ndarray): Either a single rotation angle or an array of shape (n,)
+          for right-handed rotations
+
+    Returns:
+        numpy.ndarray: The rotation quaternions as array of shape (n, 4)
+    """
+    checked_axes = check_direction_vector_array(axes)
+    checked_angles = check_parameter_array(angles)
+    unit_axes = checked_axes / np.linalg.norm(checked_axes, axis=-1)[..., np.newaxis]
+    omegas = 0.5 * checked_angles[..., np.newaxis]
+    vector_parts = np.sin(omegas) * unit_axes
+    scalar_parts = np.broadcast_to(np.cos(omegas), vector_parts.shape[:-1] + (1,))
+    return np.concatenate((scalar_parts, vector_parts), axis=-1)
+
+def normalize_quaternion_array(quats):
+    """Normalize quaternions to unit quaternions.
+
+    Args:
+        quats (numpy.ndarray): The quaternions as array of shape (n, 4)
+
+    Returns:
+        numpy.ndarray: The unit quaternions as array of shape (n, 4)
+    """
+    return _normalize_array(check_quaternion_array(quats))
+
+def multiply_quaternion_array(quats1, quats2):
+    """Multiply quaternions row by row.
+
+    The product q1 * q2 is the rotation q2 followed by the rotation q1.
+
+    Args:
+        quats1 (numpy.ndarray): The first quaternions as array of shape (n, 4)
+        quats2 (numpy.ndarray): The second quaternions as array of shape (n, 4)
+
+    Returns:
+        numpy.ndarray: The products q1 * q2 as array of shape (n, 4)
+    """
+    return _multiply_array(check_quaternion_array(quats1), check_quaternion_array(quats2))
+
+def quaternion_to_matrix_array(quats):
+    """Convert rotation quaternions into rotation matrices.
+
+    The quaternions are normalized before the conversion.
+
+    Args:
+        quats (numpy.ndarray): The rotation quaternions as array of shape (n, 4) or (4,)
+
+    Returns:
+        numpy.ndarray: The rotation matrices as array of shape (n, 3, 3) or (3, 3)
+    """
+    return _to_matrix_array(_normalize_array(check_quaternion_array(quats)))
+
+def rotate_by_quaternion_array(vecs, quats):
+    """Rotate 3D vectors by rotation quaternions.
+
+    The quaternions are normalized before the rotation. This yields the same result
+    as rotate_vector of the vector_math module for the quaternions
+    created by get_as_rotation_quaternion.
+
+    Args:
+        vecs (numpy.ndarray): The vectors to be rotated as array of shape (n, 3)
+        quats (numpy.ndarray): Either a single rotation quaternion or an array of shape (n, 4)
+
+    Returns:
+        numpy.ndarray: The rotated vectors as array of shape (n, 3)
+    """
+    checked_vecs = check_vector_array(vecs)
+    matrices = _to_matrix_array(_normalize_array(check_quaternion_array(quats)))
+    if matrices.ndim == 2:
+        return checked_vecs @ matrices.T
+    return np.einsum("...ij,...j->...i", matrices, checked_vecs)
+
+def slerp_quaternion_array(quats1, quats2, fractions):
+    """Spherical linear interpolation between rotation quaternions.
+
+    The quaternions are normalized and the interpolation follows the shorter arc,
+    so the result is the rotation at the given fraction of the way from q1 to q2.
+
+    Args:
+        quats1 (numpy.ndarray): The start quaternions as array of shape (n, 4)
+        quats2 (numpy.ndarray): The end quaternions as array of shape (n, 4)
+        fractions (numpy.ndarray): Either a single interpolation fraction
+          or an array of shape (n,). 0 yields q1 and 1 yields q2.
+
+    Returns:
+        numpy.ndarray: The interpolated unit quaternions as array of shape (n, 4)
+    """
+    start = _normalize_array(check_quaternion_array(quats1))
+    end = _normalize_array(check_quaternion_array(quats2))
+    fractions = check_parameter_array(fractions)[..., np.newaxis]
+    cos_angles = np.einsum("...i,...i->...", start, end)[..., np.newaxis]
+    end = np.where(cos_angles < 0.0, -end, end)
+    cos_angles = np.abs(cos_angles)
+    angles = np.arccos(np.minimum(cos_angles, 1.0))
+    sin_angles = np.sin(angles)
+    # nearly identical quaternions are interpolated linearly to avoid dividing by ~0
+    nearly_parallel = sin_angles < 0.000001
+    safe_sin_angles = np.where(nearly_parallel, 1.0, sin_angles)
+    start_weights = np.where(nearly_parallel, 1.0 - fractions,
+                             np.sin((1.0 - fractions) * angles) / safe_sin_angles)
+    end_weights = np.where(nearly_parallel, fractions,
+                           np.sin(fractions * angles) / safe_sin_angles)
+    return _normalize_array(start_weights * start + end_weights * end)
+
+def create_random_rotation_quaternions(num_quaternions, seed=None):
+    """Create uniformly distributed random rotations as unit quaternions.
+
+    The quaternions are calculated from three uniform random numbers per rotation
+    (Shoemake's method), so the rotations are uniformly distributed over SO(3).
+
+    Args:
+        num_quaternions (int): The number of random rotations to be created
+        seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+          The seed of the random generator
+
+    Returns:
+        numpy.ndarray: The unit quaternions as array of shape (num_quaternions, 4)
+    """
+    check_number_of_random_points(num_quaternions)
+    rng = create_random_generator(seed)
+    (u_1, u_2, u_3) = rng.random((3, num_quaternions))
+    angles_2 = 2.0 * np.pi * u_2
+    angles_3 = 2.0 * np.pi * u_3
+    radius_1 = np.sqrt(1.0 - u_1)
+    radius_2 = np.sqrt(u_1)
+    return np.stack((radius_1 * np.sin(angles_2), radius_1 * np.cos(angles_2),
+                     radius_2 * np.sin(angles_3), radius_2 * np.cos(angles_3)), axis=-1)
+
+def _normalize_array(quats):
+    """Unchecked version of normalize_quaternion_array.
+    """
+    magnitudes = np.linalg.norm(quats, axis=-1)[..., np.newaxis]
+    if np.any(magnitudes <= 0.000001):
+        raise ValueError("Inproper quaternion. Expected a magnitude greater than 0.")
+    return quats / magnitudes
+
+def _multiply_array(quats1, quats2):
+    """Unchecked version of multiply_quaternion_array.
+    """
+    (qw1, qx1, qy1, qz1) = np.moveaxis(quats1, -1, 0)
+    (qw2, qx2, qy2, qz2) = np.moveaxis(quats2, -1, 0)
+    return np.stack((qw1*qw2 - qx1*qx2 - qy1*qy2 - qz1*qz2,
+                     qw1*qx2 + qx1*qw2 + qy1*qz2 - qz1*qy2,
+                     qw1*qy2 - qx1*qz2 + qy1*qw2 + qz1*qx2,
+                     qw1*qz2 + qx1*qy2 - qy1*qx2 + qz1*qw2), axis=-1)
+
+def _to_matrix_array(quats):
+    """Unchecked version of quaternion_to_matrix_array. The quaternions must be normalized.
+    """
+    (q_w, q_x, q_y, q_z) = np.moveaxis(quats, -1, 0)
+    matrices = np.empty(quats.shape[:-1] + (3, 3))
+    matrices[..., 0, 0] = 1.0 - 2.0 * (q_y*q_y + q_z*q_z)
+    matrices[..., 0, 1] = 2.0 * (q_x*q_y - q_z*q_w)
+    matrices[..., 0, 2] = 2.0 * (q_x*q_z + q_y*q_w)
+    matrices[..., 1, 0] = 2.0 * (q_x*q_y + q_z*q_w)
+    matrices[..., 1, 1] = 1.0 - 2.0 * (q_x*q_x + q_z*q_z)
+    matrices[..., 1, 2] = 2.0 * (q_y*q_z - q_x*q_w)
+    matrices[..., 2, 0] = 2.0 * (q_x*q_z - q_y*q_w)
+    matrices[..., 2, 1] = 2.0 * (q_y*q_z + q_x*q_w)
+    matrices[..., 2, 2] = 1.0 - 2.0 * (q_x*q_x + q_y*q_y)
+    return matrices
@@ -0,0 +1,59 @@
+"""Batched rejection sampling.
+
+Proposals are drawn and accepted in vectorized batches. The size of each batch is
+calculated from the expected acceptance rate and, after the first batch,
+from the acceptance rate observed so far, with a margin of three standard deviations.
+So usually a single batch yields all samples and the excess of discarded
+proposals stays small.
+"""
+
+import math
+import numpy as np
+
+def draw_with_rejection(rng, num_samples, propose, calc_acceptance_probabilities,
+                        expected_acceptance_rate):
+    """Draw samples by batched rejection of proposals.
+
+    Args:
+        rng (numpy.random.Generator): The random generator
+        num_samples (int): The number of samples to be drawn
+        propose (callable): Called with the random generator and a batch size,
+          returns the proposals as array whose first axis has the length of the batch size
+        calc_acceptance_probabilities (callable): Called with the proposals,
+          returns the probability in [0, 1] to accept each proposal as array of shape (n,)
+        expected_acceptance_rate (float): The expected fraction of accepted proposals
+
+    Returns:
+        numpy.ndarray: The num_samples accepted proposals
+    """
+    samples = None
+    num_drawn = 0
+    (num_proposed, num_accepted) = (0, 0)
+    while num_drawn < num_samples:
+        acceptance_rate = num_accepted / num_proposed if num_accepted > 0 \
+          else expected_acceptance_rate
+        batch_size = _calc_batch_size(num_samples - num_drawn, acceptance_rate)
+        proposals = propose(rng, batch_size)
+        accepted = proposals[rng.random(batch_size) < calc_acceptance_probabilities(proposals)]
+        num_proposed += batch_size
+        num_accepted += len(accepted)
+        if samples is None:
+            samples = np.empty((num_samples,) + proposals.shape[1:])
+        accepted = accepted[:num_samples - num_drawn]
+        samples[num_drawn:num_drawn + len(accepted)] = accepted
+        num_drawn += len(accepted)
+    return samples if samples is not None else np.empty((0,))
+
+def _calc_batch_size(num_samples, acceptance_rate):
+    """Calculate the number of proposals that yield num_samples samples with high probability.
+
+    Args:
+        num_samples (int): The number of samples still needed
+        acceptance_rate (float): The estimated fraction of accepted proposals
+
+    Returns:
+        int: The batch size
+    """
+    acceptance_rate = min(max(acceptance_rate, 0.01), 1.0)
+    margin = 3.0 * math.sqrt(num_samples * (1.0 - acceptance_rate))
+    return int(math.ceil((num_samples + margin) / acceptance_rate))
@@ -0,0 +1,73 @@
+"""Random number generators for the geometry classes.
+
+Each geometry object owns a numpy random generator, so the created points are
+reproducible per object and objects used in different threads do not share any state.
+Statistically independent child generators are derived via numpy's SeedSequence spawning
+from entropy drawn from the parent generator, which makes sharded jobs reproducible as well.
+"""
+
+import numpy as np
+from random_geometry_points.validation import check_seed, check_count
+
+ENTROPY_WORDS = 4
+
+def create_random_generator(seed=None):
+    """Create a numpy random generator from a seed.
+
+    Args:
+        seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+          The seed of the generator. None creates a generator with fresh entropy
+          from the operating system. A Generator is used as it is.
+
+    Returns:
+        numpy.random.Generator: The random generator
+    """
+    return np.random.default_rng(check_seed(seed))
+
+def spawn_random_generators(generator, num_generators):
+    """Create statistically independent child generators of a random generator.
+
+    A SeedSequence is created from 128 bits of entropy drawn from the parent generator
+    and the child generators are derived from its spawned sequences. This works with
+    the public numpy API of all supported versions, but advances the state of the parent.
+    So for a seeded parent the children are reproducible and each call creates
+    new children that are independent of the previously spawned ones.
+
+    Args:
+        generator (numpy.random.Generator): The parent random generator
+        num_generators (int): The number of child generators to be created
+
+    Returns:
+        list (numpy.random.Generator): The child generators
+    """
+    check_count(num_generators, "generators")
+    seed_sequence = create_seed_sequence(generator)
+    return [create_child_generator(generator, child_sequence)
+            for child_sequence in seed_sequence.spawn(num_generators)]
+
+def create_seed_sequence(generator):
+    """Create a SeedSequence from 128 bits of entropy drawn from a random generator.
+
+    Spawning child sequences one after the other yields the same sequences as spawning
+    them at once, so child generators can also be created lazily.
+
+    Args:
+        generator (numpy.random.Generator): The parent random generator
+
+    Returns:
+        numpy.random.SeedSequence: The seed sequence to spawn child sequences from
+    """
+    entropy = generator.integers(0, 2**32, size=ENTROPY_WORDS, dtype=np.uint64)
+    return np.random.SeedSequence(entropy.tolist())
+
+def create_child_generator(generator, seed_sequence):
+    """Create a random generator with the bit generator type of a parent generator.
+
+    Args:
+        generator (numpy.random.Generator): The parent random generator
+        seed_sequence (numpy.random.SeedSequence): The seed sequence of the child generator
+
+    Returns:
+        numpy.random.Generator: The child generator
+    """
+    return np.random.Generator(type(generator.bit_generator)(seed_sequence))
@@ -0,0 +1,156 @@
+"""Random points on a scene of several geometries.
+
+This module provides methods to generate an arbitrary number of points lying on
+a collection of geometry objects, e.g. a simulated scene consisting of many primitives.
+
+Examples:
+    For examples of the usage of this class see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/scene_test.py
+"""
+
+import numpy as np
+from random_geometry_points.geometry import Geometry, DEFAULT_CHUNK_SIZE
+from random_geometry_points.validation import check_weight_array
+from random_geometry_points.rng import spawn_random_generators
+
+CHUNK_POINTS_PER_GEOMETRY = 128
+
+class Scene(Geometry):
+    """Class to generate random points lying on a collection of geometries.
+
+    Each point is assigned to one of the geometries with a probability proportional
+    to the weight of the geometry. By default the weights are the measures of the geometries,
+    so the points are uniformly distributed over the whole scene as long as all geometries
+    are curves or all geometries are surfaces.
+
+    The number of points per geometry is drawn with a single multinomial draw per chunk,
+    then the points of each geometry are created in one batch. Within a chunk the points
+    are ordered by geometry, in the order of the geometries. The instrumentation of a scene
+    measures the multinomial draw as rng stage and the point creation of the geometries
+    as transform stage.
+
+    The default chunk size grows with the number of geometries (CHUNK_POINTS_PER_GEOMETRY
+    points per geometry), so the per-geometry overhead of each chunk stays small
+    for scenes of thousands of geometries.
+
+    The scene creates the points with copies of the geometries whose random generators
+    are spawned from the random generator of the scene. The noise of each geometry is applied
+    to its points, the noise of the scene to all points. So a seeded scene is reproducible
+    and the geometry objects passed in are not modified.
+    """
+
+    def __init__(self, geometries, weights=None, seed=None):
+        """Scene constructor
+
+        Args:
+            geometries (list (Geometry)): The geometries of the scene.
+              All geometries must create points of the same dimension.
+            weights (numpy.ndarray): The optional non-negative weights of the geometries
+              as array of shape (len(geometries),). Defaults to the measures of the geometries.
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
+        """
+        super().__init__(seed)
+        self.geometries = _check_geometries(geometries)
+        self.dimension = self.geometries[0].dimension
+        self.chunk_size = max(DEFAULT_CHUNK_SIZE, CHUNK_POINTS_PER_GEOMETRY * len(self.geometries))
+        if weights is None:
+            weights = [geometry.measure for geometry in self.geometries]
+        self.weights = check_weight_array(weights)
+        if len(self.weights) != len(self.geometries):
+            raise ValueError("Inproper number of weights. Expected one weight per geometry.")
+        self.probabilities = self.weights / np.sum(self.weights)
+        self._parts = None
+        self.spawn_geometries()
+
+    def with_random_generator(self, generator):
+        """Create a copy of the scene that uses the given random generator.
+
+        The copies of the geometries are recreated with random generators
+        spawned from the new random generator.
+
+        Args:
+            generator (numpy.random.Generator): The random generator of the copy
+
+        Returns:
+            Scene: The copy of the scene
+        """
+        child = super().with_random_generator(generator)
+        child.spawn_geometries()
+        return child
+
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
+
+        Returns:
+            float: The sum of the measures of all geometries
+        """
+        return sum(geometry.measure for geometry in self.geometries)
+
+    def spawn_geometries(self):
+        """Recreate the copies of the geometries the points are created with.
+
+        The random generators of the copies are spawned from the scene's random generator,
+        so this is called again whenever the random generator of the scene is replaced.
+        """
+        parts = []
+        generators = spawn_random_generators(self.rng, len(self.geometries))
+        for geometry, generator in zip(self.geometries, generators):
+            part = geometry.with_random_generator(generator)
+            part.instrumentation = None
+            part.max_points = None
+            parts.append(part)
+        self._parts = parts
+
+    def _draw_random_numbers(self, num_points):
+        """Draw the number of points per geometry.
+
+        Args:
+            num_points (int): The number of points
+
+        Returns:
+            list (int): The number of points of each geometry
+        """
+        return self.rng.multinomial(num_points, self.probabilities).tolist()
+
+    def _transform(self, random_numbers, points):
+        """Create the points of all geometries with at least one point.
+
+        The geometries create their points through their public point creation method,
+        so their own random numbers, transformation and noise are applied.
+
+        Args:
+            random_numbers (list (int)): The number of points of each geometry
+              drawn by _draw_random_numbers
+            points (numpy.ndarray): A float64 array of shape (n, dimension) that is overwritten
+        """
+        start = 0
+        for part, count in zip(self._parts, random_numbers):
+            if count > 0:
+                part.create_random_points_array(count, out=points[start:start + count])
+                start += count
+
+def _check_geometries(geometries):
+    """Check the geometries of a scene.
+
+    Args:
+        geometries (any): The geometries to be checked
+
+    Raises:
+        TypeError: Signals that geometries is not a list or tuple of Geometry objects
+        ValueError: Signals that the list is empty or that the geometries
+          create points of different dimensions
+
+    Returns:
+        list (Geometry): The checked geometries
+    """
+    if not isinstance(geometries, (list, tuple)):
+        raise TypeError("Inproper type for geometries. Expected list or tuple.")
+    elif not geometries:
+        raise ValueError("Inproper number of geometries. Expected at least one geometry.")
+    elif not all(isinstance(geometry, Geometry) for geometry in geometries):
+        raise TypeError("Inproper type for geometry. Expected Geometry objects.")
+    elif len(set(geometry.dimension for geometry in geometries)) != 1:
+        raise ValueError("Inproper geometries. Expected geometries of the same dimension.")
+    return list(geometries)
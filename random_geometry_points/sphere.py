@@ -8,9 +8,14 @@ Examples:
 """
 
 import math
-import random
+import numpy as np
 from random_geometry_points.geometry import Geometry
-from random_geometry_points.validation import check_geometry_parameter, check_radius
+from random_geometry_points.validation import check_geometry_parameter, check_radius, \
+  check_option, check_angle_range, check_direction_vector
+from random_geometry_points.vector_math import _normalize, _orthonormal_basis
+
+UNIFORM = "uniform"
+AZIMUTH_ZENITH = "azimuth_zenith"
 
 class Sphere(Geometry):
     """Class to generate random points lying on a sphere.
@@ -24,9 +29,22 @@ class Sphere(Geometry):
 
     In the above equation "x", "y" and "z" represent the coordinates
     of an arbitrary point on the sphere.
+
+    Each created point is represented by its x, y and z coordinate, in this order.
+
+    By default the random points are uniformly distributed over the sphere surface.
+    The distribution "azimuth_zenith" draws the azimuth and the zenith angle uniformly instead,
+    which clusters the points at the poles. It is only kept for reproducing older results.
+
+    The points can be restricted to a window of azimuth and zenith angles. The angles are
+    measured in a frame whose polar axis is the given axis (the z axis by default).
+    The window is sampled directly by drawing the azimuth uniformly within its range and
+    the cosine of the zenith uniformly between the cosines of the zenith range.
+    A spherical cap is the window with the zenith range (0, half_angle) around its axis.
     """
 
-    def __init__(self, center_x, center_y, center_z, radius):
+    def __init__(self, center_x, center_y, center_z, radius, distribution=UNIFORM, seed=None,
+                 azimuth_range=None, zenith_range=None, axis=None):
         """Sphere constructor
 
         Args:
@@ -34,74 +52,123 @@ class Sphere(Geometry):
             center_y (float): The y coordinate of the sphere center point
             center_z (float): The z coordinate of the sphere center point
             radius (float): The radius of the sphere
+            distribution (str): The distribution of the random points.
+              Either "uniform" (default) or "azimuth_zenith"
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
+            azimuth_range (tuple (float, float)): The optional range of the azimuth angles
+              (radiant) within [-2 * pi, 2 * pi] with a width of at most 2 * pi.
+              Defaults to (0, 2 * pi).
+            zenith_range (tuple (float, float)): The optional range of the zenith angles
+              (radiant) within [0, pi]. Defaults to (0, pi).
+            axis (tuple (float, float, float)): The optional polar axis the zenith angles
+              are measured from. Defaults to the z axis.
         """
+        super().__init__(seed)
         self.center_x = check_geometry_parameter(center_x)
         self.center_y = check_geometry_parameter(center_y)
         self.center_z = check_geometry_parameter(center_z)
         self.radius = check_radius(radius)
-
-    def create_random_points(self, num_points):
-        """Create a list of num_points random points that lie on the sphere.
+        self.distribution = check_option(distribution, (UNIFORM, AZIMUTH_ZENITH))
+        self.azimuth_range = (0.0, 2.0 * math.pi) if azimuth_range is None \
+          else check_angle_range(azimuth_range, -2.0 * math.pi, 2.0 * math.pi)
+        if self.azimuth_range[1] - self.azimuth_range[0] > 2.0 * math.pi:
+            raise ValueError("Inproper azimuth range. Expected a width of at most 2 * pi.")
+        self.zenith_range = (0.0, math.pi) if zenith_range is None \
+          else check_angle_range(zenith_range, 0.0, math.pi)
+        self.axis = None if axis is None else _normalize(check_direction_vector(axis))
+        self.frame = None
+        if self.axis is not None:
+            self.frame = _orthonormal_basis(self.axis) + (self.axis,)
+
+    @classmethod
+    def from_cap(cls, center_x, center_y, center_z, radius, axis, half_angle, seed=None):
+        """Factory method to create a sphere whose points lie within a spherical cap.
 
         Args:
-            num_points (int): The number of random points to be created. Maximum value is 99999.
+            center_x (float): The x coordinate of the sphere center point
+            center_y (float): The y coordinate of the sphere center point
+            center_z (float): The z coordinate of the sphere center point
+            radius (float): The radius of the sphere
+            axis (tuple (float, float, float)): The direction from the center
+              to the center of the cap
+            half_angle (float): The angle (radiant) between the axis and the rim of the cap
+              within (0, pi]
+            seed (None, int, numpy.random.SeedSequence or numpy.random.Generator):
+              The seed of the random generator used to create the points
 
         Returns:
-            list (tuple (float, float, float)): A list of randomly generated points.
+            Sphere: The sphere object
+        """
+        return cls(center_x, center_y, center_z, radius, seed=seed,
+                   zenith_range=(0.0, half_angle), axis=axis)
 
-            The returned list contains num_points tuples.
+    @property
+    def measure(self):
+        """Get the size of the set the points are created on.
 
-            Each tuple represents a point lying on the sphere.
-            The first tuple-value is the x coordinate.
-            The second tuple-value is the y coordinate.
-            The third tuple-value is the z coordinate.
+        Returns:
+            float: The surface area of the sphere within the azimuth and zenith window
         """
-        super().create_random_points(num_points)
-        polar_coords = [_create_random_azimuth_zenith() for n in range(0, num_points)]
-        return [self._create_sphere_point(az_ze[0], az_ze[1]) for az_ze in polar_coords]
+        azimuth_width = self.azimuth_range[1] - self.azimuth_range[0]
+        zenith_width = math.cos(self.zenith_range[0]) - math.cos(self.zenith_range[1])
+        return azimuth_width * zenith_width * self.radius**2
 
-    def create_random_point_generator(self, num_points):
-        """Create a generator to generate num_points random points that lie on the sphere.
+    def offset_along_normals(self, points, offsets):
+        """Shift the points along the sphere normals in place by scaling their distance
+        from the center.
 
         Args:
-            num_points (int): The number of random points to be created.
-
-        Yields:
-            tuple (float, float, float): The next random point.
-
-            Each tuple represents a point lying on the sphere.
-            The first tuple-value is the x coordinate.
-            The second tuple-value is the y coordinate.
-            The third tuple-value is the z coordinate.
+            points (numpy.ndarray): A float64 array of shape (n, 3) of points on the sphere
+            offsets (numpy.ndarray): The offsets as array of shape (n,)
         """
-        _ = [_ for _ in super().create_random_point_generator(num_points)]
-        polar_coords = [_create_random_azimuth_zenith() for n in range(0, num_points)]
-        return (self._create_sphere_point(az_ze[0], az_ze[1]) for az_ze in polar_coords)
+        center = (self.center_x, self.center_y, self.center_z)
+        points -= center
+        points *= (1.0 + offsets / self.radius)[:, np.newaxis]
+        points += center
 
-    def _create_sphere_point(self, azimuth, zenith):
-        """Create a 3D cartesian point using the sphere parameters and the given angles.
+    def _draw_random_numbers(self, num_points):
+        """Draw the random angles of num_points points on the sphere.
+
+        For the uniform distribution the cosine of the zenith angle is drawn uniformly
+        between the cosines of the zenith range, which yields points that are uniformly
+        distributed by area. Without a window this is the range [-1, 1].
 
         Args:
-            azimuth (float): The azimuth angle (radiant) for which
-              the cartesian coordinates shall be calculated
-            zenith (float): The zenith angle (radiant) for which
-              the cartesian coordinates shall be calculated
+            num_points (int): The number of points
 
         Returns:
-            tuple (float, float, float): The cartesian coordinates corresponding to the input angle
+            tuple (numpy.ndarray, numpy.ndarray): The random azimuth angles and either
+              the cosines of the zenith angles or the zenith angles, depending on the distribution
         """
-        x_from_angle = lambda az, ze: self.radius * math.sin(ze) * math.cos(az) + self.center_x
-        y_from_angle = lambda az, ze: self.radius * math.sin(ze) * math.sin(az) + self.center_y
-        z_from_angle = lambda az, ze: self.radius * math.cos(ze) + self.center_z
-        return (x_from_angle(azimuth, zenith), y_from_angle(azimuth, zenith),
-                z_from_angle(azimuth, zenith))
+        azimuth = self.rng.uniform(self.azimuth_range[0], self.azimuth_range[1], num_points)
+        (min_zenith, max_zenith) = self.zenith_range
+        if self.distribution == UNIFORM:
+            return (azimuth, self.rng.uniform(math.cos(max_zenith), math.cos(min_zenith),
+                                              num_points))
+        return (azimuth, self.rng.uniform(min_zenith, max_zenith, num_points))
 
-def _create_random_azimuth_zenith():
-    """Create random values for azimuth and zenith in radiant.
+    def _transform(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the points on the sphere.
 
-    Returns:
-        tuple (float, float): Random values (radiant) for azimuth and zenith
-    """
-    azimuth = random.uniform(0.0, 2.0 * math.pi)
-    zenith = random.uniform(0.0, math.pi)
-    return (azimuth, zenith)
+        Args:
+            random_numbers (tuple (numpy.ndarray, numpy.ndarray)): The random numbers
+              drawn by _draw_random_numbers
+            points (numpy.ndarray): A float64 array of shape (n, 3) that is overwritten
+        """
+        (azimuth, zenith_param) = random_numbers
+        if self.distribution == UNIFORM:
+            cos_zenith = zenith_param
+            sin_zenith = np.sqrt(1.0 - cos_zenith**2)
+        else:
+            cos_zenith = np.cos(zenith_param)
+            sin_zenith = np.sin(zenith_param)
+        np.cos(azimuth, out=points[:, 0])
+        np.sin(azimuth, out=points[:, 1])
+        points[:, 0] *= sin_zenith
+        points[:, 1] *= sin_zenith
+        points[:, 2] = cos_zenith
+        if self.frame is not None:
+            np.matmul(points.copy(), self.frame, out=points)
+        points *= self.radius
+        points += (self.center_x, self.center_y, self.center_z)
@@ -0,0 +1,80 @@
+"""Asynchronous streaming of random points.
+
+The chunks of random points are created in a worker thread and passed to the
+event loop through a bounded queue. So the point creation overlaps with the consumers
+of the chunks without blocking the event loop, and a slow consumer pauses the worker
+thread as soon as the queue is full (backpressure).
+"""
+
+import asyncio
+import threading
+
+_END_OF_STREAM = object()
+_POLL_INTERVAL = 0.1
+
+async def stream_chunks(chunks, max_queued_chunks):
+    """Iterate a synchronous chunk generator in a worker thread and yield its chunks.
+
+    The worker thread stops when the iteration stops or the event loop is closed.
+
+    Args:
+        chunks (generator (numpy.ndarray)): The generator creating the chunks
+        max_queued_chunks (int): The maximum number of chunks created in advance
+
+    Yields:
+        numpy.ndarray: The next chunk
+    """
+    loop = asyncio.get_event_loop()
+    queue = asyncio.Queue()
+    free_slots = threading.Semaphore(max_queued_chunks)
+    stopped = threading.Event()
+    finished = loop.create_future()
+
+    def put(item):
+        """Pass an item to the event loop. Returns False if the event loop is closed.
+        """
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            return False
+        return True
+
+    def wait_for_free_slot():
+        """Wait until the consumer took a chunk. Returns False if the stream stopped.
+        """
+        while not free_slots.acquire(timeout=_POLL_INTERVAL):
+            if stopped.is_set() or loop.is_closed():
+                return False
+        return not stopped.is_set()
+
+    def produce():
+        """Create the chunks in the worker thread until all are created or the stream stops.
+        """
+        try:
+            for chunk in chunks:
+                if not wait_for_free_slot() or not put(chunk):
+                    return
+            put(_END_OF_STREAM)
+        except Exception as exc: # pylint: disable=broad-except
+            put(exc)
+        finally:
+            if not loop.is_closed():
+                try:
+                    loop.call_soon_threadsafe(finished.set_result, None)
+                except RuntimeError:
+                    pass
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END_OF_STREAM:
+                break
+            elif isinstance(item, Exception):
+                raise item
+            free_slots.release()
+            yield item
+    finally:
+        stopped.set()
+        free_slots.release()
+        await finished
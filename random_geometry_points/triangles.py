@@ -0,0 +1,157 @@
+"""Random points on a set of triangles and triangulation of polygons.
+
+The triangles are used by the geometries whose surface consists of triangles,
+i.e. triangle meshes and polygon planes. Each point is assigned to a triangle with
+a probability proportional to the triangle area by an alias table. Within the triangle
+a point is
+
+    corner_a + u * (corner_b - corner_a) + v * (corner_c - corner_a)
+
+with (u, v) uniform in the unit square, folded into the triangle if u + v > 1.
+
+Examples:
+    For examples of the usage of this module see:
+    https://github.com/brauls/random-geometry-points/blob/master/test/triangles_test.py
+"""
+
+import numpy as np
+from random_geometry_points.validation import check_point_array
+from random_geometry_points.alias_table import AliasTable
+
+class Triangles:
+    """Class to create uniformly distributed random points on a set of triangles.
+
+    The edge vectors, the areas and the alias table of the triangles are calculated once.
+    """
+
+    def __init__(self, corners_a, corners_b, corners_c):
+        """Triangles constructor
+
+        Args:
+            corners_a (numpy.ndarray): The first corner of each triangle as array of shape (m, 3)
+            corners_b (numpy.ndarray): The second corner of each triangle as array of shape (m, 3)
+            corners_c (numpy.ndarray): The third corner of each triangle as array of shape (m, 3)
+
+        Raises:
+            ValueError: Signals that the corner arrays differ in length
+              or that the total area of the triangles is zero
+        """
+        self.corners = check_point_array(corners_a, 3)
+        corners_b = check_point_array(corners_b, 3)
+        corners_c = check_point_array(corners_c, 3)
+        if not len(self.corners) == len(corners_b) == len(corners_c):
+            raise ValueError("Inproper triangle corners. Expected three corners per triangle.")
+        self.edges_ab = corners_b - self.corners
+        self.edges_ac = corners_c - self.corners
+        self.areas = 0.5 * np.linalg.norm(np.cross(self.edges_ab, self.edges_ac), axis=1)
+        self.area = float(np.sum(self.areas))
+        if not self.area > 0.0:
+            raise ValueError("Inproper triangles. Expected a total area greater than zero.")
+        self.alias_table = AliasTable(self.areas)
+
+    def __len__(self):
+        """Get the number of triangles.
+
+        Returns:
+            int: The number of triangles
+        """
+        return len(self.corners)
+
+    def draw_random_numbers(self, rng, num_points):
+        """Draw the random triangles and barycentric parameters of num_points points.
+
+        Args:
+            rng (numpy.random.Generator): The random generator
+            num_points (int): The number of points
+
+        Returns:
+            tuple (numpy.ndarray, numpy.ndarray): The random triangle indices
+              and the barycentric parameters (u, v) as array of shape (2, n)
+        """
+        triangles = self.alias_table.draw(rng, num_points)
+        return (triangles, rng.random((2, num_points)))
+
+    def fill_points(self, random_numbers, points):
+        """Calculate the cartesian coordinates of the random points on the triangles.
+
+        Args:
+            random_numbers (tuple (numpy.ndarray, numpy.ndarray)):
+              The random numbers drawn by draw_random_numbers. They are modified.
+            points (numpy.ndarray): A float64 array of shape (n, 3) that is overwritten
+        """
+        (triangles, barycentric) = random_numbers
+        outside = np.sum(barycentric, axis=0) > 1.0
+        barycentric[:, outside] = 1.0 - barycentric[:, outside]
+        (u_params, v_params) = barycentric
+        np.multiply(self.edges_ab[triangles], u_params[:, np.newaxis], out=points)
+        points += self.edges_ac[triangles] * v_params[:, np.newaxis]
+        points += self.corners[triangles]
+
+def triangulate_polygon(coords):
+    """Triangulate a simple polygon by ear clipping.
+
+    Args:
+        coords (numpy.ndarray): The 2D coordinates of the polygon vertices as array of shape (n, 2)
+
+    Raises:
+        ValueError: Signals that the polygon is not simple
+
+    Returns:
+        numpy.ndarray: The vertex indices of the triangles as array of shape (n - 2, 3)
+    """
+    signed_area = np.sum(coords[:, 0] * np.roll(coords[:, 1], -1)
+                         - np.roll(coords[:, 0], -1) * coords[:, 1])
+    indices = list(range(len(coords)))
+    if signed_area < 0.0:
+        indices.reverse()
+    triangles = []
+    while len(indices) > 3:
+        ear = _find_ear(coords, indices)
+        triangles.append((indices[ear - 1], indices[ear], indices[(ear + 1) % len(indices)]))
+        del indices[ear]
+    triangles.append(tuple(indices))
+    return np.array(triangles, dtype=np.int64)
+
+def _find_ear(coords, indices):
+    """Find a vertex of a counterclockwise polygon whose triangle with its neighbors
+    lies inside the polygon. Collinear vertices are clipped if there is no other ear.
+
+    Args:
+        coords (numpy.ndarray): The 2D coordinates of all vertices
+        indices (list (int)): The indices of the remaining polygon vertices in order
+
+    Raises:
+        ValueError: Signals that no ear was found, i.e. the polygon is not simple
+
+    Returns:
+        int: The position of the ear in indices
+    """
+    collinear = None
+    for position in range(len(indices)):
+        corner_a = coords[indices[position - 1]]
+        corner_b = coords[indices[position]]
+        corner_c = coords[indices[(position + 1) % len(indices)]]
+        turn = _cross_2d(corner_b - corner_a, corner_c - corner_b)
+        if turn <= 0.0:
+            tolerance = 1e-12 * np.linalg.norm(corner_b - corner_a) \
+              * np.linalg.norm(corner_c - corner_b)
+            if collinear is None and abs(turn) <= tolerance:
+                collinear = position
+            continue
+        others = coords[[index for index in indices if index not in
+                         (indices[position - 1], indices[position],
+                          indices[(position + 1) % len(indices)])]]
+        # vertices on the border of the triangle block the ear as well
+        inside = (_cross_2d(corner_b - corner_a, others - corner_a) >= 0.0) & \
+          (_cross_2d(corner_c - corner_b, others - corner_b) >= 0.0) & \
+          (_cross_2d(corner_a - corner_c, others - corner_c) >= 0.0)
+        if not np.any(inside):
+            return position
+    if collinear is None:
+        raise ValueError("Inproper polygon. Expected a simple polygon.")
+    return collinear
+
+def _cross_2d(vecs1, vecs2):
+    """Calculate the z component of the cross products of 2D vectors.
+    """
+    return vecs1[..., 0] * vecs2[..., 1] - vecs1[..., 1] * vecs2[..., 0]
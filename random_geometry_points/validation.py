@@ -3,27 +3,137 @@
 
 import math
 from functools import reduce
+import numpy as np
 
-def check_number_of_random_points(num_points):
+def check_number_of_random_points(num_points, max_points=None):
     """Check the number of random points to create for a geometry.
-    The number of points must be of type int and its value must be
-    greater than zero and less than 100000.
+    The number of points must be of type int and its value must be greater than zero.
+    If max_points is given, the value must not exceed it.
 
     Args:
         num_points (any): The parameter whose type and value shall be checked
+        max_points (int): The optional upper limit for the number of points
 
     Raises:
         TypeError: Signals that param is not of type int
-        ValueError: Signals that param's value is either less/equal 0.0 or greater/equal 10000
+        ValueError: Signals that param's value is either less/equal 0 or greater than max_points
     """
     if not isinstance(num_points, int):
         raise TypeError("Inproper type for number of points. Expected int.")
     elif num_points <= 0:
         raise ValueError("""Inproper value for number of points.
         Expected a value greater than zero""")
-    elif num_points >= 100000:
+    elif max_points is not None and num_points > max_points:
         raise ValueError("""Inproper value for number of points.
-        Expected a value less than 100000""")
+        Expected a value less/equal """ + str(max_points))
+
+def check_chunk_size(chunk_size):
+    """Check the number of random points that are created at once.
+    The chunk size must be of type int and its value must be greater than zero.
+
+    Args:
+        chunk_size (any): The parameter whose type and value shall be checked
+
+    Raises:
+        TypeError: Signals that param is not of type int or is a bool
+        ValueError: Signals that param's value is less/equal 0
+
+    Returns:
+        int: The checked chunk size
+    """
+    return check_count(chunk_size, "points per chunk")
+
+def check_count(count, name):
+    """Check a count parameter like a number of workers or generators.
+    The count must be of type int and its value must be greater than zero.
+
+    Args:
+        count (any): The parameter whose type and value shall be checked
+        name (str): The name of the counted items used in the error messages
+
+    Raises:
+        TypeError: Signals that param is not of type int or is a bool
+        ValueError: Signals that param's value is less/equal 0
+
+    Returns:
+        int: The checked count
+    """
+    if not isinstance(count, int) or isinstance(count, bool):
+        raise TypeError("Inproper type for number of " + name + ". Expected int.")
+    elif count <= 0:
+        raise ValueError("Inproper value for number of " + name +
+                         ". Expected a value greater than zero")
+    return count
+
+def check_seed(seed):
+    """Check the seed of a random generator.
+    The seed must either be None, a non-negative int,
+    a numpy SeedSequence or a numpy Generator.
+
+    Args:
+        seed (any): The parameter whose type and value shall be checked
+
+    Raises:
+        TypeError: Signals that seed is of none of the supported types
+        ValueError: Signals that seed is a negative int
+
+    Returns:
+        any: The checked seed
+    """
+    if seed is None or isinstance(seed, (np.random.SeedSequence, np.random.Generator)):
+        return seed
+    elif not isinstance(seed, int) or isinstance(seed, bool):
+        raise TypeError("Inproper type for seed. Expected None, int, SeedSequence or Generator.")
+    elif seed < 0:
+        raise ValueError("Inproper value for seed. Expected a value greater/equal zero")
+    return seed
+
+def check_output_buffer(out, num_points, dimension):
+    """Check the output buffer for num_points random points of the given dimension.
+
+    The buffer may either be a float64 numpy array of shape (num_points, dimension)
+    or any writable object supporting the buffer protocol, e.g. an array.array of type "d"
+    or a bytearray, whose size matches num_points * dimension float64 values.
+
+    Args:
+        out (any): The output buffer to be checked
+        num_points (int): The number of points to be written into the buffer
+        dimension (int): The number of coordinates of each point
+
+    Raises:
+        TypeError: Signals that out does not support the buffer protocol
+          or that its elements are not of type float64
+        ValueError: Signals that out is read-only or that its size does not match
+
+    Returns:
+        numpy.ndarray: A float64 array of shape (num_points, dimension) sharing its memory with out
+    """
+    if isinstance(out, np.ndarray):
+        array = out
+    else:
+        try:
+            array = np.asarray(memoryview(out))
+        except TypeError as error:
+            raise TypeError("Inproper type for output buffer. Expected a buffer protocol object.") \
+              from error
+        if not array.flags.c_contiguous:
+            raise ValueError("Inproper output buffer. Expected a contiguous buffer.")
+        array = array.reshape(-1)
+        if array.dtype == np.uint8:
+            if array.size != num_points * dimension * 8:
+                raise ValueError("Inproper output buffer size. Expected " +
+                                 str(num_points * dimension * 8) + " bytes.")
+            array = array.view(np.float64)
+    if array.dtype != np.float64:
+        raise TypeError("Inproper output buffer type. Expected float64 elements.")
+    elif not array.flags.writeable:
+        raise ValueError("Inproper output buffer. Expected a writable buffer.")
+    elif array.shape == (num_points, dimension):
+        return array
+    elif array.ndim == 1 and array.flags.c_contiguous and array.size == num_points * dimension:
+        return array.reshape(num_points, dimension)
+    raise ValueError("Inproper output buffer size. Expected shape (" +
+                     str(num_points) + ", " + str(dimension) + ").")
 
 def check_geometry_parameter(param):
     """Check the type of one geometry parameter to be float or int.
@@ -62,9 +172,144 @@ def check_radius(radius):
     Returns:
         float: The checked parameter parsed to float
     """
-    param = check_geometry_parameter(radius)
-    if param <= 0.0:
-        raise ValueError("Inproper radius value. Expected a value greater than zero.")
+    return check_positive(radius, "radius")
+
+def check_height(height):
+    """Check the type of the height parameter to be float or int.
+    Furthermore check that the height value is greater than zero.
+
+    Args:
+        height (any): The parameter whose type and value shall be checked
+
+    Raises:
+        TypeError: Signals that param is neither of type int nor float
+        ValueError: Signals that param's value is Inf, NaN or less/equal 0.0
+
+    Returns:
+        float: The checked parameter parsed to float
+    """
+    return check_positive(height, "height")
+
+def check_positive(param, name):
+    """Check a parameter like a standard deviation to be a float or int greater than zero.
+
+    Args:
+        param (any): The parameter whose type and value shall be checked
+        name (str): The name of the parameter used in the error messages
+
+    Raises:
+        TypeError: Signals that param is neither of type int nor float
+        ValueError: Signals that param's value is Inf, NaN or less/equal 0.0
+
+    Returns:
+        float: The checked parameter parsed to float
+    """
+    checked_param = check_geometry_parameter(param)
+    if checked_param <= 0.0:
+        raise ValueError("Inproper value for " + name + ". Expected a value greater than zero.")
+    return checked_param
+
+def check_fraction(fraction):
+    """Check a fraction to be a float or int between zero and one.
+
+    Args:
+        fraction (any): The parameter whose type and value shall be checked
+
+    Raises:
+        TypeError: Signals that param is neither of type int nor float
+        ValueError: Signals that param's value is Inf, NaN, less than 0.0 or greater than 1.0
+
+    Returns:
+        float: The checked parameter parsed to float
+    """
+    checked_fraction = check_geometry_parameter(fraction)
+    if checked_fraction < 0.0 or checked_fraction > 1.0:
+        raise ValueError("Inproper value for fraction. Expected a value between zero and one.")
+    return checked_fraction
+
+def check_extents(extents):
+    """Check the extents of a rectangle to be a tuple of two lengths greater than zero.
+
+    Args:
+        extents (any): The extents to be checked
+
+    Raises:
+        TypeError: Signals that the extents are not a tuple or that the lengths
+          are neither of type int nor float
+        ValueError: Signals that the tuple has not two elements or that a length
+          is Inf, NaN or less/equal 0.0
+
+    Returns:
+        tuple (float, float): The checked extents
+    """
+    if not isinstance(extents, tuple):
+        raise TypeError("Inproper type for extents. Expected tuple.")
+    elif len(extents) != 2:
+        raise ValueError("Inproper extents length. Expected length 2.")
+    return (check_positive(extents[0], "extent"), check_positive(extents[1], "extent"))
+
+def check_flag(param):
+    """Check the parameter to be a boolean flag.
+
+    Args:
+        param (any): The parameter whose type shall be checked
+
+    Raises:
+        TypeError: Signals that param is not of type bool
+
+    Returns:
+        bool: The checked parameter
+    """
+    if not isinstance(param, bool):
+        raise TypeError("Inproper flag type. Expected bool.")
+    return param
+
+def check_angle_range(angle_range, lower, upper):
+    """Check an angle range to be a tuple of two angles (radiant) within [lower, upper].
+
+    Args:
+        angle_range (any): The angle range to be checked
+        lower (float): The smallest allowed angle
+        upper (float): The largest allowed angle
+
+    Raises:
+        TypeError: Signals that the range is not a tuple or that the angles
+          are neither of type int nor float
+        ValueError: Signals that the range has not two elements, that an angle is Inf, NaN
+          or outside [lower, upper] or that the first angle is not less than the second one
+
+    Returns:
+        tuple (float, float): The checked angle range
+    """
+    if not isinstance(angle_range, tuple):
+        raise TypeError("Inproper type for angle range. Expected tuple.")
+    elif len(angle_range) != 2:
+        raise ValueError("Inproper angle range length. Expected length 2.")
+    (start, end) = (check_geometry_parameter(angle_range[0]),
+                    check_geometry_parameter(angle_range[1]))
+    if not lower <= start < end <= upper:
+        raise ValueError("Inproper angle range. Expected " + str(lower) +
+                         " <= start < end <= " + str(upper) + ".")
+    return (start, end)
+
+def check_option(param, options):
+    """Check the parameter to be one of the supported string options.
+
+    Args:
+        param (any): The parameter whose type and value shall be checked
+        options (tuple (str, ...)): The supported option values
+
+    Raises:
+        TypeError: Signals that param is not of type str
+        ValueError: Signals that param is none of the supported options
+
+    Returns:
+        str: The checked parameter
+    """
+    if not isinstance(param, str):
+        raise TypeError("Inproper option type. Expected str.")
+    elif param not in options:
+        raise ValueError("Inproper option value. Expected one of: " + ", ".join(options))
     return param
 
 def check_vector(vec):
@@ -134,3 +379,179 @@ def check_quaternion(quat):
     for q_elem in quat:
         check_geometry_parameter(q_elem)
     return quat
+
+def check_vector_array(vecs):
+    """Check the input to be a single 3D vector or an array of 3D vectors.
+
+    Args:
+        vecs (any): The 3D vectors to be checked, either array-like of shape (n, 3) or (3,)
+
+    Raises:
+        TypeError: Signals that the vector elements are neither of type int nor float
+        ValueError: Signals that the value of at least one vector element is Inf, NaN
+          or that the shape of the array is neither (n, 3) nor (3,)
+
+    Returns:
+        numpy.ndarray: The checked vectors as float64 array
+    """
+    checked_vecs = _check_numeric_array(vecs)
+    if checked_vecs.ndim not in (1, 2) or checked_vecs.shape[-1] != 3:
+        raise ValueError("Inproper vector array shape. Expected shape (n, 3) or (3,).")
+    return checked_vecs
+
+def check_direction_vector_array(vecs):
+    """Check the input to be a single 3D direction vector or an array of them.
+
+    Args:
+        vecs (any): The 3D vectors to be checked, either array-like of shape (n, 3) or (3,)
+
+    Raises:
+        TypeError: Signals that the vector elements are neither of type int nor float
+        ValueError: Signals that the value of at least one vector element is Inf, NaN,
+          that the shape of the array is neither (n, 3) nor (3,)
+          or that the magnitude of at least one vector is less than 0.9
+
+    Returns:
+        numpy.ndarray: The checked vectors as float64 array
+    """
+    checked_vecs = check_vector_array(vecs)
+    if np.any(np.sum(checked_vecs**2, axis=-1) < 0.81):
+        raise ValueError("""Inproper vector parameter.
+          Expected the vectors' magnitudes to be at least 0.9.""")
+    return checked_vecs
+
+def check_quaternion_array(quats):
+    """Check the input to be a single quaternion or an array of quaternions.
+
+    Args:
+        quats (any): The quaternions to be checked, either array-like of shape (n, 4) or (4,)
+
+    Raises:
+        TypeError: Signals that the quaternion elements are neither of type int nor float
+        ValueError: Signals that the value of at least one quaternion element is Inf, NaN
+          or that the shape of the array is neither (n, 4) nor (4,)
+
+    Returns:
+        numpy.ndarray: The checked quaternions as float64 array
+    """
+    checked_quats = _check_numeric_array(quats)
+    if checked_quats.ndim not in (1, 2) or checked_quats.shape[-1] != 4:
+        raise ValueError("Inproper quaternion array shape. Expected shape (n, 4) or (4,).")
+    return checked_quats
+
+def check_point_array(points, dimension=None):
+    """Check the input to be an array of 2D or 3D points.
+
+    Args:
+        points (any): The points to be checked as array-like of shape (n, 2) or (n, 3)
+        dimension (int): The expected number of coordinates per point.
+          If None, both 2D and 3D points are accepted.
+
+    Raises:
+        TypeError: Signals that the coordinates are neither of type int nor float
+        ValueError: Signals that the value of at least one coordinate is Inf, NaN
+          or that the array has an unexpected shape
+
+    Returns:
+        numpy.ndarray: The checked points as float64 array
+    """
+    checked_points = _check_numeric_array(points)
+    dimensions = (2, 3) if dimension is None else (dimension,)
+    if checked_points.ndim != 2 or checked_points.shape[1] not in dimensions:
+        raise ValueError("Inproper point array shape. Expected shape (n, " +
+                         " or ".join(str(dim) for dim in dimensions) + ").")
+    return checked_points
+
+def check_parameter_array(params):
+    """Check the input to be a single geometry parameter or a 1D array of them.
+
+    Args:
+        params (any): The parameters to be checked, either a scalar or array-like of shape (n,)
+
+    Raises:
+        TypeError: Signals that the parameters are neither of type int nor float
+        ValueError: Signals that the value of at least one parameter is Inf, NaN
+          or that the array is not one-dimensional
+
+    Returns:
+        numpy.ndarray: The checked parameters as float64 array
+    """
+    checked_params = _check_numeric_array(params)
+    if checked_params.ndim > 1:
+        raise ValueError("Inproper parameter array shape. Expected a scalar or shape (n,).")
+    return checked_params
+
+def check_weight_array(weights):
+    """Check the input to be a non-empty 1D array of non-negative weights with a positive sum.
+
+    Args:
+        weights (any): The weights to be checked as array-like of shape (n,)
+
+    Raises:
+        TypeError: Signals that the weights are neither of type int nor float
+        ValueError: Signals that the value of at least one weight is Inf, NaN or negative,
+          that the array is not a non-empty 1D array or that all weights are zero
+
+    Returns:
+        numpy.ndarray: The checked weights as float64 array
+    """
+    checked_weights = _check_numeric_array(weights)
+    if checked_weights.ndim != 1 or len(checked_weights) == 0:
+        raise ValueError("Inproper weight array shape. Expected a non-empty shape (n,).")
+    elif np.any(checked_weights < 0.0):
+        raise ValueError("Inproper weight value. Expected values greater/equal zero.")
+    elif not np.sum(checked_weights) > 0.0:
+        raise ValueError("Inproper weight values. Expected at least one value greater than zero.")
+    return checked_weights
+
+def check_face_array(faces, num_vertices):
+    """Check the input to be an array of triangles given by vertex indices.
+
+    Args:
+        faces (any): The triangles to be checked as array-like of shape (n, 3)
+        num_vertices (int): The number of vertices the indices refer to
+
+    Raises:
+        TypeError: Signals that the indices are not of an integer type
+        ValueError: Signals that the array is not a non-empty array of shape (n, 3)
+          or that at least one index is out of range
+
+    Returns:
+        numpy.ndarray: The checked faces as int64 array
+    """
+    try:
+        array = np.asarray(faces)
+    except ValueError as error:
+        raise TypeError("Inproper face array type. Expected an array of int values.") from error
+    if array.dtype.kind not in "iu":
+        raise TypeError("Inproper face array type. Expected an array of int values.")
+    elif array.ndim != 2 or array.shape[1] != 3 or len(array) == 0:
+        raise ValueError("Inproper face array shape. Expected a non-empty shape (n, 3).")
+    elif np.any(array < 0) or np.any(array >= num_vertices):
+        raise ValueError("Inproper face index. Expected indices of existing vertices.")
+    return array.astype(np.int64, copy=False)
+
+def _check_numeric_array(values):
+    """Convert the input to a float64 array after checking its type and values.
+
+    Args:
+        values (any): The array-like input to be checked
+
+    Raises:
+        TypeError: Signals that the input does not consist of int or float values
+        ValueError: Signals that at least one value is Inf or NaN
+
+    Returns:
+        numpy.ndarray: The checked values as float64 array
+    """
+    try:
+        array = np.asarray(values)
+    except ValueError as error:
+        raise TypeError("Inproper array type. Expected an array of int or float values.") \
+          from error
+    if array.dtype.kind not in "iuf":
+        raise TypeError("Inproper array type. Expected an array of int or float values.")
+    array = array.astype(np.float64, copy=False)
+    if not np.all(np.isfinite(array)):
+        raise ValueError("Inproper array value. No inf or nan.")
+    return array
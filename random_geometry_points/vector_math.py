@@ -1,10 +1,20 @@
 """A small set of simple vector manipulation/calculation functions.
+
+The public functions validate their arguments. Each of them is backed by an unchecked
+kernel function (prefixed with an underscore) that expects already validated
+tuples of floats. The geometry classes validate their parameters once and
+use the kernel functions internally.
+
+The functions with the suffix "_array" are batched counterparts that operate on
+numpy arrays of shape (n, 3) in a single vectorized call. Wherever two operands are
+combined, a single vector of shape (3,) is broadcast against the other operand.
 """
 
 import math
-from functools import reduce
+import numpy as np
 from random_geometry_points.validation import check_vector, check_geometry_parameter, \
-  check_direction_vector, check_quaternion
+  check_direction_vector, check_quaternion, check_vector_array, check_direction_vector_array, \
+  check_parameter_array
 
 def calc_magnitude(vec):
     """Calculate the magnitude of a 3D vector.
@@ -15,8 +25,7 @@ def calc_magnitude(vec):
     Returns:
         float: The magnitude of the 3D vector
     """
-    checked_vec = check_vector(vec)
-    return math.sqrt(checked_vec[0]**2 + checked_vec[1]**2 + checked_vec[2]**2)
+    return _magnitude(check_vector(vec))
 
 def calc_dot_product(vec1, vec2):
     """Calculate the dot product of two 3D vectors.
@@ -28,10 +37,7 @@ def calc_dot_product(vec1, vec2):
     Returns:
         float: The dot product of the two 3D vectors
     """
-    checked_vec1 = check_vector(vec1)
-    checked_vec2 = check_vector(vec2)
-    return (checked_vec1[0]*checked_vec2[0] + checked_vec1[1]*checked_vec2[1]
-            + checked_vec1[2]*checked_vec2[2])
+    return _dot(check_vector(vec1), check_vector(vec2))
 
 def calc_cross_product(vec1, vec2):
     """Calculate the cross product of two 3D vectors.
@@ -43,11 +49,7 @@ def calc_cross_product(vec1, vec2):
     Returns:
         tuple (float, float, float): The cross product of the two 3D vectors
     """
-    checked_vec1 = check_vector(vec1)
-    checked_vec2 = check_vector(vec2)
-    return (checked_vec1[1]*checked_vec2[2] - checked_vec1[2]*checked_vec2[1],
-            checked_vec1[2]*checked_vec2[0] - checked_vec1[0]*checked_vec2[2],
-            checked_vec1[0]*checked_vec2[1] - checked_vec1[1]*checked_vec2[0])
+    return _cross(check_vector(vec1), check_vector(vec2))
 
 def normalize_vector(vec):
     """Normalize the input vector.
@@ -58,11 +60,10 @@ def normalize_vector(vec):
     Returns:
         tuple (float, float, float): The normalized vector
     """
-    magnitude = calc_magnitude(vec)
-    if math.isclose(magnitude, 0.0, abs_tol=0.000001):
+    checked_vec = check_vector(vec)
+    if math.isclose(_magnitude(checked_vec), 0.0, abs_tol=0.000001):
         raise ValueError("Inproper vector. Expected a magnitude greater than 0.")
-    normalize = lambda v: v / magnitude
-    return tuple([normalize(vec_elem) for vec_elem in vec])
+    return _normalize(checked_vec)
 
 def calc_perpendicular_vector(vec):
     """Calculate an arbitrary perpendicular vector.
@@ -75,16 +76,10 @@ def calc_perpendicular_vector(vec):
         tuple (float, float, float): The perpendicular vector
     """
     checked_vec = check_vector(vec)
-    magnitude = calc_magnitude(checked_vec)
-    if math.isclose(magnitude, 0.0, abs_tol=0.000001):
+    if math.isclose(_magnitude(checked_vec), 0.0, abs_tol=0.000001):
         raise ValueError("""Invalid vector. Expected a vector with
           a magnitude greater than zero""")
-    if math.fabs(checked_vec[0]) < math.fabs(checked_vec[1]) and \
-      math.fabs(checked_vec[0]) < math.fabs(checked_vec[2]):
-        return calc_cross_product((1.0, 0.0, 0.0), checked_vec)
-    elif math.fabs(checked_vec[1]) < math.fabs(checked_vec[2]):
-        return calc_cross_product((0.0, 1.0, 0.0), checked_vec)
-    return calc_cross_product((0.0, 0.0, 1.0), checked_vec)
+    return _perpendicular(checked_vec)
 
 def get_as_rotation_quaternion(axis, angle):
     """Convert an axis and an angle into a rotation quaternion.
@@ -97,10 +92,9 @@ def get_as_rotation_quaternion(axis, angle):
         tuple (float, float, float, float): The rotation quaternion defined as
           q = (w, qx, qy, qz)
     """
-    checked_axis = normalize_vector(check_direction_vector(axis))
+    checked_axis = _normalize(check_direction_vector(axis))
     checked_angle = check_geometry_parameter(angle)
-    omega = 0.5 * checked_angle
-    return (math.cos(omega),) + tuple([math.sin(omega) * vec_elem for vec_elem in checked_axis])
+    return _rotation_quaternion(checked_axis, checked_angle)
 
 def rotate_vector(vec, axis, angle):
     """Rotate a vector around an axis by an angle (radiant).
@@ -113,14 +107,10 @@ def rotate_vector(vec, axis, angle):
     Returns:
         tuple (float, float, float): The rotated vector
     """
-    (vec_x, vec_y, vec_z) = check_vector(vec)
-    (quat_w, quat_x, quat_y, quat_z) = get_as_rotation_quaternion(axis, angle)
-    # rotation of a vector p via a quaternion q is defined as: q * p * (q*)
-    qpq = reduce(multiply_quaternions, [
-        (0.0, vec_x, vec_y, vec_z),
-        (quat_w, -quat_x, -quat_y, -quat_z)
-    ], (quat_w, quat_x, quat_y, quat_z))
-    return (qpq[1], qpq[2], qpq[3])
+    checked_vec = check_vector(vec)
+    checked_axis = _normalize(check_direction_vector(axis))
+    checked_angle = check_geometry_parameter(angle)
+    return _rotate(checked_vec, checked_axis, checked_angle)
 
 def scale_vector(vec, scale):
     """Multiply each vector element with the scale factor.
@@ -132,9 +122,7 @@ def scale_vector(vec, scale):
     Returns:
         tuple (float, float, float): The scaled vector
     """
-    checked_vec = check_vector(vec)
-    checked_scale = check_geometry_parameter(scale)
-    return tuple([checked_scale * vec_elem for vec_elem in checked_vec])
+    return _scale(check_vector(vec), check_geometry_parameter(scale))
 
 def sum_vectors(vec1, vec2):
     """Calculate the sum of two vectors.
@@ -146,10 +134,7 @@ def sum_vectors(vec1, vec2):
     Returns:
         tuple (float, float, float): The sum of both vectors
     """
-    checked_vec1 = check_vector(vec1)
-    checked_vec2 = check_vector(vec2)
-    return (checked_vec1[0]+checked_vec2[0], checked_vec1[1]+checked_vec2[1],
-            checked_vec1[2]+checked_vec2[2])
+    return _sum(check_vector(vec1), check_vector(vec2))
 
 def multiply_quaternions(quat1, quat2):
     """Multiply two quaternions.
@@ -161,12 +146,189 @@ def multiply_quaternions(quat1, quat2):
     Returns:
         tuple (float, float, float, float): The new quaternion created by doing q1 * q2
     """
-    (qw1, qx1, qy1, qz1) = check_quaternion(quat1)
-    (qw2, qx2, qy2, qz2) = check_quaternion(quat2)
-    qw3 = qw1 * qw2 - calc_dot_product((qx1, qy1, qz1), (qx2, qy2, qz2))
-    qxyz3 = reduce(sum_vectors, [
-        calc_cross_product((qx1, qy1, qz1), (qx2, qy2, qz2)),
-        scale_vector((qx2, qy2, qz2), qw1),
-        scale_vector((qx1, qy1, qz1), qw2)
-    ], (0, 0, 0))
-    return (qw3,) + qxyz3
+    return _multiply_quaternions(check_quaternion(quat1), check_quaternion(quat2))
+
+def calc_magnitude_array(vecs):
+    """Calculate the magnitudes of an array of 3D vectors.
+
+    Args:
+        vecs (numpy.ndarray): The 3D vectors as array of shape (n, 3)
+
+    Returns:
+        numpy.ndarray: The magnitudes as array of shape (n,)
+    """
+    return np.linalg.norm(check_vector_array(vecs), axis=-1)
+
+def calc_dot_product_array(vecs1, vecs2):
+    """Calculate the row-wise dot products of two arrays of 3D vectors.
+
+    Args:
+        vecs1 (numpy.ndarray): The first 3D vectors as array of shape (n, 3)
+        vecs2 (numpy.ndarray): The second 3D vectors as array of shape (n, 3)
+
+    Returns:
+        numpy.ndarray: The dot products as array of shape (n,)
+    """
+    return np.einsum("...i,...i->...", check_vector_array(vecs1), check_vector_array(vecs2))
+
+def calc_cross_product_array(vecs1, vecs2):
+    """Calculate the row-wise cross products of two arrays of 3D vectors.
+
+    Args:
+        vecs1 (numpy.ndarray): The first 3D vectors as array of shape (n, 3)
+        vecs2 (numpy.ndarray): The second 3D vectors as array of shape (n, 3)
+
+    Returns:
+        numpy.ndarray: The cross products as array of shape (n, 3)
+    """
+    return np.cross(check_vector_array(vecs1), check_vector_array(vecs2))
+
+def normalize_vector_array(vecs):
+    """Normalize an array of 3D vectors.
+
+    Args:
+        vecs (numpy.ndarray): The 3D vectors to be normalized as array of shape (n, 3)
+
+    Returns:
+        numpy.ndarray: The normalized vectors as array of shape (n, 3)
+    """
+    checked_vecs = check_vector_array(vecs)
+    magnitudes = np.linalg.norm(checked_vecs, axis=-1)
+    if np.any(magnitudes <= 0.000001):
+        raise ValueError("Inproper vector. Expected a magnitude greater than 0.")
+    return checked_vecs / magnitudes[..., np.newaxis]
+
+def scale_vector_array(vecs, scales):
+    """Multiply each 3D vector with its scale factor.
+
+    Args:
+        vecs (numpy.ndarray): The 3D vectors to be scaled as array of shape (n, 3)
+        scales (numpy.ndarray): Either a single scale factor or an array of shape (n,)
+
+    Returns:
+        numpy.ndarray: The scaled vectors as array of shape (n, 3)
+    """
+    checked_scales = check_parameter_array(scales)
+    return check_vector_array(vecs) * checked_scales[..., np.newaxis]
+
+def sum_vectors_array(vecs1, vecs2):
+    """Calculate the row-wise sums of two arrays of 3D vectors.
+
+    Args:
+        vecs1 (numpy.ndarray): The first 3D vectors as array of shape (n, 3)
+        vecs2 (numpy.ndarray): The second 3D vectors as array of shape (n, 3)
+
+    Returns:
+        numpy.ndarray: The sums as array of shape (n, 3)
+    """
+    return check_vector_array(vecs1) + check_vector_array(vecs2)
+
+def rotate_vector_array(vecs, axes, angles):
+    """Rotate 3D vectors around axes by angles (radiant).
+
+    The rotation is calculated with the Rodrigues formula, which yields
+    the same result as the quaternion rotation of rotate_vector.
+
+    Args:
+        vecs (numpy.ndarray): The vectors to be rotated as array of shape (n, 3)
+        axes (numpy.ndarray): Either a single rotation axis or an array of shape (n, 3)
+        angles (numpy.ndarray): Either a single rotation angle or an array of shape (n,)
+          for right-handed rotations
+
+    Returns:
+        numpy.ndarray: The rotated vectors as array of shape (n, 3)
+    """
+    checked_vecs = check_vector_array(vecs)
+    checked_axes = check_direction_vector_array(axes)
+    checked_angles = check_parameter_array(angles)
+    unit_axes = checked_axes / np.linalg.norm(checked_axes, axis=-1)[..., np.newaxis]
+    return _rotate_array(checked_vecs, unit_axes, checked_angles)
+
+def _rotate_array(vecs, axes, angles):
+    """Unchecked version of rotate_vector_array. The axes must be normalized.
+    """
+    cos_angles = np.cos(angles)[..., np.newaxis]
+    sin_angles = np.sin(angles)[..., np.newaxis]
+    axis_components = np.einsum("...i,...i->...", axes, vecs)[..., np.newaxis]
+    return (vecs * cos_angles + np.cross(axes, vecs) * sin_angles
+            + axes * axis_components * (1.0 - cos_angles))
+
+def _magnitude(vec):
+    """Unchecked version of calc_magnitude.
+    """
+    return math.sqrt(vec[0]*vec[0] + vec[1]*vec[1] + vec[2]*vec[2])
+
+def _dot(vec1, vec2):
+    """Unchecked version of calc_dot_product.
+    """
+    return vec1[0]*vec2[0] + vec1[1]*vec2[1] + vec1[2]*vec2[2]
+
+def _cross(vec1, vec2):
+    """Unchecked version of calc_cross_product.
+    """
+    return (vec1[1]*vec2[2] - vec1[2]*vec2[1],
+            vec1[2]*vec2[0] - vec1[0]*vec2[2],
+            vec1[0]*vec2[1] - vec1[1]*vec2[0])
+
+def _normalize(vec):
+    """Unchecked version of normalize_vector. The vector must not be the zero vector.
+    """
+    magnitude = _magnitude(vec)
+    return (vec[0] / magnitude, vec[1] / magnitude, vec[2] / magnitude)
+
+def _perpendicular(vec):
+    """Unchecked version of calc_perpendicular_vector.
+    """
+    (abs_x, abs_y, abs_z) = (math.fabs(vec[0]), math.fabs(vec[1]), math.fabs(vec[2]))
+    if abs_x < abs_y and abs_x < abs_z:
+        return _cross((1.0, 0.0, 0.0), vec)
+    elif abs_y < abs_z:
+        return _cross((0.0, 1.0, 0.0), vec)
+    return _cross((0.0, 0.0, 1.0), vec)
+
+def _orthonormal_basis(normal):
+    """Calculate two unit vectors that form an orthonormal basis with the normalized normal.
+
+    Returns:
+        tuple (tuple (float, float, float), tuple (float, float, float)): The basis vectors
+          u and v with u x v = normal
+    """
+    basis_u = _normalize(_perpendicular(normal))
+    return (basis_u, _cross(normal, basis_u))
+
+def _rotation_quaternion(axis, angle):
+    """Unchecked version of get_as_rotation_quaternion. The axis must be normalized.
+    """
+    omega = 0.5 * angle
+    sin_omega = math.sin(omega)
+    return (math.cos(omega), sin_omega * axis[0], sin_omega * axis[1], sin_omega * axis[2])
+
+def _rotate(vec, axis, angle):
+    """Unchecked version of rotate_vector. The axis must be normalized.
+    """
+    quat = _rotation_quaternion(axis, angle)
+    # rotation of a vector p via a quaternion q is defined as: q * p * (q*)
+    qpq = _multiply_quaternions(
+        _multiply_quaternions(quat, (0.0, vec[0], vec[1], vec[2])),
+        (quat[0], -quat[1], -quat[2], -quat[3]))
+    return (qpq[1], qpq[2], qpq[3])
+
+def _scale(vec, scale):
+    """Unchecked version of scale_vector.
+    """
+    return (scale * vec[0], scale * vec[1], scale * vec[2])
+
+def _sum(vec1, vec2):
+    """Unchecked version of sum_vectors.
+    """
+    return (vec1[0] + vec2[0], vec1[1] + vec2[1], vec1[2] + vec2[2])
+
+def _multiply_quaternions(quat1, quat2):
+    """Unchecked version of multiply_quaternions.
+    """
+    (qw1, qx1, qy1, qz1) = quat1
+    (qw2, qx2, qy2, qz2) = quat2
+    return (qw1*qw2 - qx1*qx2 - qy1*qy2 - qz1*qz2,
+            qw1*qx2 + qx1*qw2 + qy1*qz2 - qz1*qy2,
+            qw1*qy2 - qx1*qz2 + qy1*qw2 + qz1*qx2,
+            qw1*qz2 + qx1*qy2 - qy1*qx2 + qz1*qw2)
@@ -26,6 +26,6 @@ setup(
         "Tracker": "https://github.com/brauls/random-geometry-points/issues",
     },
     packages=["random_geometry_points"],
-    install_requires=[],
+    install_requires=["numpy>=1.17"],
     python_requires='>=3.6',
 )
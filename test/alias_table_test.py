@@ -0,0 +1,53 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.alias_table import AliasTable
+
+def test_alias_table_probabilities():
+    """Test if the alias table represents exactly the normalized weights.
+
+    Index k is drawn with probability probabilities[k] / n plus the sum of
+    (1 - probabilities[j]) / n over all columns j with alias k.
+    """
+    rng = np.random.default_rng(0)
+    weight_arrays = [
+        [1.0, 2.0, 3.0, 4.0],
+        [0.0, 1.0, 0.0],
+        [5],
+        np.r_[1000.0, np.full(999, 0.001)],
+        rng.random(10000)**4
+    ]
+    for weights in weight_arrays:
+        weights = np.asarray(weights, dtype=float)
+        table = AliasTable(weights)
+        num_weights = len(table)
+        assert num_weights == len(weights)
+        assert np.all((table.probabilities >= 0.0) & (table.probabilities <= 1.0))
+        implied = table.probabilities / num_weights + \
+          np.bincount(table.aliases, (1.0 - table.probabilities) / num_weights, num_weights)
+        assert np.allclose(implied, weights / np.sum(weights), rtol=0.0, atol=1e-12)
+
+def test_alias_table_draw():
+    """Test the distribution of the drawn indices.
+    """
+    table = AliasTable([1.0, 0.0, 3.0, 6.0])
+    indices = table.draw(np.random.default_rng(1), 200000)
+    assert indices.dtype == np.int64
+    frequencies = np.bincount(indices, minlength=4) / 200000
+    assert np.allclose(frequencies, [0.1, 0.0, 0.3, 0.6], atol=0.01)
+    assert frequencies[1] == 0.0
+
+def test_alias_table_exc():
+    """Test the constructor of AliasTable to raise the expected exceptions.
+    """
+    for weights in ["test", ["1", "2"]]:
+        with pytest.raises(TypeError):
+            AliasTable(weights)
+    for weights in [[], [1.0, -1.0], [0.0, 0.0], [[1.0, 2.0]], [1.0, float("nan")]]:
+        with pytest.raises(ValueError):
+            AliasTable(weights)
@@ -2,6 +2,7 @@ import sys
 import os
 import math
 import pytest
+import numpy as np
 
 PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJ_PATH + '/../')
@@ -34,8 +35,24 @@ def test_create_random_point_gen():
         circle_points = [point for point in circle[0].create_random_point_generator(circle[1])]
         _check_valid_circle_results(circle[0], circle[1], circle_points)
 
+def test_create_random_points_array():
+    """Test the create_random_points_array method of Circle2D.
+
+    Create a list of different circle definitions along with the desired point count.
+    For each circle it is checked if the returned array has the expected shape and type.
+    Furthermore it is checked if the created points lie on the 2D circle, respectively.
+    """
+    circles = _get_valid_circle_definitions()
+    for circle in circles:
+        circle_points = circle[0].create_random_points_array(circle[1])
+        assert isinstance(circle_points, np.ndarray)
+        assert circle_points.shape == (circle[1], 2)
+        assert circle_points.dtype == np.float64
+        _check_valid_circle_results(circle[0], circle[1], circle_points.tolist())
+
 def test_create_random_points_exc():
-    """Test the create_random_points and create_random_point_generator methods of Circle2D.
+    """Test the create_random_points, create_random_point_generator
+    and create_random_points_array methods of Circle2D.
 
     Create a list of different invalid circle definitions.
     Check if for each circle definition the expected exception is raised.
@@ -60,6 +77,13 @@ def test_create_random_points_exc():
         with pytest.raises(expected_exception):
             circle.create_random_point_generator(num_points)
 
+    def check_point_count_array(circle, num_points, expected_exception):
+        """Check the create_random_points_array method to raise an exception because of
+        an invalid number of points to be created.
+        """
+        with pytest.raises(expected_exception):
+            circle.create_random_points_array(num_points)
+
     circle_creation_errors = _get_invalid_circle_definitions()
     point_count_errors = _get_circles_with_invalid_point_count()
     for circle in circle_creation_errors:
@@ -67,6 +91,7 @@ def test_create_random_points_exc():
     for circle in point_count_errors:
         check_point_count(circle[0], circle[1], circle[2])
         check_point_count_gen(circle[0], circle[1], circle[2])
+        check_point_count_array(circle[0], circle[1], circle[2])
 
 def _get_valid_circle_definitions():
     """Create a list of valid 2D circle parameters.
@@ -138,7 +163,6 @@ def _get_circles_with_invalid_point_count():
         (Circle2D(2.0, 5.0, 5), 4.5, TypeError),
         (Circle2D(2.0, 5.0, 5), -5, ValueError),
         (Circle2D(2.0, 5.0, 5), 0, ValueError),
-        (Circle2D(2.0, 5.0, 5), 100000, ValueError),
         (Circle2D(2.0, 5.0, 5), float('nan'), TypeError),
         (Circle2D(2.0, 5.0, 5), float("inf"), TypeError),
         (Circle2D(2.0, 5.0, 5), float("-inf"), TypeError)
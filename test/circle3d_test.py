@@ -0,0 +1,138 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.circle3d import Circle3D
+
+def test_create_random_points():
+    """Test the create_random_points method of Circle3D.
+
+    Create a list of different circle definitions along with the desired point count.
+    For each circle it is checked if the number of created points matches
+    the expected number of points.
+    Furthermore it is checked if the created points lie on the 3D circle, respectively.
+    """
+    circles = _get_valid_circle_definitions()
+    for circle in circles:
+        circle_points = circle[0].create_random_points(circle[1])
+        _check_valid_circle_results(circle[0], circle[1], circle_points)
+
+def test_create_random_point_gen():
+    """Test the create_random_point_generator method of Circle3D.
+
+    Create a list of different circle definitions along with the desired point count.
+    For each circle it is checked if the number of created points matches
+    the expected number of points.
+    Furthermore it is checked if the created points lie on the 3D circle, respectively.
+    """
+    circles = _get_valid_circle_definitions()
+    for circle in circles:
+        circle_points = [point for point in circle[0].create_random_point_generator(circle[1])]
+        _check_valid_circle_results(circle[0], circle[1], circle_points)
+
+def test_create_random_points_array():
+    """Test the create_random_points_array method of Circle3D.
+
+    Create a list of different circle definitions along with the desired point count.
+    For each circle it is checked if the returned array has the expected shape and type.
+    Furthermore it is checked if the created points lie on the 3D circle, respectively.
+    """
+    circles = _get_valid_circle_definitions()
+    for circle in circles:
+        circle_points = circle[0].create_random_points_array(circle[1])
+        assert isinstance(circle_points, np.ndarray)
+        assert circle_points.shape == (circle[1], 3)
+        assert circle_points.dtype == np.float64
+        _check_valid_circle_results(circle[0], circle[1], circle_points.tolist())
+
+def test_angle_distribution():
+    """Test if the points are uniformly distributed along the circle.
+
+    The angles of the points in the circle plane must be uniformly distributed,
+    so each quarter of the circle must contain about a quarter of the points.
+    """
+    circle = Circle3D((1.0, 2.0, 3.0), (1.0, 1.0, 1.0), 2.0, seed=0)
+    points = circle.create_random_points_array(100000) - circle.center
+    (basis_u, basis_v) = circle.basis
+    angles = np.arctan2(points @ basis_v, points @ basis_u)
+    counts = np.histogram(angles, bins=4, range=(-math.pi, math.pi))[0]
+    assert np.allclose(counts / 100000, 0.25, atol=0.01)
+
+def test_create_random_points_exc():
+    """Test the constructor and the create_random_points method of Circle3D.
+
+    Create a list of different invalid circle definitions.
+    Check if for each circle definition the expected exception is raised.
+    """
+    for center, normal_vec, radius, expected_exception in _get_invalid_circle_definitions():
+        with pytest.raises(expected_exception):
+            Circle3D(center, normal_vec, radius)
+    circle = Circle3D((2.0, 5.0, 1.0), (0.0, 0.0, 1.0), 5)
+    for num_points, expected_exception in [("3", TypeError), (4.5, TypeError), (-5, ValueError)]:
+        with pytest.raises(expected_exception):
+            circle.create_random_points(num_points)
+
+def _get_valid_circle_definitions():
+    """Create a list of valid 3D circle parameters.
+
+    Create and return a static list of tuples each containing the parameters of
+    a 3D circle along with the desired number of random points to be created.
+
+    Returns:
+        list (tuple (Circle3D, int) ): List with 3D circle parameters and desired point count
+    """
+    return [
+        (Circle3D((3.0, 5.0, 1.0), (0.0, 0.0, 1.0), 10.0), 5),
+        (Circle3D((3.0, 5.0, 1.0), (1.0, 0.0, 0.0), 1.0), 10),
+        (Circle3D((-2.0, 4.0, 0.0), (0.0, -1.0, 0.0), 5.0), 20),
+        (Circle3D((3.55, -44.2, 17.0), (1.0, 2.0, 3.0), 5422.5), 100),
+        (Circle3D((200, 1070, -80), (-4, 1, 0.5), 55), 5),
+        (Circle3D((10000.78, 99453.44, 0.0), (0.0, 0.9, 0.0), 10455.6), 5),
+        (Circle3D((0.005, -0.00064, 0.0), (2.0, 2.0, 2.0), 0.00085), 99999)
+    ]
+
+def _get_invalid_circle_definitions():
+    """Create a list of invalid 3D circle parameters.
+
+    Create and return a list of tuples each containing invalid parameters of
+    a 3D circle along with the expected type of exception that should be thrown.
+
+    Returns:
+        list (tuple (any, any, any, Exception)): List with 3D circle parameters
+          and the expected exception
+    """
+    return [
+        ([1.0, 2.0, 3.0], (0.0, 0.0, 1.0), 1.0, TypeError),
+        ((1.0, 2.0), (0.0, 0.0, 1.0), 1.0, ValueError),
+        ((1.0, "2", 3.0), (0.0, 0.0, 1.0), 1.0, TypeError),
+        ((1.0, 2.0, float("nan")), (0.0, 0.0, 1.0), 1.0, ValueError),
+        ((1.0, 2.0, 3.0), (0.0, 0.0, 0.0), 1.0, ValueError),
+        ((1.0, 2.0, 3.0), (0.0, 0.0, 1.0, 0.0), 1.0, ValueError),
+        ((1.0, 2.0, 3.0), (0.0, 0.0, float("inf")), 1.0, ValueError),
+        ((1.0, 2.0, 3.0), (0.0, 0.0, 1.0), "4", TypeError),
+        ((1.0, 2.0, 3.0), (0.0, 0.0, 1.0), 0.0, ValueError),
+        ((1.0, 2.0, 3.0), (0.0, 0.0, 1.0), -2.5, ValueError)
+    ]
+
+def _check_valid_circle_results(circle, num_points, circle_points):
+    """Check the randomly generated points for a valid 3D circle definition.
+
+    It is checked that num_points points are created and that each created point
+    lies in the circle plane and has the circle radius as distance from the center.
+
+    Args:
+        circle (Circle3D): A valid 3D circle definition
+        num_points (int): A valid number of random points to be created
+        circle_points (list (tuple(float, float, float))): The randomly created points
+          for the given circle and num_points
+    """
+    assert all([len(point) == 3 for point in circle_points])
+    assert len(circle_points) == num_points
+    offsets = np.array(circle_points).reshape(-1, 3) - circle.center
+    assert np.allclose(offsets @ circle.normal_vec, 0.0, atol=0.000001 * circle.radius)
+    assert np.allclose(np.linalg.norm(offsets, axis=1), circle.radius)
@@ -0,0 +1,110 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.cone import Cone
+
+def test_create_random_points():
+    """Test the create_random_points method of Cone.
+
+    Create a list of different cone definitions along with the desired point count.
+    For each cone it is checked if the number of created points matches
+    the expected number of points.
+    Furthermore it is checked if the created points lie on the cone surface, respectively.
+    """
+    for cone, num_points in _get_valid_cone_definitions():
+        cone_points = cone.create_random_points(num_points)
+        assert len(cone_points) == num_points
+        assert all(len(point) == 3 for point in cone_points)
+        _check_valid_cone_results(cone, np.array(cone_points))
+
+def test_create_random_points_array():
+    """Test the create_random_points_array method of Cone.
+
+    Create a list of different cone definitions along with the desired point count.
+    For each cone it is checked if the returned array has the expected shape and type.
+    Furthermore it is checked if the created points lie on the cone surface, respectively.
+    """
+    for cone, num_points in _get_valid_cone_definitions():
+        cone_points = cone.create_random_points_array(num_points)
+        assert cone_points.shape == (num_points, 3)
+        assert cone_points.dtype == np.float64
+        _check_valid_cone_results(cone, cone_points)
+
+def test_area_weighted_distribution():
+    """Test if the points are uniformly distributed over the whole cone surface.
+
+    The fraction of points on the base must match the fraction of the base area.
+    On the lateral surface the area within a relative distance s from the apex
+    grows with s**2, so half of the lateral points lie within s = 1 / sqrt(2).
+    """
+    cone = Cone((1.0, 2.0, 3.0), (1.0, 0.0, 1.0), 3.0, 4.0, cap=True, seed=0)
+    assert math.isclose(cone.area, math.pi * 3.0 * 5.0 + math.pi * 9.0)
+    (heights, _) = _calc_cone_coords(cone, cone.create_random_points_array(200000))
+    on_base = np.isclose(heights, 0.0)
+    assert math.isclose(np.mean(on_base), 9.0 / 24.0, abs_tol=0.01)
+    apex_distances = 1.0 - heights[~on_base] / cone.height
+    assert math.isclose(np.mean(apex_distances < 1.0 / math.sqrt(2.0)), 0.5, abs_tol=0.01)
+
+def test_create_random_points_exc():
+    """Test the constructor of Cone to raise the expected exceptions.
+    """
+    for params, expected_exception in _get_invalid_cone_definitions():
+        with pytest.raises(expected_exception):
+            Cone(*params)
+
+def _get_valid_cone_definitions():
+    """Create a list of valid cone parameters.
+
+    Returns:
+        list (tuple (Cone, int)): List with cones and the desired point count
+    """
+    return [
+        (Cone((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, 2.0), 10),
+        (Cone((3.0, -5.0, 1.0), (1.0, 2.0, 3.0), 10.0, 0.5, cap=True), 100),
+        (Cone((-200.0, 1070.0, 4.5), (-1.0, 0.0, 0.0), 55, 1000), 5),
+        (Cone((0.005, -0.00064, 0.0), (0.0, 0.9, 0.0), 0.00085, 0.002, cap=True), 99999)
+    ]
+
+def _get_invalid_cone_definitions():
+    """Create a list of invalid cone parameters along with the expected exception.
+
+    Returns:
+        list (tuple (tuple, Exception)): List with cone parameters and the expected exception
+    """
+    return [
+        (([0.0, 0.0, 0.0], (0.0, 0.0, 1.0), 1.0, 2.0), TypeError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), 1.0, 2.0), ValueError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), -1.0, 2.0), ValueError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, 0), ValueError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, "2"), TypeError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, 2.0, 1), TypeError)
+    ]
+
+def _calc_cone_coords(cone, points):
+    """Calculate the heights of the points along the cone axis and their distances from the axis.
+    """
+    offsets = points - cone.base_center
+    heights = offsets @ cone.axis_vec
+    distances = np.linalg.norm(offsets - np.outer(heights, cone.axis_vec), axis=1)
+    return (heights, distances)
+
+def _check_valid_cone_results(cone, points):
+    """Check that each point lies on the lateral surface or, if enabled, on the base of the cone.
+    """
+    (heights, distances) = _calc_cone_coords(cone, points)
+    tolerance = 0.000001 * max(cone.radius, cone.height)
+    expected_distances = cone.radius * (1.0 - heights / cone.height)
+    on_lateral = np.isclose(distances, expected_distances, rtol=0.0, atol=tolerance) & \
+      (heights > -tolerance) & (heights < cone.height + tolerance)
+    on_base = np.isclose(heights, 0.0, rtol=0.0, atol=tolerance) & \
+      (distances < cone.radius + tolerance)
+    if cone.cap:
+        assert np.all(on_lateral | on_base)
+    else:
+        assert np.all(on_lateral)
@@ -0,0 +1,123 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.cylinder import Cylinder
+
+def test_create_random_points():
+    """Test the create_random_points method of Cylinder.
+
+    Create a list of different cylinder definitions along with the desired point count.
+    For each cylinder it is checked if the number of created points matches
+    the expected number of points.
+    Furthermore it is checked if the created points lie on the cylinder surface, respectively.
+    """
+    for cylinder, num_points in _get_valid_cylinder_definitions():
+        cylinder_points = cylinder.create_random_points(num_points)
+        assert len(cylinder_points) == num_points
+        assert all(len(point) == 3 for point in cylinder_points)
+        _check_valid_cylinder_results(cylinder, np.array(cylinder_points))
+
+def test_create_random_points_array():
+    """Test the create_random_points_array method of Cylinder.
+
+    Create a list of different cylinder definitions along with the desired point count.
+    For each cylinder it is checked if the returned array has the expected shape and type.
+    Furthermore it is checked if the created points lie on the cylinder surface, respectively.
+    """
+    for cylinder, num_points in _get_valid_cylinder_definitions():
+        cylinder_points = cylinder.create_random_points_array(num_points)
+        assert cylinder_points.shape == (num_points, 3)
+        assert cylinder_points.dtype == np.float64
+        _check_valid_cylinder_results(cylinder, cylinder_points)
+
+def test_area_weighted_distribution():
+    """Test if the points are uniformly distributed over the whole cylinder surface.
+
+    The fraction of points on each cap must match the fraction of the cap area
+    and the heights of the points on the lateral surface must be uniformly distributed.
+    """
+    cylinder = Cylinder((1.0, 2.0, 3.0), (0.0, 1.0, 1.0), 2.0, 3.0, caps=True, seed=0)
+    assert math.isclose(cylinder.area, 2.0 * math.pi * 2.0 * 3.0 + 2.0 * math.pi * 4.0)
+    points = cylinder.create_random_points_array(200000)
+    (heights, distances) = _calc_cylinder_coords(cylinder, points)
+    on_lateral = np.isclose(distances, cylinder.radius) & (heights > 0.000001) & \
+      (heights < cylinder.height - 0.000001)
+    on_bottom = np.isclose(heights, 0.0)
+    on_top = np.isclose(heights, cylinder.height)
+    cap_fraction = 4.0 / (12.0 + 2.0 * 4.0)
+    assert math.isclose(np.mean(on_bottom), cap_fraction, abs_tol=0.01)
+    assert math.isclose(np.mean(on_top), cap_fraction, abs_tol=0.01)
+    assert math.isclose(np.mean(on_lateral), 1.0 - 2.0 * cap_fraction, abs_tol=0.01)
+    lateral_counts = np.histogram(heights[on_lateral], bins=3, range=(0.0, cylinder.height))[0]
+    assert np.allclose(lateral_counts / np.sum(on_lateral), 1.0 / 3.0, atol=0.01)
+    # uniform by area: half of the cap points lie within radius / sqrt(2)
+    cap_distances = distances[on_bottom | on_top]
+    inner_fraction = np.mean(cap_distances < cylinder.radius / math.sqrt(2.0))
+    assert math.isclose(inner_fraction, 0.5, abs_tol=0.01)
+
+def test_create_random_points_exc():
+    """Test the constructor of Cylinder to raise the expected exceptions.
+    """
+    for params, expected_exception in _get_invalid_cylinder_definitions():
+        with pytest.raises(expected_exception):
+            Cylinder(*params)
+
+def _get_valid_cylinder_definitions():
+    """Create a list of valid cylinder parameters.
+
+    Returns:
+        list (tuple (Cylinder, int)): List with cylinders and the desired point count
+    """
+    return [
+        (Cylinder((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, 2.0), 10),
+        (Cylinder((3.0, -5.0, 1.0), (1.0, 2.0, 3.0), 10.0, 0.5, caps=True), 100),
+        (Cylinder((-200.0, 1070.0, 4.5), (-1.0, 0.0, 0.0), 55, 1000), 5),
+        (Cylinder((0.005, -0.00064, 0.0), (0.0, 0.9, 0.0), 0.00085, 0.002, caps=True), 99999)
+    ]
+
+def _get_invalid_cylinder_definitions():
+    """Create a list of invalid cylinder parameters along with the expected exception.
+
+    Returns:
+        list (tuple (tuple, Exception)): List with cylinder parameters and the expected exception
+    """
+    return [
+        (([0.0, 0.0, 0.0], (0.0, 0.0, 1.0), 1.0, 2.0), TypeError),
+        (((0.0, 0.0), (0.0, 0.0, 1.0), 1.0, 2.0), ValueError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 0.5), 1.0, 2.0), ValueError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), "1", 2.0), TypeError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 0.0, 2.0), ValueError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, -2.0), ValueError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, float("inf")), ValueError),
+        (((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, 2.0, "yes"), TypeError)
+    ]
+
+def _calc_cylinder_coords(cylinder, points):
+    """Calculate the heights of the points along the cylinder axis
+    and their distances from the axis.
+    """
+    offsets = points - cylinder.base_center
+    heights = offsets @ cylinder.axis_vec
+    distances = np.linalg.norm(offsets - np.outer(heights, cylinder.axis_vec), axis=1)
+    return (heights, distances)
+
+def _check_valid_cylinder_results(cylinder, points):
+    """Check that each point lies on the lateral surface or, if enabled, on a cap of the cylinder.
+    """
+    (heights, distances) = _calc_cylinder_coords(cylinder, points)
+    tolerance = 0.000001 * max(cylinder.radius, cylinder.height)
+    on_lateral = np.isclose(distances, cylinder.radius, rtol=0.0, atol=tolerance) & \
+      (heights > -tolerance) & (heights < cylinder.height + tolerance)
+    on_caps = (np.isclose(heights, 0.0, rtol=0.0, atol=tolerance) |
+               np.isclose(heights, cylinder.height, rtol=0.0, atol=tolerance)) & \
+      (distances < cylinder.radius + tolerance)
+    if cylinder.caps:
+        assert np.all(on_lateral | on_caps)
+    else:
+        assert np.all(on_lateral)
@@ -0,0 +1,76 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.ellipse2d import Ellipse2D
+
+def test_create_random_points():
+    """Test the create_random_points and create_random_points_array methods of Ellipse2D.
+
+    Create a list of different ellipse definitions along with the desired point count.
+    For each ellipse it is checked if the number of created points matches
+    the expected number of points and if the created points lie on the ellipse.
+    """
+    for ellipse, num_points in _get_valid_ellipse_definitions():
+        for points in [np.array(ellipse.create_random_points(num_points)),
+                       ellipse.create_random_points_array(num_points)]:
+            assert points.shape == (num_points, 2)
+            relative_x = (points[:, 0] - ellipse.center_x) / ellipse.semi_axis_x
+            relative_y = (points[:, 1] - ellipse.center_y) / ellipse.semi_axis_y
+            assert np.allclose(relative_x**2 + relative_y**2, 1.0)
+
+def test_perimeter():
+    """Test the perimeter against Ramanujan's approximation and the circle perimeter.
+    """
+    ellipse = Ellipse2D(0.0, 0.0, 3.0, 1.0)
+    ratio = ((3.0 - 1.0) / (3.0 + 1.0))**2
+    expected = math.pi * 4.0 * (1.0 + 3.0 * ratio / (10.0 + math.sqrt(4.0 - 3.0 * ratio)))
+    assert math.isclose(ellipse.perimeter, expected, rel_tol=1e-6)
+    assert math.isclose(Ellipse2D(1.0, 2.0, 2.5, 2.5).perimeter, 5.0 * math.pi)
+
+def test_arc_length_distribution():
+    """Test if the points are uniformly distributed by arc length.
+
+    The fraction of points near the flat sides (parameter angle within pi/4 of the y axis)
+    must match the fraction of the perimeter of that part of the ellipse.
+    A uniform parameter angle would put only half of the points there.
+    """
+    ellipse = Ellipse2D(1.0, -2.0, 3.0, 1.0, seed=0)
+    nodes = np.linspace(0.0, 2.0 * math.pi, 100000, endpoint=False)
+    arc_length_elements = np.hypot(3.0 * np.sin(nodes), np.cos(nodes))
+    near_flat_side = np.abs(np.sin(nodes)) > math.sqrt(0.5)
+    expected = np.sum(arc_length_elements[near_flat_side]) / np.sum(arc_length_elements)
+    points = ellipse.create_random_points_array(200000)
+    angles = np.arctan2((points[:, 1] + 2.0) / 1.0, (points[:, 0] - 1.0) / 3.0)
+    assert math.isclose(np.mean(np.abs(np.sin(angles)) > math.sqrt(0.5)), expected, abs_tol=0.01)
+    assert expected > 0.6
+
+def test_create_random_points_exc():
+    """Test the constructor of Ellipse2D to raise the expected exceptions.
+    """
+    for params, expected_exception in [
+            (("1", 2.0, 3.0, 1.0), TypeError),
+            ((1.0, float("nan"), 3.0, 1.0), ValueError),
+            ((1.0, 2.0, 0.0, 1.0), ValueError),
+            ((1.0, 2.0, 3.0, -1.0), ValueError),
+            ((1.0, 2.0, 3.0, None), TypeError)]:
+        with pytest.raises(expected_exception):
+            Ellipse2D(*params)
+
+def _get_valid_ellipse_definitions():
+    """Create a list of valid 2D ellipses along with the desired point count.
+
+    Returns:
+        list (tuple (Ellipse2D, int)): List with 2D ellipses and the desired point count
+    """
+    return [
+        (Ellipse2D(3.0, 5.0, 10.0, 1.0), 5),
+        (Ellipse2D(-2.0, 4.0, 5.0, 5.0), 20),
+        (Ellipse2D(3.55, -44.2, 5422.5, 0.5), 100),
+        (Ellipse2D(0.005, -0.00064, 0.00085, 0.002), 99999)
+    ]
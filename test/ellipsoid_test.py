@@ -0,0 +1,76 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.ellipsoid import Ellipsoid
+
+def test_create_random_points():
+    """Test the create_random_points and create_random_points_array methods of Ellipsoid.
+
+    Create a list of different ellipsoid definitions along with the desired point count.
+    For each ellipsoid it is checked if the number of created points matches
+    the expected number of points and if the created points lie on the ellipsoid.
+    """
+    for ellipsoid, num_points in _get_valid_ellipsoid_definitions():
+        for points in [np.array(ellipsoid.create_random_points(num_points)),
+                       ellipsoid.create_random_points_array(num_points)]:
+            assert points.shape == (num_points, 3)
+            center = (ellipsoid.center_x, ellipsoid.center_y, ellipsoid.center_z)
+            relative_points = (points - center) / ellipsoid.semi_axes
+            assert np.allclose(np.sum(relative_points**2, axis=1), 1.0)
+
+def test_area():
+    """Test the area against the closed-form areas of a sphere and a prolate spheroid.
+    """
+    assert math.isclose(Ellipsoid(0.0, 0.0, 0.0, 2.0, 2.0, 2.0).area, 16.0 * math.pi)
+    eccentricity = math.sqrt(1.0 - 1.0 / 9.0)
+    expected = 2.0 * math.pi * (1.0 + 3.0 / eccentricity * math.asin(eccentricity))
+    assert math.isclose(Ellipsoid(0.0, 0.0, 0.0, 1.0, 1.0, 3.0).area, expected, rel_tol=1e-9)
+
+def test_area_distribution():
+    """Test if the points are uniformly distributed by area.
+
+    For a prolate spheroid the fraction of points with |z| > c / 2 must match the
+    fraction of the area of both polar zones, which is integrated numerically
+    from the surface of revolution r(z) = a * sqrt(1 - (z / c)**2).
+    """
+    (semi_a, semi_c) = (1.0, 3.0)
+    ellipsoid = Ellipsoid(1.0, 2.0, 3.0, semi_a, semi_a, semi_c, seed=0)
+    heights = np.linspace(-semi_c, semi_c, 2000001)[1:-1]
+    radii = semi_a * np.sqrt(1.0 - (heights / semi_c)**2)
+    slopes = -semi_a**2 * heights / (semi_c**2 * radii)
+    zone_areas = radii * np.sqrt(1.0 + slopes**2)
+    expected = np.sum(zone_areas[np.abs(heights) > semi_c / 2.0]) / np.sum(zone_areas)
+    points = ellipsoid.create_random_points_array(200000)
+    fraction = np.mean(np.abs(points[:, 2] - 3.0) > semi_c / 2.0)
+    assert math.isclose(fraction, expected, abs_tol=0.01)
+
+def test_create_random_points_exc():
+    """Test the constructor of Ellipsoid to raise the expected exceptions.
+    """
+    for params, expected_exception in [
+            (("1", 2.0, 3.0, 1.0, 1.0, 1.0), TypeError),
+            ((1.0, 2.0, float("inf"), 1.0, 1.0, 1.0), ValueError),
+            ((1.0, 2.0, 3.0, 0.0, 1.0, 1.0), ValueError),
+            ((1.0, 2.0, 3.0, 1.0, -1.0, 1.0), ValueError),
+            ((1.0, 2.0, 3.0, 1.0, 1.0, "1"), TypeError)]:
+        with pytest.raises(expected_exception):
+            Ellipsoid(*params)
+
+def _get_valid_ellipsoid_definitions():
+    """Create a list of valid ellipsoids along with the desired point count.
+
+    Returns:
+        list (tuple (Ellipsoid, int)): List with ellipsoids and the desired point count
+    """
+    return [
+        (Ellipsoid(3.0, 5.0, 1.0, 10.0, 1.0, 2.0), 5),
+        (Ellipsoid(-2.0, 4.0, 0.0, 5.0, 5.0, 5.0), 20),
+        (Ellipsoid(3.55, -44.2, 17.0, 5422.5, 0.5, 100.0), 100),
+        (Ellipsoid(0.005, -0.00064, 0.0, 0.00085, 0.002, 0.001), 99999)
+    ]
@@ -0,0 +1,52 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.export import generate_to_file, NPY, RAW
+from geometry_helpers import get_geometries
+
+def test_generate_to_file(tmp_path):
+    """Test the generate_to_file function of the export module.
+
+    For each geometry the points are exported in both file formats. It is checked if
+    the files contain the same points as created by an equally seeded geometry.
+    The chunk size is reduced, so the exported points are written in several chunks.
+    """
+    for geometry1, geometry2, geometry3 in zip(get_geometries(), get_geometries(),
+                                               get_geometries()):
+        for geometry in (geometry1, geometry2, geometry3):
+            geometry.chunk_size = 100
+        expected_points = geometry1.create_random_points_array(1005)
+        npy_path = str(tmp_path / "points.npy")
+        raw_path = str(tmp_path / "points.raw")
+        assert generate_to_file(geometry2, npy_path, 1005) == npy_path
+        assert generate_to_file(geometry3, raw_path, 1005, file_format=RAW) == raw_path
+        npy_points = np.load(npy_path)
+        raw_points = np.fromfile(raw_path, dtype=np.float64).reshape(1005, geometry1.dimension)
+        assert np.array_equal(npy_points, expected_points)
+        assert np.array_equal(raw_points, expected_points)
+
+def test_generate_to_file_exc(tmp_path):
+    """Test the generate_to_file function to raise the expected exceptions.
+    """
+    geometry = Circle2D(0, 0, 1)
+    path = str(tmp_path / "points.npy")
+    expect_type_errors = [
+        ("10", NPY),
+        (10, 1)
+    ]
+    expect_value_errors = [
+        (0, NPY),
+        (10, "csv")
+    ]
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            generate_to_file(geometry, path, param[0], file_format=param[1])
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            generate_to_file(geometry, path, param[0], file_format=param[1])
@@ -0,0 +1,128 @@
+"""Geometry objects and surface distances shared by the tests of the point creation features
+that work for every geometry, e.g. parallel creation, export and instrumentation.
+
+The test modules add the project path to sys.path before importing this module.
+"""
+
+import numpy as np
+
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.circle3d import Circle3D
+from random_geometry_points.ellipse2d import Ellipse2D
+from random_geometry_points.sphere import Sphere
+from random_geometry_points.ellipsoid import Ellipsoid
+from random_geometry_points.cylinder import Cylinder
+from random_geometry_points.cone import Cone
+from random_geometry_points.plane import Plane
+from random_geometry_points.mesh import Mesh
+from random_geometry_points.scene import Scene
+
+TETRAHEDRON_VERTICES = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]
+TETRAHEDRON_FACES = [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)]
+
+def get_geometries(seed=42):
+    """Create a list with one seeded object of each geometry type,
+    including a scene of a sphere and a cylinder.
+
+    Args:
+        seed (int): The seed for the random generators of the geometry objects
+
+    Returns:
+        list (Geometry): List with geometry objects
+    """
+    return [
+        Circle2D(1.0, -2.0, 3.0, seed=seed),
+        Circle3D((1.0, -2.0, 3.0), (1.0, 1.0, 0.0), 4.0, seed=seed),
+        Ellipse2D(1.0, -2.0, 3.0, 1.5, seed=seed),
+        Sphere(1.0, -2.0, 3.0, 4.0, seed=seed),
+        Ellipsoid(1.0, -2.0, 3.0, 4.0, 2.0, 1.0, seed=seed),
+        Cylinder((1.0, -2.0, 3.0), (0.0, 1.0, 1.0), 2.0, 5.0, caps=True, seed=seed),
+        Cone((1.0, -2.0, 3.0), (1.0, 0.0, 1.0), 2.0, 3.0, cap=True, seed=seed),
+        Plane.from_normal_form((1.0, 2.0, 3.0), (1.0, -2.0, 3.0), 4.0, seed=seed),
+        Mesh(TETRAHEDRON_VERTICES, TETRAHEDRON_FACES, seed=seed),
+        Scene([Sphere(0.0, 0.0, 0.0, 1.0),
+               Cylinder((3.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0, 2.0)], seed=seed)
+    ]
+
+def calc_distances(geometry, points):
+    """Calculate the distances of the points from the geometry surface.
+
+    For ellipses and ellipsoids the deviation from their implicit equation is returned
+    instead, which is zero on the surface as well.
+
+    Args:
+        geometry (Geometry): The geometry the points were created for
+        points (numpy.ndarray): The points as array of shape (n, dimension)
+
+    Returns:
+        numpy.ndarray: The distance of each point from the geometry surface
+    """
+    if isinstance(geometry, Circle2D):
+        center = (geometry.center_x, geometry.center_y)
+        return np.linalg.norm(points - center, axis=1) - geometry.radius
+    elif isinstance(geometry, Circle3D):
+        (normal_components, radial_components) = _calc_axial_coords(
+            points, geometry.center, geometry.normal_vec)
+        return np.hypot(normal_components, radial_components - geometry.radius)
+    elif isinstance(geometry, Ellipse2D):
+        center = (geometry.center_x, geometry.center_y)
+        semi_axes = (geometry.semi_axis_x, geometry.semi_axis_y)
+        return np.sum(((points - center) / semi_axes) ** 2, axis=1) - 1.0
+    elif isinstance(geometry, Sphere):
+        center = (geometry.center_x, geometry.center_y, geometry.center_z)
+        return np.linalg.norm(points - center, axis=1) - geometry.radius
+    elif isinstance(geometry, Ellipsoid):
+        center = (geometry.center_x, geometry.center_y, geometry.center_z)
+        return np.sum(((points - center) / geometry.semi_axes) ** 2, axis=1) - 1.0
+    elif isinstance(geometry, Cylinder):
+        return _calc_cylinder_distances(geometry, points)
+    elif isinstance(geometry, Cone):
+        return _calc_cone_distances(geometry, points)
+    elif isinstance(geometry, Mesh):
+        return _calc_mesh_distances(geometry, points)
+    elif isinstance(geometry, Scene):
+        return np.min([np.abs(calc_distances(part, points)) for part in geometry.geometries],
+                      axis=0)
+    return points @ geometry.normal_vec - geometry.d_origin
+
+def _calc_axial_coords(points, origin, axis_vec):
+    """Calculate the axial and radial coordinates of the points relative to an axis.
+    """
+    offsets = points - origin
+    axial_components = offsets @ axis_vec
+    radial_offsets = offsets - np.outer(axial_components, axis_vec)
+    return (axial_components, np.linalg.norm(radial_offsets, axis=1))
+
+def _calc_cylinder_distances(cylinder, points):
+    """Calculate the distances of the points from the lateral surface and the caps of a cylinder.
+    """
+    (heights, radii) = _calc_axial_coords(points, cylinder.base_center, cylinder.axis_vec)
+    distances = np.hypot(radii - cylinder.radius, heights - np.clip(heights, 0.0, cylinder.height))
+    if cylinder.caps:
+        outside = np.maximum(radii - cylinder.radius, 0.0)
+        distances = np.minimum(distances, np.hypot(heights, outside))
+        distances = np.minimum(distances, np.hypot(heights - cylinder.height, outside))
+    return distances
+
+def _calc_cone_distances(cone, points):
+    """Calculate the distances of the points from the lateral surface and the base of a cone.
+    """
+    (heights, radii) = _calc_axial_coords(points, cone.base_center, cone.axis_vec)
+    # the lateral surface is the segment from (radius, 0) to (0, height) in the axial plane
+    segment = np.array([-cone.radius, cone.height])
+    params = np.clip(((radii - cone.radius) * segment[0] + heights * segment[1])
+                     / (segment @ segment), 0.0, 1.0)
+    distances = np.hypot(radii - cone.radius - params * segment[0], heights - params * segment[1])
+    if cone.cap:
+        distances = np.minimum(distances, np.hypot(heights,
+                                                   np.maximum(radii - cone.radius, 0.0)))
+    return distances
+
+def _calc_mesh_distances(mesh, points):
+    """Calculate the distances of the points from the nearest plane of a mesh triangle.
+    """
+    triangles = mesh.triangles
+    normals = np.cross(triangles.edges_ab, triangles.edges_ac)
+    normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+    offsets = np.sum(normals * triangles.corners, axis=1)
+    return np.min(np.abs(points @ normals.T - offsets), axis=1)
@@ -0,0 +1,206 @@
+import sys
+import os
+import math
+import array
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.circle3d import Circle3D
+from random_geometry_points.sphere import Sphere
+from random_geometry_points.plane import Plane
+from random_geometry_points.geometry import DEFAULT_CHUNK_SIZE
+from geometry_helpers import calc_distances
+
+def test_chunked_generation():
+    """Test the chunked point creation of the Geometry base class.
+
+    For each geometry the chunk size is set to a value that does not divide
+    the number of points. It is checked if all three point creation methods
+    return the expected number of points and if the points lie on the geometry surface.
+    """
+    for geometry in _get_geometries():
+        geometry.chunk_size = 7
+        num_points = 100
+        points_list = geometry.create_random_points(num_points)
+        points_gen = list(geometry.create_random_point_generator(num_points))
+        points_array = geometry.create_random_points_array(num_points)
+        assert len(points_list) == num_points
+        assert len(points_gen) == num_points
+        assert points_array.shape == (num_points, geometry.dimension)
+        for points in [points_list, points_gen, points_array]:
+            assert all(len(point) == geometry.dimension for point in points)
+            assert np.allclose(calc_distances(geometry, np.array(points)), 0.0, atol=0.000001)
+
+def test_large_point_count():
+    """Test the creation of more points than fit into a single chunk.
+    """
+    for geometry in _get_geometries():
+        num_points = 2 * geometry.chunk_size + 5
+        points = geometry.create_random_points_array(num_points)
+        assert points.shape == (num_points, geometry.dimension)
+        assert np.allclose(calc_distances(geometry, points), 0.0, atol=0.000001)
+        assert len(geometry.create_random_points(100000)) == 100000
+
+def test_lazy_generators():
+    """Test the point and chunk generators to create the points lazily.
+
+    The number of points is chosen far too large to be created at once,
+    so taking the first points only succeeds if the generators work lazily.
+    """
+    for geometry in _get_geometries():
+        point_gen = geometry.create_random_point_generator(10**12, chunk_size=10)
+        points = np.array([next(point_gen) for _ in range(25)])
+        assert np.allclose(calc_distances(geometry, points), 0.0, atol=0.000001)
+        chunk_gen = geometry.create_random_chunk_generator(10**12, chunk_size=10)
+        assert next(chunk_gen).shape == (10, geometry.dimension)
+        chunks = list(geometry.create_random_chunk_generator(25, chunk_size=10))
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        with pytest.raises(ValueError):
+            geometry.create_random_chunk_generator(25, chunk_size=0)
+        with pytest.raises(TypeError):
+            geometry.create_random_point_generator(25, chunk_size=2.5)
+
+def test_output_buffer():
+    """Test the creation of random points into caller provided buffers.
+
+    For each geometry the points are written into numpy arrays, a view of a larger
+    ring buffer, an array.array and a bytearray. It is checked if the buffers
+    are filled in place with points lying on the geometry surface.
+    """
+    for geometry in _get_geometries():
+        geometry.chunk_size = 7
+        dimension = geometry.dimension
+        ring_buffer = np.zeros((100, dimension))
+        buffers = [
+            np.empty((20, dimension)),
+            np.empty((20, dimension), order="F"),
+            ring_buffer[40:60],
+            array.array("d", [0.0] * 20 * dimension),
+            bytearray(20 * dimension * 8)
+        ]
+        for out in buffers:
+            assert geometry.create_random_points_array(20, out=out) is out
+            points = np.frombuffer(out).reshape(20, dimension) \
+              if not isinstance(out, np.ndarray) else out
+            assert np.allclose(calc_distances(geometry, points), 0.0, atol=0.000001)
+        assert np.all(ring_buffer[:40] == 0.0) and np.all(ring_buffer[60:] == 0.0)
+        assert np.allclose(calc_distances(geometry, ring_buffer[40:60]), 0.0, atol=0.000001)
+        expect_type_errors = [
+            [0.0] * 20 * dimension,
+            np.empty((20, dimension), dtype=np.float32),
+            array.array("f", [0.0] * 20 * dimension)
+        ]
+        expect_value_errors = [
+            np.empty((21, dimension)),
+            np.empty((dimension, 20)),
+            array.array("d", [0.0] * 19 * dimension),
+            bytes(20 * dimension * 8)
+        ]
+        for out in expect_type_errors:
+            with pytest.raises(TypeError):
+                geometry.create_random_points_array(20, out=out)
+        for out in expect_value_errors:
+            with pytest.raises(ValueError):
+                geometry.create_random_points_array(20, out=out)
+
+def test_max_points():
+    """Test the configurable upper limit for the number of points.
+
+    Without a limit arbitrary point counts are accepted. After setting max_points
+    all point creation methods must raise a ValueError for larger point counts.
+    """
+    for geometry in _get_geometries():
+        assert geometry.max_points is None
+        geometry.max_points = 10
+        assert len(geometry.create_random_points(10)) == 10
+        with pytest.raises(ValueError):
+            geometry.create_random_points(11)
+        with pytest.raises(ValueError):
+            geometry.create_random_point_generator(11)
+        with pytest.raises(ValueError):
+            geometry.create_random_points_array(11)
+        with pytest.raises(ValueError):
+            geometry.create_random_chunk_generator(11)
+        geometry.max_points = None
+        assert len(geometry.create_random_points(11)) == 11
+
+def test_chunk_size_exc():
+    """Test if inproper chunk sizes and upper limits are rejected when they are set.
+
+    Otherwise a chunk size of zero would let create_random_points_array return
+    the uninitialized array without raising.
+    """
+    for geometry in _get_geometries():
+        for chunk_size, error in [(0, ValueError), (-5, ValueError), (2.5, TypeError),
+                                  ("10", TypeError), (True, TypeError)]:
+            with pytest.raises(error):
+                geometry.chunk_size = chunk_size
+        for max_points, error in [(0, ValueError), (-5, ValueError), (2.5, TypeError),
+                                  (True, TypeError)]:
+            with pytest.raises(error):
+                geometry.max_points = max_points
+        assert geometry.chunk_size == DEFAULT_CHUNK_SIZE
+        assert geometry.max_points is None
+
+def test_seed():
+    """Test the random points of equally seeded geometries to be equal.
+    """
+    for geometry1, geometry2, geometry3 in zip(_get_geometries(42), _get_geometries(42),
+                                               _get_geometries(43)):
+        points1 = geometry1.create_random_points_array(100)
+        points2 = geometry2.create_random_points_array(100)
+        points3 = geometry3.create_random_points_array(100)
+        assert np.array_equal(points1, points2)
+        assert not np.array_equal(points1, points3)
+        assert geometry1.create_random_points(5) == geometry2.create_random_points(5)
+    generator = np.random.default_rng(1)
+    assert Circle2D(0, 0, 1, seed=generator).rng is generator
+
+def test_spawn():
+    """Test the spawn method of the Geometry base class.
+
+    The copies must create points lying on the same geometry surface. The copies of
+    equally seeded geometries must create equal points, while the points
+    of copies of one geometry must differ.
+    """
+    for geometry1, geometry2 in zip(_get_geometries(42), _get_geometries(42)):
+        children1 = geometry1.spawn(3)
+        children2 = geometry2.spawn(3)
+        points1 = [child.create_random_points_array(100) for child in children1]
+        points2 = [child.create_random_points_array(100) for child in children2]
+        for child, child_points1, child_points2 in zip(children1, points1, points2):
+            assert type(child) is type(geometry1)
+            assert np.array_equal(child_points1, child_points2)
+            assert np.allclose(calc_distances(child, child_points1), 0.0, atol=0.000001)
+        assert not np.array_equal(points1[0], points1[1])
+        assert not np.array_equal(points1[0], geometry1.create_random_points_array(100))
+        with pytest.raises(ValueError):
+            geometry1.spawn(0)
+
+def test_measure():
+    """Test the measure (length or area) of each geometry type.
+    """
+    expected_measures = [2.0 * math.pi * 3.0, 2.0 * math.pi * 4.0, 4.0 * math.pi * 16.0,
+                         math.pi * 16.0]
+    for geometry, expected_measure in zip(_get_geometries(), expected_measures):
+        assert math.isclose(geometry.measure, expected_measure)
+
+def _get_geometries(seed=None):
+    """Create a list with one object of each geometry type.
+
+    Args:
+        seed (int): The seed for the random generators of the geometry objects
+
+    Returns:
+        list (Geometry): List with geometry objects
+    """
+    return [
+        Circle2D(1.0, -2.0, 3.0, seed=seed),
+        Circle3D((1.0, -2.0, 3.0), (1.0, 1.0, 0.0), 4.0, seed=seed),
+        Sphere(1.0, -2.0, 3.0, 4.0, seed=seed),
+        Plane.from_normal_form((1.0, 2.0, 3.0), (1.0, -2.0, 3.0), 4.0, seed=seed)
+    ]
@@ -0,0 +1,58 @@
+import sys
+import os
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.instrumentation import Instrumentation, CALL, RNG, TRANSFORM, OUTPUT
+from geometry_helpers import get_geometries
+
+def test_instrumentation():
+    """Test the counters and timers of an Instrumentation assigned to a geometry.
+
+    For each geometry all point creation methods are called. It is checked if the calls
+    and points are counted and if the time of each stage is accumulated.
+    """
+    for geometry in get_geometries():
+        instrumentation = Instrumentation()
+        geometry.instrumentation = instrumentation
+        geometry.chunk_size = 10
+        geometry.create_random_points_array(25)
+        assert instrumentation.calls == 1
+        assert instrumentation.points == 25
+        assert instrumentation.rng_time > 0.0
+        assert instrumentation.transform_time > 0.0
+        assert instrumentation.output_time == 0.0
+        geometry.create_random_points(25)
+        list(geometry.create_random_point_generator(25))
+        list(geometry.create_random_chunk_generator(25))
+        assert instrumentation.calls == 4
+        assert instrumentation.points == 100
+        assert instrumentation.output_time > 0.0
+        instrumentation.reset()
+        assert instrumentation.as_dict() == {
+            "calls": 0, "points": 0, "rng_time": 0.0, "transform_time": 0.0, "output_time": 0.0
+        }
+
+def test_callbacks():
+    """Test the callbacks of an Instrumentation to be notified about each event.
+    """
+    for geometry in get_geometries():
+        events = []
+        geometry.instrumentation = Instrumentation([lambda *event: events.append(event)])
+        geometry.chunk_size = 10
+        geometry.create_random_points(15)
+        assert [event[0] for event in events] == [CALL, RNG, TRANSFORM, OUTPUT,
+                                                  RNG, TRANSFORM, OUTPUT]
+        assert [event[1] for event in events] == [15, 10, 10, 10, 5, 5, 5]
+        assert all(event[2] >= 0.0 for event in events)
+
+def test_disabled_instrumentation():
+    """Test the point creation without instrumentation to create the same points.
+    """
+    for geometry1, geometry2 in zip(get_geometries(), get_geometries()):
+        geometry1.instrumentation = Instrumentation()
+        assert geometry2.instrumentation is None
+        assert np.array_equal(geometry1.create_random_points_array(25),
+                              geometry2.create_random_points_array(25))
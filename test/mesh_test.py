@@ -0,0 +1,93 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.mesh import Mesh
+
+def test_create_random_points():
+    """Test the create_random_points and create_random_points_array methods of Mesh.
+
+    For a cube mesh it is checked if the number of created points matches
+    the expected number of points and if the created points lie on the cube surface.
+    """
+    mesh = _get_cube_mesh(2.0)
+    assert math.isclose(mesh.area, 6.0 * 4.0)
+    for points in [np.array(mesh.create_random_points(1000)),
+                   mesh.create_random_points_array(1000)]:
+        assert points.shape == (1000, 3)
+        assert np.allclose(np.max(np.abs(points), axis=1), 1.0)
+
+def test_area_weighted_distribution():
+    """Test if the points are uniformly distributed over the mesh surface.
+
+    The mesh consists of two triangles with the areas 1 and 3, so a quarter
+    of the points must lie on the first triangle. Within a triangle the points
+    must be uniformly distributed, i.e. a quarter of them lies in the corner
+    triangle that is cut off at half the edge lengths.
+    """
+    vertices = [(0, 0, 0), (2, 0, 0), (0, 1, 0), (0, 0, 1), (6, 0, 1), (0, 0, 2)]
+    mesh = Mesh(vertices, [(0, 1, 2), (3, 4, 5)], seed=0)
+    assert np.allclose(mesh.triangles.areas, (1.0, 3.0))
+    points = mesh.create_random_points_array(200000)
+    on_first = np.isclose(points[:, 2], 0.0)
+    assert math.isclose(np.mean(on_first), 0.25, abs_tol=0.01)
+    first_points = points[on_first]
+    in_corner = first_points[:, 0] / 2.0 + first_points[:, 1] < 0.5
+    assert math.isclose(np.mean(in_corner), 0.25, abs_tol=0.01)
+    assert np.all(first_points[:, 0] / 2.0 + first_points[:, 1] <= 1.0 + 0.000001)
+    assert np.all(first_points[:, :2] >= 0.0)
+
+def test_degenerate_triangles():
+    """Test if no points are created on triangles without area.
+    """
+    vertices = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (2, 2, 2)]
+    mesh = Mesh(vertices, [(0, 1, 2), (0, 1, 1), (3, 3, 3)])
+    points = mesh.create_random_points_array(1000)
+    assert np.allclose(points[:, 2], 0.0)
+
+def test_create_mesh_exc():
+    """Test the constructor of Mesh to raise the expected exceptions.
+    """
+    vertices = [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+    expect_type_errors = [
+        ("test", [(0, 1, 2)]),
+        (vertices, [(0.0, 1.0, 2.0)]),
+        (vertices, "test")
+    ]
+    expect_value_errors = [
+        ([(0, 0), (1, 0), (0, 1)], [(0, 1, 2)]),
+        (vertices, [(0, 1)]),
+        (vertices, np.zeros((0, 3), dtype=int)),
+        (vertices, [(0, 1, 3)]),
+        (vertices, [(-1, 1, 2)]),
+        (vertices, [(0, 1, 1)])
+    ]
+    for params in expect_type_errors:
+        with pytest.raises(TypeError):
+            Mesh(*params)
+    for params in expect_value_errors:
+        with pytest.raises(ValueError):
+            Mesh(*params)
+
+def _get_cube_mesh(edge_length):
+    """Create a mesh of the surface of a cube centered at the origin.
+
+    Args:
+        edge_length (float): The edge length of the cube
+
+    Returns:
+        Mesh: The cube mesh consisting of 12 triangles
+    """
+    half = 0.5 * edge_length
+    vertices = [(x, y, z) for x in (-half, half) for y in (-half, half) for z in (-half, half)]
+    faces = [
+        (0, 1, 3), (0, 3, 2), (4, 6, 7), (4, 7, 5),
+        (0, 4, 5), (0, 5, 1), (2, 3, 7), (2, 7, 6),
+        (0, 2, 6), (0, 6, 4), (1, 5, 7), (1, 7, 3)
+    ]
+    return Mesh(vertices, faces)
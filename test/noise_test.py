@@ -0,0 +1,99 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.noise import GaussianNoise, NormalNoise, Outliers
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.circle3d import Circle3D
+from random_geometry_points.sphere import Sphere
+from random_geometry_points.plane import Plane
+from random_geometry_points.scene import Scene
+
+def test_gaussian_noise():
+    """Test if the isotropic Gaussian noise shifts each coordinate with the expected
+    standard deviation.
+    """
+    plane = Plane.from_normal_form((0.0, 0.0, 1.0), (1.0, 2.0, 3.0), 5.0, seed=0)
+    plane.noise = [GaussianNoise(0.1)]
+    points = plane.create_random_points_array(100000)
+    assert math.isclose(np.std(points[:, 2]), 0.1, rel_tol=0.02)
+    assert math.isclose(np.mean(points[:, 2]), 3.0, abs_tol=0.002)
+
+def test_normal_noise():
+    """Test if the normal noise shifts the points only along the surface normals.
+    """
+    sphere = Sphere(1.0, 2.0, 3.0, 4.0, seed=1)
+    sphere.noise = [NormalNoise(0.05)]
+    points = sphere.create_random_points_array(100000)
+    distances = np.linalg.norm(points - (1.0, 2.0, 3.0), axis=1) - 4.0
+    assert math.isclose(np.std(distances), 0.05, rel_tol=0.02)
+    circle = Circle2D(1.0, 2.0, 3.0, seed=2)
+    circle.noise = [NormalNoise(0.05)]
+    distances = np.linalg.norm(circle.create_random_points_array(100000) - (1.0, 2.0), axis=1) - 3.0
+    assert math.isclose(np.std(distances), 0.05, rel_tol=0.02)
+    plane = Plane.from_normal_form((1.0, 1.0, 0.0), (1.0, 2.0, 3.0), 5.0, seed=3)
+    plane.noise = [NormalNoise(0.05)]
+    points = plane.create_random_points_array(100000)
+    distances = points @ plane.normal_vec - plane.d_origin
+    assert math.isclose(np.std(distances), 0.05, rel_tol=0.02)
+    in_plane_offsets = points - plane.ref_point - np.outer(distances, plane.normal_vec)
+    assert np.all(np.linalg.norm(in_plane_offsets, axis=1) <= 5.0 + 0.000001)
+
+def test_offset_along_normals():
+    """Test the public hook custom noise stages use to shift points along the normals.
+    """
+    sphere = Sphere(1.0, 2.0, 3.0, 4.0, seed=4)
+    points = sphere.create_random_points_array(100)
+    sphere.offset_along_normals(points, np.full(100, 0.5))
+    assert np.allclose(np.linalg.norm(points - (1.0, 2.0, 3.0), axis=1), 4.5)
+    circle = Circle3D((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0)
+    with pytest.raises(TypeError):
+        circle.offset_along_normals(circle.create_random_points_array(10), np.zeros(10))
+
+def test_outliers():
+    """Test if the expected fraction of points becomes outliers.
+    """
+    sphere = Sphere(0.0, 0.0, 0.0, 1.0, seed=4)
+    sphere.noise = [NormalNoise(0.001), Outliers(0.01, 10.0)]
+    points = sphere.create_random_points_array(100000)
+    distances = np.abs(np.linalg.norm(points, axis=1) - 1.0)
+    assert math.isclose(np.mean(distances > 0.01), 0.01, abs_tol=0.002)
+
+def test_noise_reproducibility():
+    """Test if equally seeded geometries create equal noisy points and noise stages
+    of the geometries of a scene are applied.
+    """
+    points = []
+    for _ in range(2):
+        circle = Circle2D(1.0, 2.0, 3.0, seed=5)
+        circle.noise = [GaussianNoise(0.1), Outliers(0.1, 5.0)]
+        points.append(circle.create_random_points_array(1000))
+    assert np.array_equal(points[0], points[1])
+    noisy_sphere = Sphere(0.0, 0.0, 0.0, 1.0)
+    noisy_sphere.noise = [NormalNoise(0.1)]
+    scene = Scene([Sphere(10.0, 0.0, 0.0, 1.0), noisy_sphere], weights=[1, 1], seed=6)
+    scene_points = scene.create_random_points_array(1000)
+    distances = np.abs(np.linalg.norm(scene_points, axis=1) - 1.0)
+    on_noisy_sphere = scene_points[:, 0] < 5.0
+    assert np.all(distances[on_noisy_sphere] < 1.0) and np.any(distances[on_noisy_sphere] > 0.01)
+
+def test_noise_exc():
+    """Test the noise stages to raise the expected exceptions.
+    """
+    for create_stage, error in [
+            (lambda: GaussianNoise("1"), TypeError),
+            (lambda: GaussianNoise(0.0), ValueError),
+            (lambda: NormalNoise(-1.0), ValueError),
+            (lambda: Outliers(1.5, 1.0), ValueError),
+            (lambda: Outliers(0.1, float("nan")), ValueError)]:
+        with pytest.raises(error):
+            create_stage()
+    circle = Circle3D((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), 1.0)
+    circle.noise = [NormalNoise(0.1)]
+    with pytest.raises(TypeError):
+        circle.create_random_points_array(10)
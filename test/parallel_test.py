@@ -0,0 +1,71 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.parallel import generate_parallel
+from geometry_helpers import get_geometries, calc_distances
+
+def test_generate_parallel():
+    """Test the generate_parallel function of the parallel module.
+
+    For each geometry the points are created with different numbers of workers.
+    It is checked if the points lie on the geometry surface and if the result
+    does not depend on the number of workers.
+    """
+    for geometry in get_geometries():
+        points = generate_parallel(geometry, 1005, workers=2, shard_size=100)
+        assert points.shape == (1005, geometry.dimension)
+        assert np.allclose(calc_distances(geometry, points), 0.0, atol=0.000001)
+    for geometry1, geometry2 in zip(get_geometries(), get_geometries()):
+        points1 = generate_parallel(geometry1, 1005, workers=2, shard_size=100)
+        points2 = generate_parallel(geometry2, 1005, workers=1, shard_size=100)
+        assert np.array_equal(points1, points2)
+
+def test_generate_parallel_stream():
+    """Test the generate_parallel function to stream the shards in order.
+    """
+    for geometry1, geometry2 in zip(get_geometries(), get_geometries()):
+        points = generate_parallel(geometry1, 1005, workers=2, shard_size=100)
+        chunks = list(generate_parallel(geometry2, 1005, workers=2, shard_size=100, stream=True))
+        assert [len(chunk) for chunk in chunks] == [100] * 10 + [5]
+        assert np.array_equal(np.concatenate(chunks), points)
+
+def test_generate_parallel_spawn():
+    """Test if the shards are created by the copies of the geometry that spawn would create.
+
+    The child random generators are created lazily per task, but in the same order
+    as by spawn. The geometries are sent to the worker processes once, not per task.
+    """
+    for geometry, twin in zip(get_geometries(), get_geometries()):
+        points = generate_parallel(geometry, 1005, workers=2, shard_size=100)
+        shards = twin.spawn(11)
+        expected_points = np.concatenate(
+            [shard.create_random_points_array(min(100, 1005 - 100 * index))
+             for index, shard in enumerate(shards)])
+        assert np.array_equal(points, expected_points)
+
+def test_generate_parallel_exc():
+    """Test the generate_parallel function to raise the expected exceptions.
+    """
+    geometry = Circle2D(0, 0, 1)
+    expect_type_errors = [
+        ("10", 2, 100),
+        (10, 2.0, 100),
+        (10, 2, "100")
+    ]
+    expect_value_errors = [
+        (0, 2, 100),
+        (10, 0, 100),
+        (10, 2, 0)
+    ]
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            generate_parallel(geometry, param[0], workers=param[1], shard_size=param[2])
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            generate_parallel(geometry, param[0], workers=param[1], shard_size=param[2])
@@ -2,6 +2,7 @@ import sys
 import os
 import math
 import pytest
+import numpy as np
 
 PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJ_PATH + '/../')
@@ -34,8 +35,111 @@ def test_create_random_points_gen():
         plane_points = [point for point in plane[0].create_random_point_generator(plane[1])]
         _check_valid_plane_results(plane[0], plane[1], plane_points)
 
+def test_create_random_points_array():
+    """Test the create_random_points_array method of Plane.
+
+    Create a list of different plane definitions along with the desired point count.
+    For each plane it is checked if the returned array has the expected shape and type.
+    Furthermore it is checked if the created points lie on the plane, respectively.
+    """
+    planes = _get_valid_plane_definitions()
+    for plane in planes:
+        plane_points = plane[0].create_random_points_array(plane[1])
+        assert isinstance(plane_points, np.ndarray)
+        assert plane_points.shape == (plane[1], 3)
+        assert plane_points.dtype == np.float64
+        _check_valid_plane_results(plane[0], plane[1], plane_points.tolist())
+
+def test_basis():
+    """Test the orthonormal basis of Plane.
+
+    Both basis vectors must be unit vectors that are perpendicular to each other
+    and to the plane's normal vector.
+    """
+    planes = _get_valid_plane_definitions()
+    for plane in planes:
+        basis = np.array(plane[0].basis)
+        frame = np.vstack((basis, plane[0].normal_vec))
+        assert np.allclose(frame @ frame.T, np.eye(3))
+
+def test_area_distribution():
+    """Test the points to be uniformly distributed over the plane's disc.
+
+    All points must lie within the disc. For a uniform distribution by area
+    the mean squared distance from the reference point is radius**2 / 2.
+    """
+    plane = Plane.from_normal_form((1, 2, 3), (4, 5, 6), 2.0)
+    plane_points = plane.create_random_points_array(99999)
+    squared_distances = np.sum((plane_points - plane.ref_point)**2, axis=1)
+    assert np.all(squared_distances <= 4.0 + 0.000001)
+    assert math.isclose(np.mean(squared_distances), 2.0, abs_tol=0.02)
+
+def test_rectangle():
+    """Test the creation of points within a rectangle.
+
+    All points must lie within the rectangle and their coordinates along both axes
+    must be uniformly distributed.
+    """
+    plane = Plane.from_rectangle((1.0, 2.0, 3.0), (1.0, 1.0, 0.0), (0.0, 0.0, 2.0), (4.0, 1.0),
+                                 seed=0)
+    assert plane.extents == (4.0, 1.0) and plane.triangles is None
+    disc = Plane.from_normal_form((1, 2, 3), (4, 5, 6), 2.0)
+    assert disc.extents is None and disc.vertices is None and disc.triangles is None
+    assert math.isclose(plane.measure, 4.0)
+    plane_points = plane.create_random_points_array(100000)
+    _check_valid_plane_results(plane, 100000, plane_points.tolist())
+    coords = (plane_points - plane.ref_point) @ np.array(plane.basis).T
+    assert np.all(np.abs(coords) <= np.array([2.0, 0.5]) + 0.000001)
+    for axis, extent in enumerate(plane.extents):
+        counts = np.histogram(coords[:, axis], bins=4, range=(-extent / 2.0, extent / 2.0))[0]
+        assert np.allclose(counts / 100000, 0.25, atol=0.01)
+
+def test_polygon():
+    """Test the creation of points within a concave polygon.
+
+    The L-shaped polygon consists of three unit squares. Each square must contain
+    a third of the points and no point must lie in the missing fourth square.
+    """
+    vertices = [(0, 0, 1), (2, 0, 1), (2, 1, 1), (1, 1, 1), (1, 2, 1), (0, 2, 1)]
+    plane = Plane.from_polygon(vertices, seed=1)
+    assert np.allclose(plane.normal_vec, (0.0, 0.0, 1.0))
+    assert math.isclose(plane.measure, 3.0)
+    plane_points = plane.create_random_points_array(90000)
+    _check_valid_plane_results(plane, 90000, plane_points.tolist())
+    squares = np.floor(plane_points[:, :2]).astype(int)
+    counts = np.bincount(squares[:, 0] * 2 + squares[:, 1], minlength=4)
+    assert counts[3] == 0
+    assert np.allclose(counts[:3] / 90000, 1.0 / 3.0, atol=0.01)
+    # clockwise vertices flip the normal vector but cover the same area
+    assert np.allclose(Plane.from_polygon(vertices[::-1]).normal_vec, (0.0, 0.0, -1.0))
+
+def test_region_exc():
+    """Test the rectangle and polygon factory methods to raise the expected exceptions.
+    """
+    expect_type_errors = [
+        lambda: Plane.from_rectangle((0, 0, 0), (1, 0, 0), (0, 1, 0), [1.0, 2.0]),
+        lambda: Plane.from_rectangle((0, 0, 0), (1, 0, 0), (0, 1, 0), (1.0, "2")),
+        lambda: Plane.from_polygon("test")
+    ]
+    expect_value_errors = [
+        lambda: Plane.from_rectangle((0, 0, 0), (1, 0, 0), (1, 1, 0), (1.0, 2.0)),
+        lambda: Plane.from_rectangle((0, 0, 0), (1, 0, 0), (0, 1, 0), (1.0, 0.0)),
+        lambda: Plane.from_rectangle((0, 0, 0), (1, 0, 0), (0, 1, 0), (1.0,)),
+        lambda: Plane.from_polygon([(0, 0, 0), (1, 0, 0)]),
+        lambda: Plane.from_polygon([(0, 0, 0), (1, 0, 0), (2, 0, 0)]),
+        lambda: Plane.from_polygon([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 1)]),
+        lambda: Plane.from_polygon([(0, 0, 0), (2, 2, 0), (2, 0, 0), (0, 2, 0)])
+    ]
+    for call in expect_type_errors:
+        with pytest.raises(TypeError):
+            call()
+    for call in expect_value_errors:
+        with pytest.raises(ValueError):
+            call()
+
 def test_create_random_points_exc():
-    """Test the create_random_points and create_random_point_generator methods of Plane.
+    """Test the create_random_points, create_random_point_generator
+    and create_random_points_array methods of Plane.
 
     Create a list of different invalid plane definitions.
     Check if for each plane definition the expected exception is raised.
@@ -72,6 +176,13 @@ def test_create_random_points_exc():
         with pytest.raises(expected_exception):
             plane.create_random_point_generator(num_points)
 
+    def check_point_count_array(plane, num_points, expected_exception):
+        """Check the create_random_points_array method to raise an exception because of
+        an invalid number of points to be created.
+        """
+        with pytest.raises(expected_exception):
+            plane.create_random_points_array(num_points)
+
     invalid_normal_forms = _get_invalid_plane_definitions_normal_form()
     invalid_constructor_args = _get_invalid_plane_definitions_constructor_args()
     invalid_hessian_normal_forms = _get_invalid_plane_definitions_hessian_normal_form()
@@ -85,6 +196,7 @@ def test_create_random_points_exc():
     for plane in point_count_errors:
         check_point_count(plane[0], plane[1], plane[2])
         check_point_count_gen(plane[0], plane[1], plane[2])
+        check_point_count_array(plane[0], plane[1], plane[2])
 
 def _get_valid_plane_definitions():
     """Create a list of valid plane parameters.
@@ -297,7 +409,6 @@ def _get_planes_with_invalid_point_count():
         (Plane((1.0, 0, 0), 5.0, (5.0, 5, 6), 5), 4.5, TypeError),
         (Plane((1.0, 0, 0), 5.0, (5.0, 5, 6), 5), -5, ValueError),
         (Plane((1.0, 0, 0), 5.0, (5.0, 5, 6), 5), 0, ValueError),
-        (Plane((1.0, 0, 0), 5.0, (5.0, 5, 6), 5), 100000, ValueError),
         (Plane((1.0, 0, 0), 5.0, (5.0, 5, 6), 5), float("nan"), TypeError),
         (Plane((1.0, 0, 0), 5.0, (5.0, 5, 6), 5), float("inf"), TypeError),
         (Plane((1.0, 0, 0), 5.0, (5.0, 5, 6), 5), float("-inf"), TypeError)
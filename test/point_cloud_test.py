@@ -0,0 +1,88 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.sphere import Sphere
+from random_geometry_points.point_cloud import PointCloud
+from geometry_helpers import get_geometries
+
+def test_create_point_cloud():
+    """Test the create_point_cloud method of the geometries.
+
+    For each geometry it is checked if the point cloud contains the same points
+    as the array created by an equally seeded geometry.
+    """
+    for geometry1, geometry2 in zip(get_geometries(), get_geometries()):
+        cloud = geometry1.create_point_cloud(1005)
+        points = geometry2.create_random_points_array(1005)
+        assert isinstance(cloud, PointCloud)
+        assert len(cloud) == 1005
+        assert cloud.dimension == geometry1.dimension
+        assert np.array_equal(np.asarray(cloud), points)
+        assert cloud.nbytes == 1005 * geometry1.dimension * 8
+
+def test_sequence_protocol():
+    """Test the point cloud to behave like a list of tuples.
+    """
+    points = np.random.default_rng(1).uniform(-10.0, 10.0, (100, 3))
+    cloud = PointCloud.from_points(points)
+    point_tuples = list(map(tuple, points.tolist()))
+    assert len(cloud) == 100
+    assert cloud[0] == point_tuples[0]
+    assert cloud[-1] == point_tuples[-1]
+    assert isinstance(cloud[0], tuple) and isinstance(cloud[0][0], float)
+    assert list(cloud) == point_tuples
+    assert cloud.tolist() == point_tuples
+    assert cloud[10:20].tolist() == point_tuples[10:20]
+    assert cloud[::3].tolist() == point_tuples[::3]
+    with pytest.raises(IndexError):
+        cloud[100]
+
+def test_zero_copy_views():
+    """Test the coordinate columns and the array interface to share the memory of the cloud.
+    """
+    cloud = Sphere(0, 0, 0, 1, seed=1).create_point_cloud(50)
+    for column in [cloud.x, cloud.y, cloud.z]:
+        assert column.flags.c_contiguous
+        assert np.shares_memory(column, cloud.columns)
+    array = np.asarray(cloud)
+    assert array.shape == (50, 3)
+    assert np.shares_memory(array, cloud.columns)
+    cloud.x[0] = 5.0
+    assert array[0, 0] == 5.0 and cloud[0][0] == 5.0
+    assert np.shares_memory(np.asarray(cloud[5:10]), cloud.columns)
+    circle_cloud = Circle2D(0, 0, 1).create_point_cloud(5)
+    assert len(circle_cloud.y) == 5
+    with pytest.raises(ValueError):
+        circle_cloud.z
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="buffer protocol needs Python 3.12")
+def test_buffer_protocol():
+    """Test the point cloud to export the coordinates via the buffer protocol.
+    """
+    cloud = Sphere(0, 0, 0, 1, seed=1).create_point_cloud(50)
+    view = memoryview(cloud)
+    assert view.shape == (50, 3)
+    assert view[0, 0] == cloud.x[0]
+    assert np.shares_memory(np.asarray(view), cloud.columns)
+
+def test_point_cloud_exc():
+    """Test the point cloud creation to raise the expected exceptions.
+    """
+    with pytest.raises(TypeError):
+        PointCloud([[1.0, 2.0], [3.0, 4.0]])
+    with pytest.raises(TypeError):
+        PointCloud(np.ones((3, 5), dtype=np.float32))
+    with pytest.raises(ValueError):
+        PointCloud(np.ones(5))
+    with pytest.raises(TypeError):
+        PointCloud.from_points([("1", 2, 3)])
+    with pytest.raises(ValueError):
+        PointCloud.from_points(np.ones((5, 4)))
+    with pytest.raises(ValueError):
+        PointCloud.from_points([(1, float("nan"), 3)])
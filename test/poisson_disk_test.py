@@ -0,0 +1,123 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.circle3d import Circle3D
+from random_geometry_points.ellipse2d import Ellipse2D
+from random_geometry_points.sphere import Sphere
+from random_geometry_points.plane import Plane
+from random_geometry_points.poisson_disk import create_poisson_disk_points
+from random_geometry_points.instrumentation import Instrumentation
+from geometry_helpers import get_geometries, calc_distances
+
+def test_create_poisson_disk_points():
+    """Test the create_poisson_disk_points function of the poisson_disk module.
+
+    For each geometry it is checked if the points lie on the geometry surface
+    and if no two points are closer than the minimum distance. The minimum distance
+    is a fraction of the mean point spacing on the curve or surface of the geometry.
+    """
+    for geometry in get_geometries():
+        if isinstance(geometry, (Circle2D, Circle3D, Ellipse2D)):
+            min_distance = 0.2 * geometry.measure / 500
+        else:
+            min_distance = 0.3 * math.sqrt(geometry.measure / 500)
+        points = create_poisson_disk_points(geometry, 500, min_distance)
+        assert points.shape == (500, geometry.dimension)
+        assert np.allclose(calc_distances(geometry, points), 0.0, atol=0.000001)
+        assert np.min(_calc_pairwise_distances(points)) >= min_distance
+
+def test_reproducible():
+    """Test if seeded geometries create the same points.
+    """
+    for geometry1, geometry2 in zip(get_geometries(), get_geometries()):
+        points1 = create_poisson_disk_points(geometry1, 300, 0.02)
+        points2 = create_poisson_disk_points(geometry2, 300, 0.02)
+        assert np.array_equal(points1, points2)
+
+def test_geometry_method():
+    """Test the create_poisson_disk_points method of the geometries.
+
+    It must create the same points as the module function for equally seeded geometries.
+    """
+    for geometry1, geometry2 in zip(get_geometries(), get_geometries()):
+        points1 = geometry1.create_poisson_disk_points(200, 0.02)
+        points2 = create_poisson_disk_points(geometry2, 200, 0.02)
+        assert np.array_equal(points1, points2)
+
+def test_instrumentation():
+    """Test if the instrumentation counts all candidates including the rejected ones.
+
+    Each chunk of candidates counts as a call, so more points than the requested ones
+    are counted and the limit max_points applies to the candidate chunks as well.
+    """
+    sphere = Sphere(0.0, 0.0, 0.0, 1.0, seed=9)
+    sphere.instrumentation = Instrumentation()
+    sphere.max_points = 1000
+    points = create_poisson_disk_points(sphere, 1000, 0.05)
+    counters = sphere.instrumentation.as_dict()
+    assert len(points) == 1000
+    assert counters["calls"] >= 2
+    assert counters["points"] > 1000
+
+def test_spread():
+    """Test if the points are spread more evenly than independent random points.
+
+    Independent random points on the plane region have close neighbours,
+    while the nearest neighbour of each Poisson-disk point is at least min_distance away.
+    """
+    plane = Plane.from_rectangle((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0),
+                                 (10.0, 10.0), seed=7)
+    random_points = plane.create_random_points_array(100)
+    assert np.min(_calc_pairwise_distances(random_points)) < 0.5
+    points = create_poisson_disk_points(plane, 100, 0.5)
+    assert np.min(_calc_pairwise_distances(points)) >= 0.5
+
+def test_full_surface():
+    """Test if a ValueError is raised if the points do not fit on the geometry surface.
+    """
+    circle = Circle2D(0.0, 0.0, 1.0, seed=3)
+    with pytest.raises(ValueError):
+        create_poisson_disk_points(circle, 100, 0.1)
+    with pytest.raises(ValueError):
+        create_poisson_disk_points(circle, 50, 0.1, max_attempts=1)
+
+def test_create_poisson_disk_points_exc():
+    """Test the create_poisson_disk_points function to raise the expected exceptions.
+    """
+    geometry = Sphere(0.0, 0.0, 0.0, 1.0)
+    expect_type_errors = [
+        ("10", 0.1, 100),
+        (10, "0.1", 100),
+        (10, 0.1, 100.0)
+    ]
+    expect_value_errors = [
+        (0, 0.1, 100),
+        (10, 0.0, 100),
+        (10, float("nan"), 100),
+        (10, 0.1, 0)
+    ]
+    for num_points, min_distance, max_attempts in expect_type_errors:
+        with pytest.raises(TypeError):
+            create_poisson_disk_points(geometry, num_points, min_distance, max_attempts)
+    for num_points, min_distance, max_attempts in expect_value_errors:
+        with pytest.raises(ValueError):
+            create_poisson_disk_points(geometry, num_points, min_distance, max_attempts)
+
+def _calc_pairwise_distances(points):
+    """Calculate the distances between all pairs of different points.
+
+    Args:
+        points (numpy.ndarray): The points as array of shape (n, dimension)
+
+    Returns:
+        numpy.ndarray: The n * (n - 1) / 2 pairwise distances
+    """
+    distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    return distances[np.triu_indices(len(points), 1)]
@@ -0,0 +1,117 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+import random_geometry_points.quaternion as quaternion
+import random_geometry_points.vector_math as vector_math
+
+def test_rotation_quaternions():
+    """Test the conversion of axes and angles into quaternions and the rotation of vectors.
+
+    The results must match the tuple functions of the vector_math module for each row.
+    """
+    vecs = np.random.uniform(-10.0, 10.0, (50, 3))
+    axes = np.random.uniform(1.0, 2.0, (50, 3))
+    angles = np.random.uniform(-10.0, 10.0, 50)
+    quats = quaternion.get_as_rotation_quaternion_array(axes, angles)
+    rotated_vecs = quaternion.rotate_by_quaternion_array(vecs, quats)
+    for i, (vec, axis) in enumerate(zip(map(tuple, vecs.tolist()), map(tuple, axes.tolist()))):
+        assert np.allclose(quats[i], vector_math.get_as_rotation_quaternion(axis, angles[i]))
+        assert np.allclose(rotated_vecs[i], vector_math.rotate_vector(vec, axis, angles[i]))
+
+def test_rotate_by_single_quaternion():
+    """Test the rotation of all vectors by a single quaternion.
+    """
+    vecs = np.random.uniform(-10.0, 10.0, (20, 3))
+    quat = quaternion.get_as_rotation_quaternion_array((0, 0, 2), math.pi)
+    assert quat.shape == (4,)
+    rotated_vecs = quaternion.rotate_by_quaternion_array(vecs, quat)
+    assert np.allclose(rotated_vecs, vecs * (-1.0, -1.0, 1.0))
+    scaled_quat = 3.0 * quat
+    assert np.allclose(quaternion.rotate_by_quaternion_array(vecs, scaled_quat), rotated_vecs)
+
+def test_quaternion_to_matrix():
+    """Test if the rotation matrices are orthogonal and rotate like the quaternions.
+    """
+    quats = quaternion.create_random_rotation_quaternions(30, seed=1)
+    matrices = quaternion.quaternion_to_matrix_array(quats)
+    assert matrices.shape == (30, 3, 3)
+    assert np.allclose(matrices @ np.transpose(matrices, (0, 2, 1)), np.eye(3))
+    assert np.allclose(np.linalg.det(matrices), 1.0)
+    vec = (1.0, 2.0, 3.0)
+    for quat, matrix in zip(map(tuple, quats.tolist()), matrices):
+        rotated_vec = vector_math._multiply_quaternions(
+            vector_math._multiply_quaternions(quat, (0.0,) + vec),
+            (quat[0], -quat[1], -quat[2], -quat[3]))
+        assert np.allclose(matrix @ vec, rotated_vec[1:])
+
+def test_multiply_quaternions():
+    """Test the composition of rotations.
+    """
+    quats1 = quaternion.create_random_rotation_quaternions(30, seed=2)
+    quats2 = quaternion.create_random_rotation_quaternions(30, seed=3)
+    products = quaternion.multiply_quaternion_array(quats1, quats2)
+    for quat1, quat2, product in zip(map(tuple, quats1.tolist()), map(tuple, quats2.tolist()),
+                                     products):
+        assert np.allclose(product, vector_math.multiply_quaternions(quat1, quat2))
+    vecs = np.random.uniform(-10.0, 10.0, (30, 3))
+    assert np.allclose(
+        quaternion.rotate_by_quaternion_array(vecs, products),
+        quaternion.rotate_by_quaternion_array(
+            quaternion.rotate_by_quaternion_array(vecs, quats2), quats1))
+
+def test_slerp():
+    """Test the spherical linear interpolation between quaternions.
+    """
+    start = quaternion.get_as_rotation_quaternion_array((0, 0, 1), 0.0)
+    end = quaternion.get_as_rotation_quaternion_array((0, 0, 1), np.array([2.0, -1.0, 3.0]))
+    fractions = np.array([0.25, 0.5, 1.0])
+    expected = quaternion.get_as_rotation_quaternion_array((0, 0, 1), np.array([0.5, -0.5, 3.0]))
+    assert np.allclose(quaternion.slerp_quaternion_array(start, end, fractions), expected)
+    assert np.allclose(quaternion.slerp_quaternion_array(start, start, 0.5), start)
+    # -q describes the same rotation as q, so the interpolation takes the shorter arc
+    assert np.allclose(quaternion.slerp_quaternion_array(start, -end[0], 0.25), expected[0])
+
+def test_random_rotations():
+    """Test the distribution of the random rotations.
+
+    Uniform random rotations map a fixed vector onto points uniformly
+    distributed on the unit sphere, so the mean of the rotated vectors is close to zero
+    and each coordinate has a variance of 1/3.
+    """
+    quats = quaternion.create_random_rotation_quaternions(200000, seed=4)
+    assert quats.shape == (200000, 4)
+    assert np.allclose(np.linalg.norm(quats, axis=1), 1.0)
+    rotated_vecs = quaternion.rotate_by_quaternion_array((1.0, 0.0, 0.0), quats)
+    assert np.allclose(rotated_vecs.mean(axis=0), 0.0, atol=0.01)
+    assert np.allclose(rotated_vecs.var(axis=0), 1.0 / 3.0, atol=0.01)
+    assert np.array_equal(quats, quaternion.create_random_rotation_quaternions(200000, seed=4))
+
+def test_quaternion_functions_exc():
+    """Test the quaternion functions to raise the expected exceptions.
+    """
+    quats = np.ones((5, 4))
+    expect_type_errors = [
+        lambda: quaternion.normalize_quaternion_array("test"),
+        lambda: quaternion.multiply_quaternion_array(quats, [("1", 0, 0, 0)]),
+        lambda: quaternion.slerp_quaternion_array(quats, quats, "0.5"),
+        lambda: quaternion.create_random_rotation_quaternions(2.5)
+    ]
+    expect_value_errors = [
+        lambda: quaternion.normalize_quaternion_array([(1, 0, 0, 0), (0, 0, 0, 0)]),
+        lambda: quaternion.quaternion_to_matrix_array(np.ones((5, 3))),
+        lambda: quaternion.rotate_by_quaternion_array(np.ones((5, 4)), quats),
+        lambda: quaternion.get_as_rotation_quaternion_array((0.5, 0, 0), 1.0),
+        lambda: quaternion.create_random_rotation_quaternions(-1)
+    ]
+    for call in expect_type_errors:
+        with pytest.raises(TypeError):
+            call()
+    for call in expect_value_errors:
+        with pytest.raises(ValueError):
+            call()
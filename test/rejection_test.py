@@ -0,0 +1,44 @@
+import sys
+import os
+import math
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.rejection import draw_with_rejection
+
+def test_draw_with_rejection():
+    """Test if the accepted samples follow the target distribution.
+
+    Uniform proposals in [0, 1] accepted with probability x yield samples
+    with the density 2 * x, i.e. a quarter of them lies below 0.5.
+    """
+    rng = np.random.default_rng(0)
+    samples = draw_with_rejection(rng, 100000, lambda rng, num: rng.random(num),
+                                  lambda proposals: proposals, 0.5)
+    assert samples.shape == (100000,)
+    assert math.isclose(np.mean(samples < 0.5), 0.25, abs_tol=0.01)
+
+def test_adaptive_batch_size():
+    """Test if the batch size adapts to the observed acceptance rate.
+
+    With an accurate expected acceptance rate a single batch yields all samples
+    in nearly all cases. With a much too high expectation the observed acceptance rate
+    of the first batch is used, so only a few more batches are needed.
+    """
+    def count_batches(expected_acceptance_rate):
+        batch_sizes = []
+        def propose(rng, num):
+            batch_sizes.append(num)
+            return rng.random((num, 2))
+        samples = draw_with_rejection(np.random.default_rng(1), 10000, propose,
+                                      lambda proposals: np.full(len(proposals), 0.2),
+                                      expected_acceptance_rate)
+        assert samples.shape == (10000, 2)
+        return batch_sizes
+
+    assert len(count_batches(0.2)) == 1
+    batch_sizes = count_batches(1.0)
+    assert len(batch_sizes) <= 3
+    assert sum(batch_sizes) < 1.2 * 10000 / 0.2
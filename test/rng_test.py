@@ -0,0 +1,59 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+import random_geometry_points.rng as rng
+
+def test_create_random_generator():
+    """Test the create_random_generator function of the rng module.
+
+    Generators created from the same seed must create the same random numbers.
+    A passed generator must be used as it is.
+    """
+    numbers1 = rng.create_random_generator(42).random(10)
+    numbers2 = rng.create_random_generator(42).random(10)
+    numbers3 = rng.create_random_generator(43).random(10)
+    assert np.array_equal(numbers1, numbers2)
+    assert not np.array_equal(numbers1, numbers3)
+    sequence_numbers = rng.create_random_generator(np.random.SeedSequence(42)).random(10)
+    assert np.array_equal(numbers1, sequence_numbers)
+    generator = np.random.default_rng(1)
+    assert rng.create_random_generator(generator) is generator
+    assert isinstance(rng.create_random_generator(), np.random.Generator)
+    with pytest.raises(TypeError):
+        rng.create_random_generator("42")
+    with pytest.raises(ValueError):
+        rng.create_random_generator(-1)
+
+def test_spawn_random_generators():
+    """Test the spawn_random_generators function of the rng module.
+
+    The child generators of equally seeded parents must be equal, while the
+    children of one parent must create different random numbers.
+    """
+    children1 = rng.spawn_random_generators(rng.create_random_generator(42), 4)
+    children2 = rng.spawn_random_generators(rng.create_random_generator(42), 4)
+    numbers1 = [child.random(10) for child in children1]
+    numbers2 = [child.random(10) for child in children2]
+    assert len(numbers1) == 4
+    for child_numbers1, child_numbers2 in zip(numbers1, numbers2):
+        assert np.array_equal(child_numbers1, child_numbers2)
+    for i, child_numbers in enumerate(numbers1):
+        for other_child_numbers in numbers1[i + 1:]:
+            assert not np.array_equal(child_numbers, other_child_numbers)
+    parent = rng.create_random_generator(42)
+    first_children = rng.spawn_random_generators(parent, 1)
+    second_children = rng.spawn_random_generators(parent, 1)
+    assert not np.array_equal(first_children[0].random(10), second_children[0].random(10))
+    # generators of any bit generator type can be spawned, the children keep the type
+    parent = np.random.Generator(np.random.Philox(7))
+    children = rng.spawn_random_generators(parent, 2)
+    assert all(isinstance(child.bit_generator, np.random.Philox) for child in children)
+    with pytest.raises(TypeError):
+        rng.spawn_random_generators(parent, 2.0)
+    with pytest.raises(ValueError):
+        rng.spawn_random_generators(parent, 0)
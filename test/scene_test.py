@@ -0,0 +1,141 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.scene import Scene
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.sphere import Sphere
+from random_geometry_points.plane import Plane
+from random_geometry_points.cylinder import Cylinder
+from random_geometry_points.mesh import Mesh
+
+def test_create_random_points():
+    """Test if the points of a scene lie on the geometries of the scene.
+    """
+    scene = Scene(_get_spheres(), seed=0)
+    scene.chunk_size = 1000
+    for points in [np.array(scene.create_random_points(2500)),
+                   scene.create_random_points_array(2500)]:
+        assert points.shape == (2500, 3)
+        assert np.all(np.min(_calc_sphere_distances(scene.geometries, points), axis=1) < 0.000001)
+
+def test_area_weights():
+    """Test if the points are distributed in proportion to the areas of the geometries.
+    """
+    spheres = _get_spheres()
+    scene = Scene(spheres, seed=1)
+    assert math.isclose(scene.measure, sum(sphere.measure for sphere in spheres))
+    points = scene.create_random_points_array(100000)
+    nearest = np.argmin(_calc_sphere_distances(spheres, points), axis=1)
+    areas = np.array([sphere.radius**2 for sphere in spheres])
+    frequencies = np.bincount(nearest, minlength=len(spheres)) / 100000
+    assert np.allclose(frequencies, areas / np.sum(areas), atol=0.01)
+
+def test_explicit_weights():
+    """Test if explicit weights override the area weights and geometries
+    with the weight zero receive no points.
+    """
+    circles = [Circle2D(0.0, 0.0, 1.0), Circle2D(10.0, 0.0, 5.0), Circle2D(20.0, 0.0, 1.0)]
+    scene = Scene(circles, weights=[1, 0, 3], seed=2)
+    points = scene.create_random_points_array(100000)
+    assert scene.dimension == 2
+    counts = np.histogram(points[:, 0], bins=(-2.0, 5.0, 15.0, 25.0))[0]
+    assert counts[1] == 0
+    assert math.isclose(counts[0] / 100000, 0.25, abs_tol=0.01)
+
+def test_alias_table_parts():
+    """Test scenes with geometries that choose their triangles from an alias table.
+
+    The point counts of the multinomial draw are passed on as int, so meshes
+    and polygon planes can be combined with other geometries.
+    """
+    mesh = Mesh([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)],
+                [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 2, 3)])
+    polygon = Plane.from_polygon([(0.0, 0.0, 5.0), (2.0, 0.0, 5.0), (2.0, 1.0, 5.0),
+                                  (1.0, 1.0, 5.0), (1.0, 2.0, 5.0), (0.0, 2.0, 5.0)])
+    sphere = Sphere(10.0, 0.0, 0.0, 1.0)
+    scene = Scene([mesh, polygon, sphere], seed=4)
+    points = scene.create_random_points_array(3000)
+    on_mesh = np.all(points >= -0.000001, axis=1) & (np.sum(points, axis=1) <= 1.000001)
+    on_polygon = np.isclose(points[:, 2], 5.0) & \
+      ~((points[:, 0] > 1.000001) & (points[:, 1] > 1.000001))
+    on_sphere = np.isclose(np.linalg.norm(points - (10.0, 0.0, 0.0), axis=1), 1.0)
+    assert np.all(on_mesh | on_polygon | on_sphere)
+    for on_part in (on_mesh, on_polygon, on_sphere):
+        assert np.any(on_part)
+
+def test_reproducibility():
+    """Test if equally seeded scenes create equal points without modifying the geometries.
+    """
+    sphere = Sphere(0.0, 0.0, 0.0, 1.0, seed=5)
+    plane = Plane.from_normal_form((0.0, 0.0, 1.0), (0.0, 0.0, 5.0), 2.0, seed=6)
+    cylinder = Cylinder((0.0, 0.0, 10.0), (0.0, 0.0, 1.0), 1.0, 2.0, caps=True, seed=7)
+    rng_state = sphere.rng.bit_generator.state
+    scene1 = Scene([sphere, plane, cylinder], seed=3)
+    scene2 = Scene([sphere, plane, cylinder], seed=3)
+    assert np.array_equal(scene1.create_random_points_array(1000),
+                          scene2.create_random_points_array(1000))
+    assert sphere.rng.bit_generator.state == rng_state
+    children = scene1.spawn(2)
+    assert not np.array_equal(children[0].create_random_points_array(100),
+                              children[1].create_random_points_array(100))
+
+def test_nested_scene():
+    """Test scenes whose geometries are scenes themselves.
+
+    The inner scene creates its points through the public point creation method
+    with its own copies of the geometries, and limits of the geometries passed in
+    do not restrict the point counts within the scene.
+    """
+    spheres = _get_spheres()
+    spheres[0].max_points = 1
+    inner_scene = Scene(spheres[:3], seed=8)
+    scene = Scene([inner_scene] + spheres[3:], seed=9)
+    points = scene.create_random_points_array(5000)
+    assert np.all(np.min(_calc_sphere_distances(spheres, points), axis=1) < 0.000001)
+    twin = Scene([Scene(spheres[:3], seed=8)] + spheres[3:], seed=9)
+    assert np.array_equal(points, twin.create_random_points_array(5000))
+
+def test_create_scene_exc():
+    """Test the constructor of Scene to raise the expected exceptions.
+    """
+    circle = Circle2D(0.0, 0.0, 1.0)
+    sphere = Sphere(0.0, 0.0, 0.0, 1.0)
+    expect_type_errors = [
+        (circle, None),
+        ([circle, "test"], None),
+        ([circle], ["1"])
+    ]
+    expect_value_errors = [
+        ([], None),
+        ([circle, sphere], None),
+        ([circle, circle], [1.0]),
+        ([circle, circle], [1.0, -1.0]),
+        ([circle, circle], [0.0, 0.0])
+    ]
+    for geometries, weights in expect_type_errors:
+        with pytest.raises(TypeError):
+            Scene(geometries, weights)
+    for geometries, weights in expect_value_errors:
+        with pytest.raises(ValueError):
+            Scene(geometries, weights)
+
+def _get_spheres():
+    """Create a list of spheres with different radii and seeds.
+    """
+    return [Sphere(10.0 * index, 0.0, 0.0, 0.5 + index, seed=index) for index in range(5)]
+
+def _calc_sphere_distances(spheres, points):
+    """Calculate the distances of the points from the surfaces of the spheres.
+
+    Returns:
+        numpy.ndarray: The distances as array of shape (n, len(spheres))
+    """
+    centers = np.array([(sphere.center_x, sphere.center_y, sphere.center_z) for sphere in spheres])
+    radii = np.array([sphere.radius for sphere in spheres])
+    return np.abs(np.linalg.norm(points[:, np.newaxis] - centers, axis=2) - radii)
@@ -2,11 +2,12 @@ import sys
 import os
 import math
 import pytest
+import numpy as np
 
 PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJ_PATH + '/../')
 
-from random_geometry_points.sphere import Sphere
+from random_geometry_points.sphere import Sphere, UNIFORM, AZIMUTH_ZENITH
 
 def test_create_random_points():
     """Test the create_random_points method of Sphere.
@@ -34,8 +35,107 @@ def test_create_random_point_gen():
         sphere_points = [point for point in sphere[0].create_random_point_generator(sphere[1])]
         _check_valid_sphere_results(sphere[0], sphere[1], sphere_points)
 
+def test_create_random_points_array():
+    """Test the create_random_points_array method of Sphere.
+
+    Create a list of different sphere definitions along with the desired point count.
+    For each sphere it is checked if the returned array has the expected shape and type.
+    Furthermore it is checked if the created points lie on the sphere, respectively.
+    """
+    spheres = _get_valid_sphere_definitions()
+    for sphere in spheres:
+        sphere_points = sphere[0].create_random_points_array(sphere[1])
+        assert isinstance(sphere_points, np.ndarray)
+        assert sphere_points.shape == (sphere[1], 3)
+        assert sphere_points.dtype == np.float64
+        _check_valid_sphere_results(sphere[0], sphere[1], sphere_points.tolist())
+
+def test_distribution():
+    """Test the point distribution options of Sphere.
+
+    For a uniform distribution by area the z coordinates of the points on a unit sphere
+    are uniformly distributed in [-1, 1], so the mean of their absolute values is 0.5.
+    Drawing the zenith angle uniformly instead shifts that mean to 2 / pi.
+    """
+    uniform_sphere = Sphere(0, 0, 0, 1)
+    assert uniform_sphere.distribution == UNIFORM
+    uniform_points = uniform_sphere.create_random_points_array(99999)
+    assert math.isclose(np.mean(np.abs(uniform_points[:, 2])), 0.5, abs_tol=0.01)
+    legacy_sphere = Sphere(0, 0, 0, 1, distribution=AZIMUTH_ZENITH)
+    legacy_points = legacy_sphere.create_random_points_array(99999)
+    _check_valid_sphere_results(legacy_sphere, 99999, legacy_points.tolist())
+    assert math.isclose(np.mean(np.abs(legacy_points[:, 2])), 2.0 / math.pi, abs_tol=0.01)
+    with pytest.raises(TypeError):
+        Sphere(0, 0, 0, 1, distribution=1)
+    with pytest.raises(ValueError):
+        Sphere(0, 0, 0, 1, distribution="gaussian")
+
+def test_cap():
+    """Test the creation of points within a spherical cap.
+
+    All points must lie within the half angle around the cap axis. The cosines of their
+    angles from the axis must be uniformly distributed, which means uniform by area.
+    """
+    sphere = Sphere.from_cap(1.0, 2.0, 3.0, 4.0, (1.0, 1.0, 0.0), math.radians(10.0), seed=0)
+    assert math.isclose(sphere.measure, 2.0 * math.pi * 16.0 * (1.0 - math.cos(math.radians(10.0))))
+    points = sphere.create_random_points_array(100000)
+    _check_valid_sphere_results(sphere, 100000, points.tolist())
+    cos_angles = (points - (1.0, 2.0, 3.0)) @ sphere.axis / 4.0
+    assert np.all(cos_angles >= math.cos(math.radians(10.0)) - 0.000001)
+    counts = np.histogram(cos_angles, bins=4, range=(math.cos(math.radians(10.0)), 1.0))[0]
+    assert np.allclose(counts / 100000, 0.25, atol=0.01)
+
+def test_window():
+    """Test the creation of points within an azimuth and zenith window.
+    """
+    azimuth_range = (-math.pi / 4.0, math.pi / 2.0)
+    zenith_range = (math.pi / 3.0, math.pi / 2.0)
+    for distribution in [UNIFORM, AZIMUTH_ZENITH]:
+        sphere = Sphere(0.0, 0.0, 0.0, 2.0, distribution, seed=1,
+                        azimuth_range=azimuth_range, zenith_range=zenith_range)
+        points = sphere.create_random_points_array(10000)
+        azimuth = np.arctan2(points[:, 1], points[:, 0])
+        zenith = np.arccos(points[:, 2] / 2.0)
+        tolerance = 0.000001
+        assert np.all(azimuth >= azimuth_range[0] - tolerance)
+        assert np.all(azimuth <= azimuth_range[1] + tolerance)
+        assert np.all(zenith >= zenith_range[0] - tolerance)
+        assert np.all(zenith <= zenith_range[1] + tolerance)
+    assert math.isclose(sphere.measure, 3.0 * math.pi / 4.0 * 0.5 * 4.0)
+    # equally seeded full windows reproduce the points of the full sphere
+    full_window = Sphere(1.0, 2.0, 3.0, 4.0, seed=2, azimuth_range=(0.0, 2.0 * math.pi),
+                         zenith_range=(0.0, math.pi))
+    assert np.array_equal(full_window.create_random_points_array(100),
+                          Sphere(1.0, 2.0, 3.0, 4.0, seed=2).create_random_points_array(100))
+
+def test_window_exc():
+    """Test the constructor of Sphere to reject inproper windows and caps.
+    """
+    expect_type_errors = [
+        {"azimuth_range": [0.0, 1.0]},
+        {"zenith_range": (0.0, "1")},
+        {"axis": [0.0, 0.0, 1.0]}
+    ]
+    expect_value_errors = [
+        {"azimuth_range": (1.0, 1.0)},
+        {"azimuth_range": (0.0, 1.0, 2.0)},
+        {"azimuth_range": (-math.pi, 1.5 * math.pi)},
+        {"zenith_range": (-0.1, 1.0)},
+        {"zenith_range": (1.0, 4.0)},
+        {"axis": (0.0, 0.0, 0.0)}
+    ]
+    for kwargs in expect_type_errors:
+        with pytest.raises(TypeError):
+            Sphere(0.0, 0.0, 0.0, 1.0, **kwargs)
+    for kwargs in expect_value_errors:
+        with pytest.raises(ValueError):
+            Sphere(0.0, 0.0, 0.0, 1.0, **kwargs)
+    with pytest.raises(ValueError):
+        Sphere.from_cap(0.0, 0.0, 0.0, 1.0, (0.0, 0.0, 1.0), 0.0)
+
 def test_create_random_points_exc():
-    """Test the create_random_points and create_random_point_generator methods of Sphere.
+    """Test the create_random_points, create_random_point_generator
+    and create_random_points_array methods of Sphere.
 
     Create a list of different invalid sphere definitions.
     Check if for each sphere definition the expected exception is raised.
@@ -60,6 +160,13 @@ def test_create_random_points_exc():
         with pytest.raises(expected_exception):
             sphere.create_random_point_generator(num_points)
 
+    def check_point_count_array(sphere, num_points, expected_exception):
+        """Check the create_random_points_array method to raise an exception because of
+        an invalid number of points to be created.
+        """
+        with pytest.raises(expected_exception):
+            sphere.create_random_points_array(num_points)
+
     sphere_creation_errors = _get_invalid_sphere_definitions()
     point_count_errors = _get_spheres_with_invalid_point_count()
     for sphere in sphere_creation_errors:
@@ -67,6 +174,7 @@ def test_create_random_points_exc():
     for sphere in point_count_errors:
         check_point_count(sphere[0], sphere[1], sphere[2])
         check_point_count_gen(sphere[0], sphere[1], sphere[2])
+        check_point_count_array(sphere[0], sphere[1], sphere[2])
 
 def _get_valid_sphere_definitions():
     """Create a list of valid sphere parameters.
@@ -142,7 +250,6 @@ def _get_spheres_with_invalid_point_count():
         (Sphere(2.0, 5.0, 7.0, 5), 4.5, TypeError),
         (Sphere(2.0, 5.0, 7.0, 5), -5, ValueError),
         (Sphere(2.0, 5.0, 7.0, 5), 0, ValueError),
-        (Sphere(2.0, 5.0, 7.0, 5), 100000, ValueError),
         (Sphere(2.0, 5.0, 7.0, 5), float("nan"), TypeError),
         (Sphere(2.0, 5.0, 7.0, 5), float("inf"), TypeError),
         (Sphere(2.0, 5.0, 7.0, 5), float("-inf"), TypeError)
@@ -0,0 +1,119 @@
+import sys
+import os
+import asyncio
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.circle2d import Circle2D
+from random_geometry_points.sphere import Sphere
+from random_geometry_points.plane import Plane
+from random_geometry_points.instrumentation import Instrumentation
+
+def test_astream():
+    """Test if the asynchronous stream yields the same chunks as the synchronous chunk generator.
+    """
+    for geometry, twin in zip(_get_geometries(7), _get_geometries(7)):
+        chunks = _run(_collect(geometry.astream(100, chunk_size=30)))
+        expected_chunks = list(twin.create_random_chunk_generator(100, chunk_size=30))
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+        for chunk, expected_chunk in zip(chunks, expected_chunks):
+            assert np.array_equal(chunk, expected_chunk)
+
+def test_astream_backpressure():
+    """Test if the worker thread waits for a slow consumer.
+
+    While the consumer is sleeping, the worker may only create the queued chunks
+    plus the chunk that is waiting to be put into the full queue.
+    """
+    geometry = Sphere(0.0, 0.0, 0.0, 1.0)
+    geometry.instrumentation = Instrumentation()
+
+    async def consume():
+        """Consume the first chunk slowly, then stop the stream.
+        """
+        stream = geometry.astream(10**12, chunk_size=10, max_queued_chunks=2)
+        async for _ in stream:
+            await asyncio.sleep(0.2)
+            break
+        await stream.aclose()
+
+    _run(consume())
+    assert geometry.instrumentation.as_dict()["points"] <= 4 * 10
+
+def test_astream_early_stop():
+    """Test if stopping the iteration early stops the worker thread.
+    """
+    geometry = Circle2D(0.0, 0.0, 1.0)
+
+    async def consume():
+        """Consume the first three chunks, then stop the stream.
+
+        Returns:
+            int: The number of consumed chunks
+        """
+        num_chunks = 0
+        stream = geometry.astream(10**12, chunk_size=1000)
+        async for _ in stream:
+            num_chunks += 1
+            if num_chunks == 3:
+                break
+        await stream.aclose()
+        return num_chunks
+
+    assert _run(consume()) == 3
+
+def test_astream_errors():
+    """Test if inproper parameters are rejected when the stream is created.
+    """
+    geometry = Circle2D(0.0, 0.0, 1.0)
+    for num_points, chunk_size, max_queued_chunks, error in [
+            (-1, None, 2, ValueError),
+            (10, 0, 2, ValueError),
+            (10, None, 0, ValueError),
+            (10, None, 1.5, TypeError)]:
+        with pytest.raises(error):
+            geometry.astream(num_points, chunk_size, max_queued_chunks)
+
+async def _collect(stream):
+    """Collect all chunks of an asynchronous stream.
+
+    Args:
+        stream (async generator): The stream of chunks
+
+    Returns:
+        list (numpy.ndarray): The chunks
+    """
+    return [chunk async for chunk in stream]
+
+def _run(coroutine):
+    """Run a coroutine in a new event loop.
+
+    Args:
+        coroutine (coroutine): The coroutine to be run
+
+    Returns:
+        any: The result of the coroutine
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+def _get_geometries(seed=None):
+    """Create a list with one object of each geometry type.
+
+    Args:
+        seed (int): The seed for the random generators of the geometry objects
+
+    Returns:
+        list (Geometry): List with geometry objects
+    """
+    circle = Circle2D(1.0, -2.0, 3.0, seed=seed)
+    sphere = Sphere(1.0, -2.0, 3.0, 4.0, seed=seed)
+    plane = Plane((1.0, 0.0, 0.0), 3.5, (3.5, 7.0, 8.0), 15.0, seed=seed)
+    return [circle, sphere, plane]
@@ -0,0 +1,53 @@
+import sys
+import os
+import math
+import pytest
+import numpy as np
+
+PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJ_PATH + '/../')
+
+from random_geometry_points.triangles import Triangles, triangulate_polygon
+
+def test_triangles():
+    """Test the random points on a set of triangles.
+
+    The second triangle has three times the area of the first one, so it must receive
+    three quarters of the points. All points must lie within their triangles.
+    """
+    triangles = Triangles([(0.0, 0.0, 0.0), (0.0, 0.0, 5.0)],
+                          [(1.0, 0.0, 0.0), (3.0, 0.0, 5.0)],
+                          [(0.0, 1.0, 0.0), (0.0, 1.0, 5.0)])
+    assert len(triangles) == 2
+    assert np.allclose(triangles.areas, (0.5, 1.5))
+    assert math.isclose(triangles.area, 2.0)
+    rng = np.random.default_rng(0)
+    points = np.empty((100000, 3))
+    triangles.fill_points(triangles.draw_random_numbers(rng, 100000), points)
+    on_second = points[:, 2] > 2.5
+    assert math.isclose(np.mean(on_second), 0.75, abs_tol=0.01)
+    assert np.all(points[~on_second, 0] + points[~on_second, 1] <= 1.000001)
+    assert np.all(points[on_second, 0] / 3.0 + points[on_second, 1] <= 1.000001)
+    assert np.all(points[:, :2] >= -0.000001)
+
+def test_triangles_exc():
+    """Test the Triangles constructor to raise the expected exceptions.
+    """
+    with pytest.raises(TypeError):
+        Triangles("test", [(1.0, 0.0, 0.0)], [(0.0, 1.0, 0.0)])
+    with pytest.raises(ValueError):
+        Triangles([(0.0, 0.0, 0.0)], [(1.0, 0.0, 0.0)], [(0.0, 1.0, 0.0), (0.0, 2.0, 0.0)])
+    with pytest.raises(ValueError):
+        Triangles([(0.0, 0.0, 0.0)], [(1.0, 0.0, 0.0)], [(2.0, 0.0, 0.0)])
+
+def test_triangulate_polygon():
+    """Test the triangulation of polygons including collinear vertices.
+    """
+    coords = np.array([(0, 0), (1, 0), (2, 0), (2, 2), (0, 2)], dtype=float)
+    triangles = triangulate_polygon(coords)
+    assert triangles.shape == (3, 3)
+    corners = coords[triangles]
+    edges_ab = corners[:, 1] - corners[:, 0]
+    edges_ac = corners[:, 2] - corners[:, 0]
+    areas = 0.5 * np.abs(edges_ab[:, 0] * edges_ac[:, 1] - edges_ab[:, 1] * edges_ac[:, 0])
+    assert math.isclose(np.sum(areas), 4.0)
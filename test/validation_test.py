@@ -1,7 +1,9 @@
 import sys
 import os
 import math
+import array
 import pytest
+import numpy as np
 
 PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJ_PATH + '/../')
@@ -18,8 +20,7 @@ def test_check_num_random_points():
     ]
     expect_value_errors = [
         0,
-        -1,
-        100000
+        -1
     ]
     for param in expect_type_errors:
         with pytest.raises(TypeError):
@@ -27,6 +28,82 @@ def test_check_num_random_points():
     for param in expect_value_errors:
         with pytest.raises(ValueError):
             validation.check_number_of_random_points(param)
+    validation.check_number_of_random_points(100000)
+    validation.check_number_of_random_points(50000000)
+    validation.check_number_of_random_points(100, 100)
+    with pytest.raises(ValueError):
+        validation.check_number_of_random_points(101, 100)
+
+def test_check_chunk_size():
+    """Test the check_chunk_size function of the validation module.
+    """
+    expect_type_errors = [
+        "test",
+        3.5,
+        None,
+        True
+    ]
+    expect_value_errors = [
+        0,
+        -1
+    ]
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_chunk_size(param)
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_chunk_size(param)
+    assert validation.check_chunk_size(1) == 1
+
+def test_check_count():
+    """Test the check_count function of the validation module.
+    """
+    expect_type_errors = [
+        "test",
+        3.5,
+        None,
+        True
+    ]
+    expect_value_errors = [
+        0,
+        -1
+    ]
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_count(param, "workers")
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_count(param, "workers")
+    assert validation.check_count(4, "workers") == 4
+
+def test_check_seed():
+    """Test the check_seed function of the validation module.
+    """
+    valid_params = [
+        None,
+        0,
+        42,
+        2**100,
+        np.random.SeedSequence(1),
+        np.random.default_rng(1)
+    ]
+    expect_type_errors = [
+        "test",
+        3.5,
+        True,
+        (1, 2)
+    ]
+    expect_value_errors = [
+        -1
+    ]
+    for param in valid_params:
+        assert validation.check_seed(param) is param
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_seed(param)
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_seed(param)
 
 def test_check_geometry_parameter():
     """Test the check_geometry_parameter function of the validation module.
@@ -91,6 +168,83 @@ def test_check_radius():
         with pytest.raises(ValueError):
             validation.check_radius(param)
 
+def test_check_height():
+    """Test the check_height function of the validation module.
+    """
+    for param in [2.0, 3, 350]:
+        assert isinstance(validation.check_height(param), float)
+    for param in ["test", "3", (1, 2)]:
+        with pytest.raises(TypeError):
+            validation.check_height(param)
+    for param in [float("nan"), float("inf"), 0, -2.5]:
+        with pytest.raises(ValueError):
+            validation.check_height(param)
+
+def test_check_positive():
+    """Test the check_positive function of the validation module.
+    """
+    assert validation.check_positive(2, "sigma") == 2.0
+    for param in ["test", None]:
+        with pytest.raises(TypeError):
+            validation.check_positive(param, "sigma")
+    for param in [0.0, -1, float("nan")]:
+        with pytest.raises(ValueError):
+            validation.check_positive(param, "sigma")
+
+def test_check_fraction():
+    """Test the check_fraction function of the validation module.
+    """
+    for param in [0, 0.5, 1]:
+        assert validation.check_fraction(param) == float(param)
+    with pytest.raises(TypeError):
+        validation.check_fraction("0.5")
+    for param in [-0.1, 1.1, float("inf")]:
+        with pytest.raises(ValueError):
+            validation.check_fraction(param)
+
+def test_check_flag():
+    """Test the check_flag function of the validation module.
+    """
+    assert validation.check_flag(True) is True
+    assert validation.check_flag(False) is False
+    for param in [0, 1, "True", None]:
+        with pytest.raises(TypeError):
+            validation.check_flag(param)
+
+def test_check_angle_range():
+    """Test the check_angle_range function of the validation module.
+    """
+    assert validation.check_angle_range((0, 1.5), 0.0, math.pi) == (0.0, 1.5)
+    for param in [[0.0, 1.0], (0.0, "1.0"), None]:
+        with pytest.raises(TypeError):
+            validation.check_angle_range(param, 0.0, math.pi)
+    for param in [(0.0,), (1.0, 1.0), (1.0, 0.5), (-0.5, 1.0), (0.0, 4.0), (0.0, float("nan"))]:
+        with pytest.raises(ValueError):
+            validation.check_angle_range(param, 0.0, math.pi)
+
+def test_check_option():
+    """Test the check_option function of the validation module.
+    """
+    options = ("first", "second")
+    expect_type_errors = [
+        3,
+        None,
+        ("first",)
+    ]
+    expect_value_errors = [
+        "third",
+        "First",
+        ""
+    ]
+    for param in options:
+        assert validation.check_option(param, options) == param
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_option(param, options)
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_option(param, options)
+
 def test_check_vector():
     """Test the check_vector function of the validation module.
     """
@@ -194,3 +348,199 @@ def test_check_quaternion():
     for param in expect_value_errors:
         with pytest.raises(ValueError):
             validation.check_quaternion(param)
+
+def test_check_vector_array():
+    """Test the check_vector_array and check_direction_vector_array functions
+    of the validation module.
+    """
+    valid_params = [
+        [(1, 2, 3), (4, 5, 6)],
+        np.zeros((0, 3)),
+        (1.0, 0.5, 10988),
+        np.ones((10, 3), dtype=np.int32)
+    ]
+    expect_type_errors = [
+        "test",
+        [("4", 5, 6)],
+        [(1, 2, 3), (1, 2)],
+        [(1, 2, 3), None]
+    ]
+    expect_value_errors = [
+        (1, 2, 3, 4),
+        np.ones((2, 2)),
+        np.ones((2, 3, 3)),
+        3,
+        [(float("nan"), 2, 3)],
+        [(1, float("inf"), 3)]
+    ]
+    for param in valid_params:
+        result = validation.check_vector_array(param)
+        assert isinstance(result, np.ndarray) and result.dtype == np.float64
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_vector_array(param)
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_vector_array(param)
+    validation.check_direction_vector_array([(0.9, 0, 0), (0, 0, -1)])
+    with pytest.raises(ValueError):
+        validation.check_direction_vector_array([(0.89, 0, 0), (0, 0, -1)])
+
+def test_check_quaternion_array():
+    """Test the check_quaternion_array function of the validation module.
+    """
+    valid_params = [
+        [(1, 0, 0, 0), (0.5, 0.5, 0.5, 0.5)],
+        np.zeros((0, 4)),
+        (1.0, 0.0, 0.0, 0.0)
+    ]
+    expect_type_errors = [
+        "test",
+        [("1", 0, 0, 0)],
+        [(1, 0, 0, 0), (1, 0, 0)]
+    ]
+    expect_value_errors = [
+        (1, 0, 0),
+        np.ones((2, 3)),
+        np.ones((2, 2, 4)),
+        [(float("nan"), 0, 0, 0)]
+    ]
+    for param in valid_params:
+        result = validation.check_quaternion_array(param)
+        assert isinstance(result, np.ndarray) and result.dtype == np.float64
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_quaternion_array(param)
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_quaternion_array(param)
+
+def test_check_point_array():
+    """Test the check_point_array function of the validation module.
+    """
+    valid_params = [
+        [(1, 2), (3, 4)],
+        [(1, 2, 3)],
+        np.zeros((0, 3))
+    ]
+    expect_type_errors = [
+        "test",
+        [("1", 2)],
+        [(1, 2), (3,)]
+    ]
+    expect_value_errors = [
+        (1, 2, 3),
+        np.ones((2, 4)),
+        [(float("nan"), 2)]
+    ]
+    for param in valid_params:
+        result = validation.check_point_array(param)
+        assert isinstance(result, np.ndarray) and result.dtype == np.float64
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_point_array(param)
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_point_array(param)
+    validation.check_point_array([(1, 2, 3)], 3)
+    with pytest.raises(ValueError):
+        validation.check_point_array([(1, 2)], 3)
+    # the TypeError of ragged input keeps the ValueError of numpy as cause
+    with pytest.raises(TypeError) as exc_info:
+        validation.check_point_array([(1, 2), (3,)])
+    assert isinstance(exc_info.value.__cause__, ValueError)
+
+def test_check_parameter_array():
+    """Test the check_parameter_array function of the validation module.
+    """
+    valid_params = [
+        2.5,
+        3,
+        [1, 2, 3.5],
+        np.arange(10)
+    ]
+    expect_type_errors = [
+        "test",
+        ["1", 2],
+        None
+    ]
+    expect_value_errors = [
+        float("nan"),
+        [1, float("inf")],
+        np.ones((2, 2))
+    ]
+    for param in valid_params:
+        result = validation.check_parameter_array(param)
+        assert isinstance(result, np.ndarray) and result.dtype == np.float64
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_parameter_array(param)
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_parameter_array(param)
+
+def test_check_weight_array():
+    """Test the check_weight_array function of the validation module.
+    """
+    for param in [[1, 2, 3], (0.0, 0.5), np.ones(10)]:
+        result = validation.check_weight_array(param)
+        assert isinstance(result, np.ndarray) and result.dtype == np.float64
+    for param in ["test", ["1", 2]]:
+        with pytest.raises(TypeError):
+            validation.check_weight_array(param)
+    for param in [[], 3, [[1, 2]], [1, -1], [0, 0], [1, float("inf")]]:
+        with pytest.raises(ValueError):
+            validation.check_weight_array(param)
+
+def test_check_face_array():
+    """Test the check_face_array function of the validation module.
+    """
+    result = validation.check_face_array([(0, 1, 2), (2, 3, 0)], 4)
+    assert result.dtype == np.int64 and result.shape == (2, 3)
+    for param in ["test", [(0.0, 1.0, 2.0)], [(0, 1, None)]]:
+        with pytest.raises(TypeError):
+            validation.check_face_array(param, 4)
+    for param in [[(0, 1)], np.zeros((0, 3), dtype=int), [(0, 1, 4)], [(0, -1, 2)]]:
+        with pytest.raises(ValueError):
+            validation.check_face_array(param, 4)
+    with pytest.raises(TypeError) as exc_info:
+        validation.check_face_array([(0, 1, 2), (2, 3)], 4)
+    assert isinstance(exc_info.value.__cause__, ValueError)
+
+def test_check_output_buffer():
+    """Test the check_output_buffer function of the validation module.
+    """
+    valid_params = [
+        np.empty((4, 3)),
+        np.empty(12),
+        array.array("d", [0.0] * 12),
+        bytearray(96)
+    ]
+    expect_type_errors = [
+        "test",
+        [0.0] * 12,
+        np.empty((4, 3), dtype=np.int64),
+        array.array("f", [0.0] * 12)
+    ]
+    expect_value_errors = [
+        np.empty((3, 4)),
+        np.empty(13),
+        np.empty((4, 3))[::2],
+        bytearray(95),
+        bytes(96),
+        memoryview(array.array("d", [0.0] * 24))[::2]
+    ]
+    read_only = np.empty((4, 3))
+    read_only.flags.writeable = False
+    expect_value_errors.append(read_only)
+    for param in valid_params:
+        result = validation.check_output_buffer(param, 4, 3)
+        assert result.shape == (4, 3) and result.dtype == np.float64
+        result[:] = 1.0
+        assert np.all(np.frombuffer(param) == 1.0)
+    for param in expect_type_errors:
+        with pytest.raises(TypeError):
+            validation.check_output_buffer(param, 4, 3)
+    for param in expect_value_errors:
+        with pytest.raises(ValueError):
+            validation.check_output_buffer(param, 4, 3)
@@ -2,6 +2,7 @@ import sys
 import os
 import math
 import pytest
+import numpy as np
 
 PROJ_PATH = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJ_PATH + '/../')
@@ -153,6 +154,19 @@ def test_calc_perpendicular_vector():
         for elem_actual, elem_expected in zip(actual_perpendicular_vector, param[1]):
             assert math.isclose(elem_actual, elem_expected, abs_tol=0.000001)
 
+def test_orthonormal_basis():
+    """Test the _orthonormal_basis kernel of the vector_math module.
+
+    The basis vectors must be unit vectors perpendicular to each other and to the normal,
+    and their cross product must be the normal.
+    """
+    for normal in [(1, 0, 0), (0, 1, 0), (0, 0, 1), (0.6, 0.0, -0.8), (-2, 3, 6)]:
+        normal = vector_math.normalize_vector(normal)
+        (basis_u, basis_v) = vector_math._orthonormal_basis(normal)
+        basis = np.array([basis_u, basis_v, normal])
+        assert np.allclose(basis @ basis.T, np.eye(3), atol=0.000001)
+        assert np.allclose(np.cross(basis_u, basis_v), normal, atol=0.000001)
+
 def test_get_as_rotation_quaternion():
     """Test the get_as_rotation_quaternion function of the vector_math module.
     """
@@ -326,3 +340,70 @@ def test_multiply_quaternions():
         for elem_actual, elem_expected in zip(actual_quaternion, param[2]):
             print(actual_quaternion)
             assert math.isclose(elem_actual, elem_expected, abs_tol=0.000001)
+
+def test_array_functions():
+    """Test the batched array functions of the vector_math module.
+
+    The results of the array functions must match the results
+    of the corresponding tuple functions for each row.
+    """
+    vecs1 = np.random.uniform(-10.0, 10.0, (50, 3))
+    vecs2 = np.random.uniform(-10.0, 10.0, (50, 3))
+    axes = np.random.uniform(1.0, 2.0, (50, 3))
+    scales = np.random.uniform(-10.0, 10.0, 50)
+    angles = np.random.uniform(-10.0, 10.0, 50)
+    magnitudes = vector_math.calc_magnitude_array(vecs1)
+    dot_products = vector_math.calc_dot_product_array(vecs1, vecs2)
+    cross_products = vector_math.calc_cross_product_array(vecs1, vecs2)
+    normalized_vecs = vector_math.normalize_vector_array(vecs1)
+    scaled_vecs = vector_math.scale_vector_array(vecs1, scales)
+    sum_vecs = vector_math.sum_vectors_array(vecs1, vecs2)
+    rotated_vecs = vector_math.rotate_vector_array(vecs1, axes, angles)
+    for i, (vec1, vec2) in enumerate(zip(map(tuple, vecs1.tolist()), map(tuple, vecs2.tolist()))):
+        assert math.isclose(magnitudes[i], vector_math.calc_magnitude(vec1))
+        assert math.isclose(dot_products[i], vector_math.calc_dot_product(vec1, vec2))
+        assert np.allclose(cross_products[i], vector_math.calc_cross_product(vec1, vec2))
+        assert np.allclose(normalized_vecs[i], vector_math.normalize_vector(vec1))
+        assert np.allclose(scaled_vecs[i], vector_math.scale_vector(vec1, scales[i]))
+        assert np.allclose(sum_vecs[i], vector_math.sum_vectors(vec1, vec2))
+        assert np.allclose(rotated_vecs[i],
+                           vector_math.rotate_vector(vec1, tuple(axes[i]), angles[i]))
+
+def test_array_functions_broadcast():
+    """Test the batched array functions to broadcast a single vector against an array.
+    """
+    vecs = np.random.uniform(-10.0, 10.0, (20, 3))
+    offset = (1.0, -2.0, 3.0)
+    assert np.allclose(vector_math.sum_vectors_array(vecs, offset), vecs + offset)
+    assert np.allclose(vector_math.calc_dot_product_array(vecs, (0, 0, 1)), vecs[:, 2])
+    assert np.allclose(vector_math.scale_vector_array(vecs, 2), 2.0 * vecs)
+    rotated_vecs = vector_math.rotate_vector_array(vecs, (0, 0, 2), math.pi)
+    assert np.allclose(rotated_vecs, vecs * (-1.0, -1.0, 1.0))
+    assert vector_math.calc_magnitude_array((3, 4, 0)) == 5.0
+
+def test_array_functions_exc():
+    """Test the batched array functions to raise the expected exceptions.
+    """
+    vecs = np.ones((5, 3))
+    expect_type_errors = [
+        lambda: vector_math.calc_magnitude_array("test"),
+        lambda: vector_math.calc_dot_product_array(vecs, [["1", "2", "3"]]),
+        lambda: vector_math.sum_vectors_array([(1, 2, 3), (1, 2)], vecs),
+        lambda: vector_math.scale_vector_array(vecs, "2"),
+        lambda: vector_math.rotate_vector_array(vecs, (1, 0, 0), "test")
+    ]
+    expect_value_errors = [
+        lambda: vector_math.calc_magnitude_array(np.ones((5, 2))),
+        lambda: vector_math.calc_cross_product_array(vecs, np.ones((4, 3))),
+        lambda: vector_math.normalize_vector_array([(1, 2, 3), (0, 0, 0)]),
+        lambda: vector_math.sum_vectors_array(vecs, (1, float("nan"), 3)),
+        lambda: vector_math.scale_vector_array(vecs, np.ones((5, 2))),
+        lambda: vector_math.rotate_vector_array(vecs, (0.5, 0, 0), 1.0),
+        lambda: vector_math.rotate_vector_array(vecs, (1, 0, 0), float("inf"))
+    ]
+    for call in expect_type_errors:
+        with pytest.raises(TypeError):
+            call()
+    for call in expect_value_errors:
+        with pytest.raises(ValueError):
+            call()